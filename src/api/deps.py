@@ -16,10 +16,12 @@ _env_path = Path(__file__).parent.parent / ".env"
 load_dotenv(_env_path)
 
 from fastapi import Request, Depends, HTTPException
-from core.rag import RAGChain, Retriever
-from core.llm import LLMFactory
+from core.rag import RAGChain, Retriever, QueryCache
+from core.llm import LLMFactory, with_llm_retry
 from core.embedding import EmbedderFactory
 from core.sync.incremental_syncer import IncrementalSyncer, create_syncer
+from core.project.refresher import ProjectRefresher
+from core.project.watcher import ProjectWatcher
 from db.chroma_store import ChromaStore, derive_collection_name
 from config.models import (
     OpenAILLMConfig,
@@ -32,6 +34,15 @@ from sqlmodel import Session
 from db.engine import engine
 from core.domain.settings import Settings
 
+# 근사 중복 쿼리로 간주할 쿼리 임베딩 코사인 유사도 (설정 시에만 근사 일치 사용)
+QUERY_CACHE_SIMILARITY = (
+    float(os.environ["QUERY_CACHE_SIMILARITY"])
+    if os.getenv("QUERY_CACHE_SIMILARITY")
+    else None
+)
+# 검색 결과 캐시 유효 시간 (초)
+QUERY_CACHE_TTL = float(os.getenv("QUERY_CACHE_TTL", "300"))
+
 
 # ============================================================================
 # App State
@@ -45,6 +56,7 @@ class AppState:
     chroma_store: ChromaStore
     rag_chain: RAGChain
     syncer: Optional[IncrementalSyncer]
+    project_refresher: Optional[ProjectRefresher] = None
 
 
 def init_app_state(
@@ -120,9 +132,16 @@ def init_app_state(
         model_name=os.getenv("LLM_MODEL", "llama3"),
         base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
     )
-    llm = LLMFactory.create(llm_config)
-
-    retriever = Retriever(chroma_store)
+    llm = with_llm_retry(LLMFactory.create(llm_config))
+
+    # 같은 컬렉션의 ChromaStore 인스턴스는 버전을 공유하므로 동기화 시 캐시가 무효화됨
+    retriever = Retriever(
+        chroma_store,
+        cache=QueryCache(
+            similarity_threshold=QUERY_CACHE_SIMILARITY,
+            ttl=QUERY_CACHE_TTL,
+        ),
+    )
     rag_chain = RAGChain(retriever=retriever, llm=llm)
 
     obsidian_path = os.getenv("VAULT_PATH", os.getenv("OBSIDIAN_PATH", "./docs"))
@@ -141,6 +160,27 @@ def init_app_state(
     )
 
 
+def start_project_refresher(vault_path: Optional[str]) -> Optional[ProjectRefresher]:
+    """
+    프로젝트 변경 감시 + dirty 프로젝트 재스캔 시작.
+
+    watchfiles가 설치되어 있지 않거나 vault 경로가 없으면 None을 반환합니다.
+
+    Args:
+        vault_path: Obsidian Vault 경로
+
+    Returns:
+        실행 중인 ProjectRefresher (사용 불가 시 None)
+    """
+    if not vault_path or not Path(vault_path).is_dir():
+        return None
+    if not ProjectWatcher.is_available():
+        return None
+    refresher = ProjectRefresher(engine, Path(vault_path))
+    refresher.start()
+    return refresher
+
+
 # ============================================================================
 # Dependency Functions
 # ============================================================================
@@ -199,7 +239,7 @@ def _create_llm_from_settings(settings: Settings):
             api_key=settings.llm_api_key,
         )
 
-    return LLMFactory.create(config)
+    return with_llm_retry(LLMFactory.create(config))
 
 
 def get_app_state(request: Request) -> AppState:
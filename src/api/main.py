@@ -11,7 +11,7 @@ from typing import AsyncGenerator
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from .deps import init_app_state
+from .deps import init_app_state, start_project_refresher
 
 
 # ============================================================================
@@ -29,9 +29,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         - Embedder 로드
         - LLM 클라이언트 준비
         - RAGChain 구성
+        - LLM_PREWARM_URL이 설정되어 있으면 해당 API origin에 미리 연결
+        - 프로젝트 폴더 감시 시작 (watchfiles 설치 시)
 
     Shutdown:
-        - 리소스 정리
+        - 프로젝트 폴더 감시 중지
     """
     # Startup
     engine_module = import_module("db.engine")
@@ -40,11 +42,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Auto-configure vault_path from env var (Docker support)
     import os
+    from sqlmodel import Session as DBSession
+    from core.domain.settings import Settings
+    engine = engine_module.engine
     vault_path_env = os.getenv("VAULT_PATH")
     if vault_path_env:
-        from sqlmodel import Session as DBSession
-        from core.domain.settings import Settings
-        engine = engine_module.engine
         with DBSession(engine) as session:
             settings = session.get(Settings, 1)
             if not settings:
@@ -56,9 +58,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             session.commit()
         print(f"[init] vault_path auto-configured: {vault_path_env}")
 
+    # 프로젝트 폴더 변경 감시 (변경된 프로젝트만 주기적으로 재스캔)
+    with DBSession(engine) as session:
+        settings = session.get(Settings, 1)
+        vault_path = settings.vault_path if settings else None
+    app.state.deps.project_refresher = start_project_refresher(vault_path)
+
+    # 첫 LLM 호출의 TCP/TLS 핸드셰이크를 앱 시작 시점으로 옮김 (opt-in)
+    prewarm_url = os.getenv("LLM_PREWARM_URL")
+    if prewarm_url:
+        from core.llm.http_client import prewarm_connection
+        prewarm_connection(prewarm_url)
+
     yield
 
-    # Shutdown (필요시 정리 로직)
+    # Shutdown
+    if app.state.deps.project_refresher is not None:
+        app.state.deps.project_refresher.stop()
     app.state.deps = None
 
 
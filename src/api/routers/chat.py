@@ -13,7 +13,7 @@ from fastapi.responses import StreamingResponse
 from api.deps import get_rag_chain, get_session
 from core.domain.chat import Session, Message, Topic
 from core.rag import RAGChain
-from core.llm import LLMFactory
+from core.llm import LLMFactory, with_llm_retry
 from config.models import OpenAILLMConfig, GeminiLLMConfig, OllamaLLMConfig
 from sqlmodel import Session as DBSession
 from dtypes.api import (
@@ -141,7 +141,7 @@ def _get_dynamic_chain(
         else:
             return default_chain
 
-        llm = LLMFactory.create(config)
+        llm = with_llm_retry(LLMFactory.create(config))
         return RAGChain(retriever=default_chain._retriever, llm=llm)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
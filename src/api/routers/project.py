@@ -1,3 +1,4 @@
+import time
 from pathlib import Path
 from typing import List
 
@@ -53,8 +54,9 @@ def list_projects(
     projects = session.exec(query).all()
     
     results = []
+    now_ts = time.time()
     for p in projects:
-        is_stale, days_inactive = ProjectStatus.calculate_staleness(p)
+        is_stale, days_inactive = ProjectStatus.calculate_staleness(p, now_ts)
         
         if stale_only and not is_stale:
             continue
@@ -15,10 +15,6 @@ from .sentence_transformer_embedder import SentenceTransformerEmbedder
 from .multilingual_e5_embedder import MultilingualE5Embedder
 
 # Config imports
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from config.models import (
     OpenAIEmbeddingConfig,
     LocalEmbeddingConfig,
@@ -9,24 +9,13 @@ E5 모델은 query/passage prefix가 중요:
 - 문서: "passage: {text}"
 """
 
-from types import ModuleType
-from typing import ClassVar, Protocol, cast, override
+from typing import TYPE_CHECKING, ClassVar, override
 
 from .strategy import EmbeddingStrategy, Vector
 
-
-class _ArrayLike(Protocol):
-    def tolist(self) -> list[list[float]]: ...
-
-
-class _SentenceTransformerLike(Protocol):
-    def encode(self, texts: list[str], *, convert_to_numpy: bool) -> _ArrayLike: ...
-
-    def get_sentence_embedding_dimension(self) -> int: ...
-
-
-class _SentenceTransformerCtor(Protocol):
-    def __call__(self, model_name: str) -> _SentenceTransformerLike: ...
+if TYPE_CHECKING:
+    # torch를 끌어오는 무거운 import라 실제 모델 로드 시점(_load_model)까지 미룸
+    from sentence_transformers import SentenceTransformer
 
 
 class MultilingualE5Embedder(EmbeddingStrategy):
@@ -51,6 +40,9 @@ class MultilingualE5Embedder(EmbeddingStrategy):
 
     DEFAULT_MODEL = "intfloat/multilingual-e5-large-instruct"
 
+    # encode에서 L2 정규화 (ChromaStore가 컬렉션 메타데이터와 비교해 재인덱싱 판단)
+    normalizes_embeddings: ClassVar[bool] = True
+
     MODEL_DIMENSIONS: ClassVar[dict[str, int]] = {
         "intfloat/multilingual-e5-large-instruct": 1024,
         "intfloat/multilingual-e5-large": 1024,
@@ -58,13 +50,19 @@ class MultilingualE5Embedder(EmbeddingStrategy):
         "intfloat/multilingual-e5-small": 384,
     }
 
-    def __init__(self, model_name: str = DEFAULT_MODEL):
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL,
+        batch_size: int = 32,
+    ):
         """
         Args:
             model_name: HuggingFace 모델 ID (예: "intfloat/multilingual-e5-large-instruct")
+            batch_size: encode 배치 크기
         """
         self._model_name: str = model_name
-        self._model: _SentenceTransformerLike | None = None
+        self._batch_size: int = batch_size
+        self._model: "SentenceTransformer | None" = None
         self._dimension: int | None = None
 
     def _load_model(self) -> None:
@@ -72,17 +70,12 @@ class MultilingualE5Embedder(EmbeddingStrategy):
         if self._model is not None:
             return
         try:
-            import importlib
-
-            module: ModuleType = importlib.import_module("sentence_transformers")
-        except ModuleNotFoundError as exc:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as exc:
             raise ImportError(
                 "sentence-transformers 패키지가 필요합니다. 설치: pip install sentence-transformers"
             ) from exc
-        sentence_transformer = cast(
-            _SentenceTransformerCtor, module.SentenceTransformer
-        )
-        model = sentence_transformer(self._model_name)
+        model = SentenceTransformer(self._model_name)
         self._model = model
 
         try:
@@ -117,7 +110,12 @@ class MultilingualE5Embedder(EmbeddingStrategy):
         assert self._model is not None
 
         prefixed_texts = self._add_prefix(texts, is_query)
-        embeddings = self._model.encode(prefixed_texts, convert_to_numpy=True)
+        embeddings = self._model.encode(
+            prefixed_texts,
+            batch_size=self._batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
         return embeddings.tolist()
 
     def embed_query(self, query: str) -> Vector:
@@ -5,6 +5,7 @@ OpenAI text-embedding-3-small/large 모델을 사용한 임베딩 구현.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 from dotenv import load_dotenv
@@ -18,6 +19,11 @@ from pathlib import Path
 _env_path = Path(__file__).parent.parent.parent / ".env"
 load_dotenv(_env_path)
 
+# 요청당 입력 수 (API 상한 2048보다 작게 두어 요청 크기/토큰 한도 여유 확보)
+DEFAULT_BATCH_SIZE = 256
+# 배치를 동시에 보낼 최대 요청 수 (rate limit 고려)
+DEFAULT_MAX_CONCURRENCY = 4
+
 
 # ============================================================================
 # OpenAI Embedder
@@ -44,14 +50,20 @@ class OpenAIEmbedder:
         self,
         model_name: str = "text-embedding-3-small",
         api_key: Optional[str] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
         """
         Args:
             model_name: OpenAI 임베딩 모델 이름
             api_key: OpenAI API 키 (없으면 환경변수에서 로드)
+            batch_size: 요청 하나에 담을 최대 텍스트 수
+            max_concurrency: 여러 배치를 동시에 요청할 최대 스레드 수
         """
         self.model_name = model_name
         self._api_key = api_key
+        self._batch_size = max(1, batch_size)
+        self._max_concurrency = max(1, max_concurrency)
 
         if not self._api_key:
             raise ValueError(
@@ -66,6 +78,9 @@ class OpenAIEmbedder:
         """
         OpenAI API를 사용하여 텍스트 임베딩.
 
+        batch_size보다 많으면 배치로 나눠 최대 max_concurrency개 요청을 동시에 보냅니다
+        (네트워크 지연이 대부분이므로 스레드로 겹침). 결과 순서는 입력 순서와 같습니다.
+
         Args:
             texts: 임베딩할 텍스트 리스트
 
@@ -75,6 +90,19 @@ class OpenAIEmbedder:
         if not texts:
             return []
 
+        size = self._batch_size
+        if len(texts) <= size:
+            return self._embed_batch(texts)
+
+        batches = [texts[i:i + size] for i in range(0, len(texts), size)]
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_concurrency, len(batches))
+        ) as executor:
+            results = executor.map(self._embed_batch, batches)
+            return [vector for batch in results for vector in batch]
+
+    def _embed_batch(self, texts: List[str]) -> List[Vector]:
+        """단일 embeddings.create 요청"""
         response = self._client.embeddings.create(
             model=self.model_name,
             input=texts,
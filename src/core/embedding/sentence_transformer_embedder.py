@@ -5,24 +5,13 @@ HuggingFace sentence-transformers 라이브러리를 사용한 EmbeddingStrategy
 로컬에서 실행되며, 다양한 사전학습 모델 지원.
 """
 
-from types import ModuleType
-from typing import ClassVar, Protocol, cast, override
+from typing import TYPE_CHECKING, ClassVar, override
 
 from .strategy import EmbeddingStrategy, Vector
 
-
-class _ArrayLike(Protocol):
-    def tolist(self) -> list[list[float]]: ...
-
-
-class _SentenceTransformerLike(Protocol):
-    def encode(self, texts: list[str], *, convert_to_numpy: bool) -> _ArrayLike: ...
-
-    def get_sentence_embedding_dimension(self) -> int: ...
-
-
-class _SentenceTransformerCtor(Protocol):
-    def __call__(self, model_name: str) -> _SentenceTransformerLike: ...
+if TYPE_CHECKING:
+    # torch를 끌어오는 무거운 import라 실제 모델 로드 시점(_load_model)까지 미룸
+    from sentence_transformers import SentenceTransformer
 
 
 class SentenceTransformerEmbedder(EmbeddingStrategy):
@@ -38,18 +27,27 @@ class SentenceTransformerEmbedder(EmbeddingStrategy):
         vectors = embedder.embed(["Hello", "World"])
     """
 
+    # encode에서 L2 정규화 (ChromaStore가 컬렉션 메타데이터와 비교해 재인덱싱 판단)
+    normalizes_embeddings: ClassVar[bool] = True
+
     MODEL_DIMENSIONS: ClassVar[dict[str, int]] = {
         "BAAI/bge-m3": 1024,
         "dragonkue/BGE-m3-ko": 1024,
     }
 
-    def __init__(self, model_name: str = "BAAI/bge-m3"):
+    def __init__(
+        self,
+        model_name: str = "BAAI/bge-m3",
+        batch_size: int = 32,
+    ):
         """
         Args:
             model_name: HuggingFace 모델 ID (예: "BAAI/bge-m3")
+            batch_size: encode 배치 크기
         """
         self._model_name: str = model_name
-        self._model: _SentenceTransformerLike | None = None
+        self._batch_size: int = batch_size
+        self._model: "SentenceTransformer | None" = None
         self._dimension: int | None = None
 
     def _load_model(self) -> None:
@@ -57,17 +55,12 @@ class SentenceTransformerEmbedder(EmbeddingStrategy):
         if self._model is not None:
             return
         try:
-            import importlib
-
-            module: ModuleType = importlib.import_module("sentence_transformers")
-        except ModuleNotFoundError as exc:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as exc:
             raise ImportError(
                 "sentence-transformers 패키지가 필요합니다. 설치: pip install sentence-transformers"
             ) from exc
-        sentence_transformer = cast(
-            _SentenceTransformerCtor, module.SentenceTransformer
-        )
-        model = sentence_transformer(self._model_name)
+        model = SentenceTransformer(self._model_name)
         self._model = model
 
         try:
@@ -91,7 +84,12 @@ class SentenceTransformerEmbedder(EmbeddingStrategy):
 
         self._load_model()
         assert self._model is not None
-        embeddings = self._model.encode(texts, convert_to_numpy=True)
+        embeddings = self._model.encode(
+            texts,
+            batch_size=self._batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
         return embeddings.tolist()
 
     def embed_query(self, query: str) -> Vector:
@@ -1,19 +1,37 @@
 # LLM Module
 """LLM 전략 및 구현체"""
 
-from .strategy import LLMStrategy, LLMResponse, FakeLLM, Message
+from .strategy import (
+    LLMStrategy,
+    AsyncLLMStrategy,
+    LLMResponse,
+    FakeLLM,
+    Message,
+    Usage,
+)
+from .response_cache import ResponseCache
 from .openai_llm import OpenAILLM
+from .async_openai_llm import AsyncOpenAILLM
 from .gemini_llm import GeminiLLM
 from .ollama_llm import OllamaLLM
 from .factory import LLMFactory
+from .retry import CircuitBreaker, CircuitOpenError, RetryingLLM, with_llm_retry
 
 __all__ = [
     "LLMStrategy",
+    "AsyncLLMStrategy",
     "LLMResponse",
     "FakeLLM",
     "Message",
+    "Usage",
+    "ResponseCache",
     "OpenAILLM",
+    "AsyncOpenAILLM",
     "GeminiLLM",
     "OllamaLLM",
     "LLMFactory",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "RetryingLLM",
+    "with_llm_retry",
 ]
@@ -0,0 +1,160 @@
+"""
+Async OpenAI LLM Implementation
+
+AsyncOpenAI 클라이언트를 사용한 AsyncLLMStrategy 구현체.
+여러 LLM 호출을 asyncio.gather로 동시에 보내 지연 시간을 단일 RTT 수준으로 줄입니다.
+"""
+
+from typing import AsyncIterator, List, Optional
+
+from .http_client import create_async_http_client
+from .openai_llm import (
+    MAX_RETRIES,
+    _TEMPERATURE_FIXED_MODELS,
+    _cached_input_tokens,
+    _dedupe_messages,
+    _normalize_for_caching,
+)
+from .strategy import LLMResponse, Message, Usage
+
+
+# openai SDK는 첫 인스턴스 생성 시 로드
+AsyncOpenAI = None
+
+
+def _async_openai_class():
+    """openai.AsyncOpenAI 클래스 반환 (최초 호출 시 import 후 모듈 변수에 캐시)"""
+    global AsyncOpenAI
+    if AsyncOpenAI is None:
+        from openai import AsyncOpenAI as async_openai_cls
+
+        AsyncOpenAI = async_openai_cls
+    return AsyncOpenAI
+
+
+class AsyncOpenAILLM:
+    """
+    비동기 OpenAI LLM 구현체.
+
+    사용법:
+        llm = AsyncOpenAILLM(api_key="sk-...")
+        responses = await asyncio.gather(*[llm.agenerate(m) for m in batches])
+        await llm.aclose()
+    """
+
+    def __init__(
+        self,
+        model_name: str = "gpt-4o-mini",
+        api_key: Optional[str] = None,
+    ):
+        if not api_key:
+            raise ValueError(
+                "OpenAI API key is required. Please set it in Settings > LLM API Key."
+            )
+        self._model_name = model_name
+        self._client = _async_openai_class()(
+            api_key=api_key,
+            http_client=create_async_http_client(),
+            max_retries=MAX_RETRIES,
+        )
+        self._supports_temperature = model_name not in _TEMPERATURE_FIXED_MODELS
+        self._last_stream_usage: Optional[dict] = None
+
+    def _create_kwargs(
+        self,
+        messages: List[Message],
+        temperature: float,
+        max_tokens: Optional[int],
+    ) -> dict:
+        """chat.completions.create 인자 구성"""
+        kwargs = {
+            "model": self._model_name,
+            "messages": _normalize_for_caching(_dedupe_messages(messages)),
+            "max_completion_tokens": max_tokens,
+        }
+        if self._supports_temperature:
+            kwargs["temperature"] = temperature
+        return kwargs
+
+    async def agenerate(
+        self,
+        messages: List[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> LLMResponse:
+        """
+        OpenAI Chat Completion API 비동기 호출.
+
+        Args:
+            messages: 대화 메시지 리스트
+            temperature: 응답 다양성 (0.0 ~ 2.0)
+            max_tokens: 최대 토큰 수
+
+        Returns:
+            LLMResponse 객체
+        """
+        response = await self._client.chat.completions.create(
+            **self._create_kwargs(messages, temperature, max_tokens)
+        )
+
+        return LLMResponse(
+            content=response.choices[0].message.content or "",
+            model=response.model,
+            usage=Usage(
+                input_tokens=response.usage.prompt_tokens if response.usage else 0,
+                output_tokens=response.usage.completion_tokens
+                if response.usage
+                else 0,
+                cached_input_tokens=_cached_input_tokens(response.usage),
+            ),
+        )
+
+    async def astream_generate(
+        self,
+        messages: List[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """
+        OpenAI 스트리밍 응답 비동기 생성.
+
+        Args:
+            messages: 대화 메시지 리스트
+            temperature: 응답 다양성
+            max_tokens: 최대 토큰 수
+
+        Yields:
+            응답 텍스트 청크
+        """
+        self._last_stream_usage = None
+        response = await self._client.chat.completions.create(
+            **self._create_kwargs(messages, temperature, max_tokens),
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+
+        async for chunk in response:
+            usage = chunk.usage
+            if usage:
+                self._last_stream_usage = {
+                    "input_tokens": usage.prompt_tokens or 0,
+                    "output_tokens": usage.completion_tokens or 0,
+                    "cached_input_tokens": _cached_input_tokens(usage),
+                }
+            # usage 전용 마지막 청크는 choices가 비어 있음
+            try:
+                delta = chunk.choices[0].delta.content
+            except (AttributeError, IndexError):
+                continue
+            if delta:
+                yield delta
+
+    async def aclose(self) -> None:
+        """내부 httpx.AsyncClient 종료"""
+        await self._client.close()
+
+    @property
+    def model_name(self) -> str:
+        return self._model_name
@@ -13,9 +13,6 @@ from .gemini_llm import GeminiLLM
 from .ollama_llm import OllamaLLM
 
 # Config imports
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from config.models import (
     OpenAILLMConfig,
     GeminiLLMConfig,
@@ -4,12 +4,30 @@ Gemini LLM Implementation
 Google Gemini API를 사용한 LLMStrategy 구현체.
 """
 
-from typing import Iterator, List, Optional
+from typing import TYPE_CHECKING, Iterator, List, Optional
 
-from google import genai
-from google.genai import types
+from .strategy import LLMResponse, Message, Usage
 
-from .strategy import LLMResponse, Message
+if TYPE_CHECKING:
+    from google import genai
+    from google.genai import types
+
+
+def _load_genai() -> None:
+    """google.genai 로드 (import 비용이 커서 첫 인스턴스 생성 시 로드)"""
+    if "genai" not in globals():
+        from google import genai
+        from google.genai import types
+
+        globals().update(genai=genai, types=types)
+
+
+def __getattr__(name: str):
+    # 모듈 속성 접근(gemini_llm.genai 등) 시에도 지연 로드
+    if name in ("genai", "types"):
+        _load_genai()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class GeminiLLM:
@@ -28,6 +46,7 @@ class GeminiLLM:
             raise ValueError(
                 "Gemini API key is required. Please set it in Settings > LLM API Key."
             )
+        _load_genai()
         self._model_name = model_name
         self._client = genai.Client(api_key=api_key)
         self._last_stream_usage: Optional[dict] = None
@@ -69,14 +88,14 @@ class GeminiLLM:
         return LLMResponse(
             content=response.text or "",
             model=self._model_name,
-            usage={
-                "input_tokens": response.usage_metadata.prompt_token_count
+            usage=Usage(
+                input_tokens=response.usage_metadata.prompt_token_count
                 if response.usage_metadata
                 else 0,
-                "output_tokens": response.usage_metadata.candidates_token_count
+                output_tokens=response.usage_metadata.candidates_token_count
                 if response.usage_metadata
                 else 0,
-            },
+            ),
         )
 
     def _convert_messages(self, messages: List[Message]) -> tuple[list, Optional[str]]:
@@ -0,0 +1,172 @@
+"""
+HTTP Client Pool
+
+OpenAI 호환 SDK 클라이언트(OpenAILLM, OllamaLLM)에 주입할 httpx 클라이언트 관리.
+프로세스 전역에서 커넥션 풀을 공유하여 인스턴스마다 발생하던
+TCP/TLS 핸드셰이크 비용을 제거합니다.
+"""
+
+import atexit
+import threading
+from typing import Optional
+
+import httpx
+
+
+# ============================================================================
+# Defaults
+# ============================================================================
+
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=50,
+    keepalive_expiry=30.0,
+)
+DEFAULT_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+# 연결 단계 실패(ConnectError/ConnectTimeout) 재시도 횟수.
+# 429/5xx 응답 재시도는 OpenAI SDK의 max_retries(지수 백오프)가 담당합니다.
+CONNECT_RETRIES = 3
+
+# 로컬 서버(Ollama)는 첫 토큰까지 오래 걸릴 수 있으므로 read timeout을 넉넉하게
+LOCAL_LIMITS = httpx.Limits(max_keepalive_connections=8)
+LOCAL_TIMEOUT = httpx.Timeout(300.0, connect=5.0)
+
+
+# ============================================================================
+# Shared Client
+# ============================================================================
+
+_shared_client: Optional[httpx.Client] = None
+_local_clients: dict[str, httpx.Client] = {}
+_prewarmed_origins: set[str] = set()
+_shared_lock = threading.Lock()
+
+
+def http2_available() -> bool:
+    """HTTP/2 지원 패키지(h2) 설치 여부"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_shared_http_client() -> httpx.Client:
+    """
+    공유 httpx 클라이언트 반환 (최초 호출 시 생성).
+
+    h2 패키지가 설치되어 있으면 HTTP/2를 활성화하고, 연결 실패 시
+    같은 풀에서 CONNECT_RETRIES회까지 재시도합니다.
+
+    Returns:
+        keep-alive 커넥션 풀을 가진 httpx.Client
+    """
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None or _shared_client.is_closed:
+            transport = httpx.HTTPTransport(
+                retries=CONNECT_RETRIES,
+                http2=http2_available(),
+                limits=DEFAULT_LIMITS,
+            )
+            _shared_client = httpx.Client(
+                transport=transport,
+                timeout=DEFAULT_TIMEOUT,
+            )
+        return _shared_client
+
+
+def prewarm_connection(url: str) -> Optional[threading.Thread]:
+    """
+    공유 클라이언트로 url의 origin에 미리 연결 (백그라운드, origin당 1회).
+
+    인증 없는 HEAD 요청으로 DNS/TCP/TLS 핸드셰이크만 먼저 끝내 두고,
+    이후 첫 API 호출이 keep-alive 풀의 연결을 재사용하도록 합니다.
+    실패는 무시합니다 (첫 호출 시 평소처럼 연결).
+
+    Args:
+        url: 연결할 API URL (예: "https://api.openai.com/v1/")
+
+    Returns:
+        시작된 워밍 스레드 (이미 워밍된 origin이면 None)
+    """
+    origin = httpx.URL(url).copy_with(path="/", query=None, fragment=None)
+    key = str(origin)
+    with _shared_lock:
+        if key in _prewarmed_origins:
+            return None
+        _prewarmed_origins.add(key)
+
+    def _warm() -> None:
+        try:
+            get_shared_http_client().head(origin)
+        except (httpx.HTTPError, RuntimeError):
+            pass
+
+    thread = threading.Thread(target=_warm, name="http-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+def get_local_http_client(base_url: str) -> httpx.Client:
+    """
+    로컬 OpenAI 호환 서버(Ollama)용 httpx 클라이언트 반환 (base_url별 1개).
+
+    keep-alive 커넥션을 유지하여 generate/stream_generate가 같은 소켓을
+    재사용하고, 연결 실패 시 1회 재시도합니다. HTTP/2는 h2가 설치되어 있고
+    서버가 TLS(ALPN)로 협상할 때만 사용됩니다.
+
+    Args:
+        base_url: 서버 URL (예: "http://localhost:11434/v1")
+
+    Returns:
+        base_url 전용 httpx.Client
+    """
+    with _shared_lock:
+        client = _local_clients.get(base_url)
+        if client is None or client.is_closed:
+            transport = httpx.HTTPTransport(
+                retries=1,
+                http2=http2_available(),
+                limits=LOCAL_LIMITS,
+            )
+            client = httpx.Client(
+                transport=transport,
+                timeout=LOCAL_TIMEOUT,
+            )
+            _local_clients[base_url] = client
+        return client
+
+
+def create_async_http_client() -> httpx.AsyncClient:
+    """
+    비동기 httpx 클라이언트 생성.
+
+    AsyncClient의 커넥션 풀은 생성된 이벤트 루프에 묶이므로 전역 공유하지 않고
+    호출 측(AsyncOpenAILLM)이 소유 및 종료합니다.
+
+    Returns:
+        공유 클라이언트와 같은 limits/timeout/재시도 설정의 httpx.AsyncClient
+    """
+    transport = httpx.AsyncHTTPTransport(
+        retries=CONNECT_RETRIES,
+        http2=http2_available(),
+        limits=DEFAULT_LIMITS,
+    )
+    return httpx.AsyncClient(transport=transport, timeout=DEFAULT_TIMEOUT)
+
+
+def close_http_clients() -> None:
+    """공유/로컬 httpx 클라이언트 전체 종료 (프로세스 종료 시 자동 호출)"""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is not None:
+            _shared_client.close()
+            _shared_client = None
+        for client in _local_clients.values():
+            client.close()
+        _local_clients.clear()
+
+
+atexit.register(close_http_clients)
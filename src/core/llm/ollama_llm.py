@@ -7,9 +7,24 @@ OpenAI 호환 API를 활용하여 구현.
 
 from typing import Iterator, List, Optional
 
-from openai import OpenAI
+from .http_client import get_local_http_client
+from .response_cache import ResponseCache, default_response_cache
+from .streaming import DEFAULT_FLUSH_INTERVAL, DEFAULT_MIN_CHUNK_CHARS, batch_chunks
+from .strategy import LLMResponse, Message, Usage
 
-from .strategy import LLMResponse, Message
+
+# openai SDK는 첫 인스턴스 생성 시 로드
+OpenAI = None
+
+
+def _openai_class():
+    """openai.OpenAI 클래스 반환 (최초 호출 시 import 후 모듈 변수에 캐시)"""
+    global OpenAI
+    if OpenAI is None:
+        from openai import OpenAI as openai_cls
+
+        OpenAI = openai_cls
+    return OpenAI
 
 
 class OllamaLLM:
@@ -20,26 +35,41 @@ class OllamaLLM:
     OpenAI 호환 API를 사용하므로 추가 의존성 없이 구현.
     """
 
+    # 429/5xx/타임아웃 재시도는 OpenAI SDK(max_retries)가 수행 (retry.with_llm_retry 참고)
+    handles_retries = True
+
     def __init__(
         self,
         model_name: str = "llama3.2",
         base_url: str = "http://localhost:11434/v1",
+        response_cache: Optional[ResponseCache] = None,
+        min_chunk_chars: int = DEFAULT_MIN_CHUNK_CHARS,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
     ):
         """
         Args:
             model_name: 사용할 Ollama 모델 이름
             base_url: Ollama 서버 URL (OpenAI 호환 엔드포인트)
+            response_cache: temperature=0 응답 캐시 (None이면 전역 기본 캐시)
+            min_chunk_chars: 스트리밍 시 묶어서 반환할 최소 문자 수
+            flush_interval: 스트리밍 버퍼 최대 대기 시간 (초)
         """
         if not base_url.endswith("/v1"):
             base_url = f"{base_url.rstrip('/')}/v1"
 
         self._model_name = model_name
         self._base_url = base_url
-        self._client = OpenAI(
+        self._client = _openai_class()(
             base_url=base_url,
             api_key="ollama",  # 필수이지만 Ollama에서 무시됨
+            http_client=get_local_http_client(base_url),
         )
         self._last_stream_usage: Optional[dict] = None
+        self._response_cache = (
+            response_cache if response_cache is not None else default_response_cache
+        )
+        self._min_chunk_chars = min_chunk_chars
+        self._flush_interval = flush_interval
 
     def generate(
         self,
@@ -59,6 +89,16 @@ class OllamaLLM:
         Returns:
             LLMResponse 객체
         """
+        cache_key = None
+        if temperature == 0:
+            # 서버마다 같은 이름의 다른 모델이 있을 수 있으므로 base_url 포함
+            cache_key = ResponseCache.make_key(
+                f"{self._base_url}#{self._model_name}", messages, max_tokens
+            )
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         response = self._client.chat.completions.create(
             model=self._model_name,
             messages=messages,
@@ -66,16 +106,23 @@ class OllamaLLM:
             max_tokens=max_tokens,
         )
 
-        return LLMResponse(
+        result = LLMResponse(
             content=response.choices[0].message.content or "",
             model=response.model,
-            usage={
-                "input_tokens": response.usage.prompt_tokens if response.usage else 0,
-                "output_tokens": response.usage.completion_tokens
+            usage=Usage(
+                input_tokens=response.usage.prompt_tokens if response.usage else 0,
+                output_tokens=response.usage.completion_tokens
                 if response.usage
                 else 0,
-            },
+            ),
         )
+        if cache_key is not None:
+            self._response_cache.put(cache_key, result)
+        return result
+
+    @property
+    def response_cache(self) -> ResponseCache:
+        return self._response_cache
 
     def stream_generate(
         self,
@@ -105,14 +152,28 @@ class OllamaLLM:
             stream_options={"include_usage": True},
         )
 
+        yield from batch_chunks(
+            self._iter_deltas(response),
+            min_chunk_chars=self._min_chunk_chars,
+            flush_interval=self._flush_interval,
+        )
+
+    def _iter_deltas(self, response) -> Iterator[str]:
+        """스트림 청크에서 텍스트 delta 추출 (마지막 청크의 usage 기록)"""
         for chunk in response:
-            if chunk.usage:
+            usage = chunk.usage
+            if usage:
                 self._last_stream_usage = {
-                    "input_tokens": chunk.usage.prompt_tokens or 0,
-                    "output_tokens": chunk.usage.completion_tokens or 0,
+                    "input_tokens": usage.prompt_tokens or 0,
+                    "output_tokens": usage.completion_tokens or 0,
                 }
-            if chunk.choices and chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
+            # usage 전용 마지막 청크는 choices가 비어 있음
+            try:
+                delta = chunk.choices[0].delta.content
+            except (AttributeError, IndexError):
+                continue
+            if delta:
+                yield delta
 
     @property
     def model_name(self) -> str:
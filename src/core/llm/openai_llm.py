@@ -4,15 +4,128 @@ OpenAI LLM Implementation
 OpenAI Chat Completion API를 사용한 LLMStrategy 구현체.
 """
 
-from typing import Iterator, List, Optional
+import hashlib
+import json
+import threading
+from typing import TYPE_CHECKING, Iterator, List, Optional
 
-from openai import OpenAI
+from .http_client import get_shared_http_client
+from .response_cache import ResponseCache, default_response_cache
+from .streaming import DEFAULT_FLUSH_INTERVAL, DEFAULT_MIN_CHUNK_CHARS, batch_chunks
+from .strategy import LLMResponse, Message, Usage
 
-from .strategy import LLMResponse, Message
+
+if TYPE_CHECKING:
+    from openai import OpenAI as _OpenAIClient
 
 
 _TEMPERATURE_FIXED_MODELS = frozenset({"gpt-5-mini", "gpt-5-nano"})
 
+# openai SDK는 import 비용이 커서(수백 ms) 첫 클라이언트 생성 시 로드
+OpenAI = None
+
+
+def _openai_class():
+    """openai.OpenAI 클래스 반환 (최초 호출 시 import 후 모듈 변수에 캐시)"""
+    global OpenAI
+    if OpenAI is None:
+        from openai import OpenAI as openai_cls
+
+        OpenAI = openai_cls
+    return OpenAI
+
+# 429/5xx/타임아웃 응답 재시도 횟수 (SDK 내장 지수 백오프, Retry-After 준수)
+MAX_RETRIES = 3
+
+# API 키별 OpenAI 클라이언트 풀 (키 원문 대신 해시를 키로 사용)
+_CLIENT_POOL: dict[str, "_OpenAIClient"] = {}
+_CLIENT_POOL_LOCK = threading.Lock()
+
+
+def _get_pooled_client(api_key: str) -> "_OpenAIClient":
+    """API 키에 대응하는 OpenAI 클라이언트 반환 (없으면 생성)"""
+    key = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+    with _CLIENT_POOL_LOCK:
+        client = _CLIENT_POOL.get(key)
+        if client is None:
+            client = _openai_class()(
+                api_key=api_key,
+                http_client=get_shared_http_client(),
+                max_retries=MAX_RETRIES,
+            )
+            _CLIENT_POOL[key] = client
+    return client
+
+
+def _dedupe_messages(messages: List[Message]) -> List[Message]:
+    """
+    연속으로 중복된 메시지(role, content 동일) 제거.
+
+    템플릿과 대화 이력에서 같은 system 메시지가 두 번 들어가는 경우 등
+    불필요한 프롬프트 토큰과 prefix 캐시 미스를 막습니다.
+    중복이 없으면 원본 리스트를 그대로 반환합니다.
+    """
+    deduped: List[Message] = []
+    prev = None
+    for msg in messages:
+        key = (msg.get("role"), msg.get("content"))
+        if key != prev:
+            deduped.append(msg)
+            prev = key
+    return messages if len(deduped) == len(messages) else deduped
+
+
+def _normalize_for_caching(messages: List[Message]) -> List[Message]:
+    """
+    프롬프트 prefix 캐시가 적중하도록 메시지 정규화.
+
+    - 앞쪽의 연속된 system 메시지를 index 0의 단일 메시지로 병합
+    - system 내용의 끝 공백 제거 (공백 차이로 prefix가 달라지는 것 방지)
+
+    정규화가 필요 없으면 원본 리스트를 그대로 반환합니다.
+
+    Args:
+        messages: 대화 메시지 리스트
+
+    Returns:
+        정규화된 메시지 리스트
+    """
+    count = 0
+    for msg in messages:
+        if msg.get("role") != "system" or not isinstance(msg.get("content"), str):
+            break
+        count += 1
+
+    if count == 0:
+        return messages
+
+    system_text = "\n\n".join(m["content"].rstrip() for m in messages[:count])
+    if count == 1 and system_text == messages[0]["content"]:
+        return messages
+
+    return [{"role": "system", "content": system_text}, *messages[count:]]
+
+
+def _cached_input_tokens(usage) -> int:
+    """프롬프트 캐시로 처리된 입력 토큰 수 (prompt_tokens_details.cached_tokens)"""
+    details = getattr(usage, "prompt_tokens_details", None)
+    return getattr(details, "cached_tokens", 0) or 0
+
+
+def _parse_completion(body: dict) -> LLMResponse:
+    """Chat Completion 응답 JSON에서 LLMResponse 생성"""
+    usage = body.get("usage") or {}
+    details = usage.get("prompt_tokens_details") or {}
+    return LLMResponse(
+        content=body["choices"][0]["message"].get("content") or "",
+        model=body["model"],
+        usage=Usage(
+            input_tokens=usage.get("prompt_tokens") or 0,
+            output_tokens=usage.get("completion_tokens") or 0,
+            cached_input_tokens=details.get("cached_tokens") or 0,
+        ),
+    )
+
 
 class OpenAILLM:
     """
@@ -21,19 +134,46 @@ class OpenAILLM:
     GPT 모델을 사용한 텍스트 생성.
     """
 
+    # 429/5xx/타임아웃 재시도는 OpenAI SDK(max_retries)가 수행 (retry.with_llm_retry 참고)
+    handles_retries = True
+
     def __init__(
         self,
         model_name: str = "gpt-4o-mini",
         api_key: Optional[str] = None,
+        response_cache: Optional[ResponseCache] = None,
+        min_chunk_chars: int = DEFAULT_MIN_CHUNK_CHARS,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
     ):
         if not api_key:
             raise ValueError(
                 "OpenAI API key is required. Please set it in Settings > LLM API Key."
             )
         self._model_name = model_name
-        self._client = OpenAI(api_key=api_key)
+        self._client = _get_pooled_client(api_key)
         self._supports_temperature = model_name not in _TEMPERATURE_FIXED_MODELS
         self._last_stream_usage: Optional[dict] = None
+        self._response_cache = (
+            response_cache if response_cache is not None else default_response_cache
+        )
+        self._min_chunk_chars = min_chunk_chars
+        self._flush_interval = flush_interval
+
+    def _create_kwargs(
+        self,
+        messages: List[Message],
+        temperature: float,
+        max_tokens: Optional[int],
+    ) -> dict:
+        """chat.completions.create 인자 구성 (temperature 고정 모델은 temperature 생략)"""
+        kwargs = {
+            "model": self._model_name,
+            "messages": messages,
+            "max_completion_tokens": max_tokens,
+        }
+        if self._supports_temperature:
+            kwargs["temperature"] = temperature
+        return kwargs
 
     def generate(
         self,
@@ -53,30 +193,29 @@ class OpenAILLM:
         Returns:
             LLMResponse 객체
         """
-        if self._supports_temperature:
-            response = self._client.chat.completions.create(
-                model=self._model_name,
-                messages=messages,
-                temperature=temperature,
-                max_completion_tokens=max_tokens,
-            )
-        else:
-            response = self._client.chat.completions.create(
-                model=self._model_name,
-                messages=messages,
-                max_completion_tokens=max_tokens,
-            )
+        messages = _normalize_for_caching(_dedupe_messages(messages))
 
-        return LLMResponse(
-            content=response.choices[0].message.content or "",
-            model=response.model,
-            usage={
-                "input_tokens": response.usage.prompt_tokens if response.usage else 0,
-                "output_tokens": response.usage.completion_tokens
-                if response.usage
-                else 0,
-            },
+        # temperature 고정 모델은 0을 지정해도 결정적이지 않으므로 캐시하지 않음
+        cache_key = None
+        if temperature == 0 and self._supports_temperature:
+            cache_key = ResponseCache.make_key(self._model_name, messages, max_tokens)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # 필요한 필드만 읽으면 되므로 SDK의 Pydantic 모델 생성을 건너뛰고
+        # 원본 JSON을 직접 파싱 (HTTP 에러는 SDK가 그대로 예외로 변환)
+        raw = self._client.chat.completions.with_raw_response.create(
+            **self._create_kwargs(messages, temperature, max_tokens)
         )
+        result = _parse_completion(json.loads(raw.content))
+        if cache_key is not None:
+            self._response_cache.put(cache_key, result)
+        return result
+
+    @property
+    def response_cache(self) -> ResponseCache:
+        return self._response_cache
 
     def stream_generate(
         self,
@@ -96,35 +235,37 @@ class OpenAILLM:
         Yields:
             응답 텍스트 청크
         """
+        messages = _normalize_for_caching(_dedupe_messages(messages))
         self._last_stream_usage = None
-        stream_options = {"include_usage": True}
+        response = self._client.chat.completions.create(
+            **self._create_kwargs(messages, temperature, max_tokens),
+            stream=True,
+            stream_options={"include_usage": True},
+        )
 
-        if self._supports_temperature:
-            response = self._client.chat.completions.create(
-                model=self._model_name,
-                messages=messages,
-                temperature=temperature,
-                max_completion_tokens=max_tokens,
-                stream=True,
-                stream_options=stream_options,
-            )
-        else:
-            response = self._client.chat.completions.create(
-                model=self._model_name,
-                messages=messages,
-                max_completion_tokens=max_tokens,
-                stream=True,
-                stream_options=stream_options,
-            )
+        yield from batch_chunks(
+            self._iter_deltas(response),
+            min_chunk_chars=self._min_chunk_chars,
+            flush_interval=self._flush_interval,
+        )
 
+    def _iter_deltas(self, response) -> Iterator[str]:
+        """스트림 청크에서 텍스트 delta 추출 (마지막 청크의 usage 기록)"""
         for chunk in response:
-            if chunk.usage:
+            usage = chunk.usage
+            if usage:
                 self._last_stream_usage = {
-                    "input_tokens": chunk.usage.prompt_tokens or 0,
-                    "output_tokens": chunk.usage.completion_tokens or 0,
+                    "input_tokens": usage.prompt_tokens or 0,
+                    "output_tokens": usage.completion_tokens or 0,
+                    "cached_input_tokens": _cached_input_tokens(usage),
                 }
-            if chunk.choices and chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
+            # usage 전용 마지막 청크는 choices가 비어 있음
+            try:
+                delta = chunk.choices[0].delta.content
+            except (AttributeError, IndexError):
+                continue
+            if delta:
+                yield delta
 
     @property
     def model_name(self) -> str:
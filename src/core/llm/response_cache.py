@@ -0,0 +1,112 @@
+"""
+LLM Response Cache
+
+temperature=0 (결정적) 호출에 대한 LLMResponse 캐시.
+동일한 (model, messages, max_tokens) 요청은 API 왕복 없이 캐시에서 반환합니다.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import replace
+from typing import List, Optional
+
+from .strategy import LLMResponse, Message
+
+
+class ResponseCache:
+    """
+    LRU 방식의 LLMResponse 캐시 (스레드 안전).
+
+    사용법:
+        cache = ResponseCache(maxsize=1024)
+        key = cache.make_key("gpt-4o-mini", messages, None)
+        cached = cache.get(key)
+        if cached is None:
+            cache.put(key, llm_response)
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Args:
+            maxsize: 최대 캐시 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+        """
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, LLMResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: List[Message],
+        max_tokens: Optional[int],
+    ) -> str:
+        """
+        요청 파라미터로부터 캐시 키(sha256) 생성.
+
+        긴 컨텍스트 전체를 JSON으로 직렬화하지 않고 메시지별로 해시에 바로
+        흘려 넣습니다. 길이 prefix로 메시지 경계를 구분합니다.
+        """
+        digest = hashlib.sha256(f"{model}\0{max_tokens}\0".encode("utf-8"))
+        for msg in messages:
+            content = msg.get("content")
+            if len(msg) > 2 or not isinstance(content, str):
+                # role/content 외 필드나 구조화 content는 JSON으로 직렬화
+                encoded = json.dumps(msg, sort_keys=True, ensure_ascii=False).encode(
+                    "utf-8"
+                )
+                role = ""
+            else:
+                encoded = content.encode("utf-8")
+                role = msg.get("role", "")
+            digest.update(f"{role}\0{len(encoded)}\0".encode("utf-8"))
+            digest.update(encoded)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        """
+        캐시 조회.
+
+        Returns:
+            캐시된 응답의 복사본 (없으면 None)
+        """
+        with self._lock:
+            response = self._entries.get(key)
+            if response is None:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+        return replace(response)
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """응답 저장 (호출 측 변경이 캐시에 반영되지 않도록 복사본 저장)"""
+        response = replace(response)
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """캐시 및 통계 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self.stats = {"hits": 0, "misses": 0}
+
+    @property
+    def cache_hits(self) -> int:
+        return self.stats["hits"]
+
+    @property
+    def cache_misses(self) -> int:
+        return self.stats["misses"]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# 프로세스 전역 기본 캐시 (OpenAILLM, OllamaLLM 공용)
+default_response_cache = ResponseCache()
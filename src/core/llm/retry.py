@@ -0,0 +1,324 @@
+"""
+LLM Retry / Circuit Breaker
+
+LLMStrategy 호출을 감싸 일시적 오류(429, 5xx, 타임아웃, 연결 오류)를
+지수 백오프 + 지터로 재시도하고, 같은 엔드포인트가 연속으로 실패하면
+일정 시간 동안 즉시 실패시키는(circuit breaker) 래퍼.
+
+OpenAI SDK 기반 구현체(OpenAILLM, OllamaLLM)는 SDK가 이미 Retry-After를 준수하는
+지수 백오프 재시도를 수행하므로(handles_retries = True) 래퍼는 재시도하지 않고
+circuit breaker만 적용합니다.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Type
+
+from .strategy import LLMResponse, LLMStrategy, Message
+
+
+# ============================================================================
+# Defaults
+# ============================================================================
+
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BASE_DELAY = 0.5
+DEFAULT_MAX_DELAY = 20.0
+
+# 재시도 대상 HTTP 상태 코드
+_RETRYABLE_STATUS = frozenset({408, 409, 429, 500, 502, 503, 504})
+# 상태 코드가 없는 SDK 연결/타임아웃 예외 (SDK를 import하지 않고 이름으로 판별)
+_RETRYABLE_ERROR_NAMES = frozenset({"APIConnectionError", "APITimeoutError"})
+
+
+class CircuitOpenError(RuntimeError):
+    """circuit breaker가 열려 있어 호출하지 않고 실패"""
+
+
+# ============================================================================
+# Circuit Breaker
+# ============================================================================
+
+
+class CircuitBreaker:
+    """
+    연속 실패 기반 circuit breaker (스레드 안전).
+
+    window 초 안에 failure_threshold번 실패하면 reset_timeout 초 동안 열림(즉시 실패).
+    이후 시험 호출 하나만 허용하며(나머지는 결과가 나올 때까지 즉시 실패),
+    성공하면 닫히고 실패하면 다시 열립니다.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        window: float = 60.0,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures: deque[float] = deque()
+        self._opened_at: Optional[float] = None
+        # 진행 중인 시험 호출 시작 시각 (결과 미보고 시 reset_timeout 후 다른 호출에 양보)
+        self._trial_started_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._opened_at is not None and (
+                self._clock() - self._opened_at < self.reset_timeout
+            )
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (열린 상태에서 reset_timeout이 지나면 시험 호출 1개 허용)"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = self._clock()
+            if now - self._opened_at < self.reset_timeout:
+                return False
+            if (
+                self._trial_started_at is not None
+                and now - self._trial_started_at < self.reset_timeout
+            ):
+                return False
+            self._trial_started_at = now
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures.clear()
+            self._opened_at = None
+            self._trial_started_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            now = self._clock()
+            if self._opened_at is not None:
+                # 시험 호출 실패 → 다시 열림
+                self._opened_at = now
+                self._trial_started_at = None
+                return
+            self._failures.append(now)
+            while self._failures and now - self._failures[0] > self.window:
+                self._failures.popleft()
+            if len(self._failures) >= self.failure_threshold:
+                self._opened_at = now
+                self._failures.clear()
+
+
+# 엔드포인트별 breaker (요청마다 LLM을 새로 만들어도 상태 공유)
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+_BREAKERS_LOCK = threading.Lock()
+
+
+def get_circuit_breaker(key: str) -> CircuitBreaker:
+    """엔드포인트 키에 대응하는 CircuitBreaker 반환 (없으면 생성)"""
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(key)
+        if breaker is None:
+            breaker = _BREAKERS[key] = CircuitBreaker()
+        return breaker
+
+
+def _endpoint_key(llm: LLMStrategy) -> str:
+    base_url = getattr(llm, "base_url", None)
+    return f"{type(llm).__name__}:{base_url or 'default'}"
+
+
+# ============================================================================
+# Error Classification
+# ============================================================================
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    # openai: status_code, google-genai: code
+    for attr in ("status_code", "code"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def is_retryable(exc: BaseException, retry_on: Tuple[Type[BaseException], ...] = ()) -> bool:
+    """일시적 오류 여부 판별"""
+    if isinstance(exc, (TimeoutError, ConnectionError) + tuple(retry_on)):
+        return True
+    if type(exc).__name__ in _RETRYABLE_ERROR_NAMES:
+        return True
+    return _status_code(exc) in _RETRYABLE_STATUS
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """응답의 Retry-After / retry-after-ms 헤더 값(초) 반환 (없으면 None)"""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        value = headers.get("retry-after-ms")
+        if value is not None:
+            return float(value) / 1000.0
+        value = headers.get("retry-after")
+        if value is not None:
+            return float(value)
+    except (TypeError, ValueError):
+        # HTTP-date 형식 등은 무시하고 백오프 사용
+        return None
+    return None
+
+
+# ============================================================================
+# Retrying LLM Wrapper
+# ============================================================================
+
+
+class RetryingLLM:
+    """
+    LLMStrategy 래퍼 (재시도 + circuit breaker).
+
+    사용법:
+        llm = with_llm_retry(LLMFactory.create(config))
+        response = llm.generate(messages)
+    """
+
+    def __init__(
+        self,
+        llm: LLMStrategy,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        retry_on: Tuple[Type[BaseException], ...] = (),
+        breaker: Optional[CircuitBreaker] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            llm: 감쌀 LLM 구현체
+            max_retries: 최대 재시도 횟수 (0이면 circuit breaker만 적용)
+            base_delay: 첫 재시도 기본 대기 시간 (초, 시도마다 2배)
+            max_delay: 최대 대기 시간 (초)
+            retry_on: 추가로 재시도할 예외 타입
+            breaker: circuit breaker (None이면 엔드포인트별 공유 breaker)
+        """
+        self._llm = llm
+        self._max_retries = max_retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._retry_on = tuple(retry_on)
+        self._breaker = breaker if breaker is not None else get_circuit_breaker(
+            _endpoint_key(llm)
+        )
+        self._sleep = sleep
+
+    @property
+    def wrapped(self) -> LLMStrategy:
+        return self._llm
+
+    @property
+    def model_name(self) -> str:
+        return self._llm.model_name
+
+    def __getattr__(self, name: str):
+        # response_cache, _last_stream_usage 등 구현체 고유 속성은 그대로 위임
+        if name == "_llm":
+            raise AttributeError(name)
+        return getattr(self._llm, name)
+
+    def generate(
+        self,
+        messages: List[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> LLMResponse:
+        attempt = 0
+        while True:
+            self._check_breaker()
+            try:
+                response = self._llm.generate(
+                    messages, temperature=temperature, max_tokens=max_tokens
+                )
+            except Exception as exc:
+                attempt = self._handle_failure(exc, attempt)
+                continue
+            self._breaker.record_success()
+            return response
+
+    def stream_generate(
+        self,
+        messages: List[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        # 이미 출력한 청크가 있으면 중복 출력이 되므로 첫 청크 이전 실패만 재시도
+        attempt = 0
+        while True:
+            self._check_breaker()
+            started = False
+            try:
+                for chunk in self._llm.stream_generate(
+                    messages, temperature=temperature, max_tokens=max_tokens
+                ):
+                    started = True
+                    yield chunk
+            except Exception as exc:
+                if started:
+                    if is_retryable(exc, self._retry_on):
+                        self._breaker.record_failure()
+                    raise
+                attempt = self._handle_failure(exc, attempt)
+                continue
+            self._breaker.record_success()
+            return
+
+    def _check_breaker(self) -> None:
+        if not self._breaker.allow():
+            raise CircuitOpenError(
+                f"LLM endpoint temporarily disabled after repeated failures ({self.model_name})"
+            )
+
+    def _handle_failure(self, exc: Exception, attempt: int) -> int:
+        """실패 기록 후 재시도 가능하면 대기하고 다음 attempt 반환, 아니면 예외 전파"""
+        retryable = is_retryable(exc, self._retry_on)
+        if retryable:
+            self._breaker.record_failure()
+        if not retryable or attempt >= self._max_retries:
+            raise exc
+
+        delay = retry_after_seconds(exc)
+        if delay is None:
+            # full jitter: [0, min(max_delay, base * 2^attempt)]
+            delay = random.uniform(0, min(self._max_delay, self._base_delay * (2 ** attempt)))
+        self._sleep(min(delay, self._max_delay))
+        return attempt + 1
+
+
+def with_llm_retry(
+    llm: LLMStrategy,
+    max_retries: Optional[int] = None,
+    **kwargs,
+) -> RetryingLLM:
+    """
+    LLM에 재시도 + circuit breaker 적용.
+
+    Args:
+        llm: LLM 구현체
+        max_retries: 최대 재시도 횟수 (None이면 SDK가 재시도하는 구현체는 0, 그 외 기본값)
+        **kwargs: RetryingLLM 추가 인자
+
+    Returns:
+        RetryingLLM 래퍼 (이미 래핑된 경우 그대로 반환)
+    """
+    if isinstance(llm, RetryingLLM):
+        return llm
+    if max_retries is None:
+        max_retries = 0 if getattr(llm, "handles_retries", False) else DEFAULT_MAX_RETRIES
+    return RetryingLLM(llm, max_retries=max_retries, **kwargs)
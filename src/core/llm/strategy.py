@@ -5,15 +5,28 @@ LLM 호출을 위한 Protocol 및 테스트용 FakeLLM 구현.
 의존성 주입을 통해 테스트 용이성과 LLM 교체 유연성 확보.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Iterator, List, Optional, Protocol
+from typing import (
+    AsyncIterator,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Protocol,
+    TypedDict,
+)
 
 
 # ============================================================================
-# Type Aliases
+# Type Definitions
 # ============================================================================
 
-Message = dict  # {"role": "user"|"assistant"|"system", "content": str}
+class Message(TypedDict):
+    """대화 메시지 (런타임에는 일반 dict)"""
+
+    role: Literal["user", "assistant", "system"]
+    content: str
 
 
 # ============================================================================
@@ -21,13 +34,51 @@ Message = dict  # {"role": "user"|"assistant"|"system", "content": str}
 # ============================================================================
 
 
+_USAGE_FIELDS = ("input_tokens", "output_tokens", "cached_input_tokens")
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Usage(Mapping):
+    """
+    토큰 사용량.
+
+    속성 접근(usage.input_tokens)과 기존 dict 방식 접근(usage["input_tokens"],
+    "input_tokens" in usage, dict(usage))을 모두 지원하는 읽기 전용 객체.
+    """
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_input_tokens: int = 0
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Usage":
+        """dict 형태의 사용량에서 생성 (없는 키는 0)"""
+        return cls(**{name: data.get(name) or 0 for name in _USAGE_FIELDS})
+
+    def __getitem__(self, key: str) -> int:
+        if key not in _USAGE_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_USAGE_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_USAGE_FIELDS)
+
+
 @dataclass
 class LLMResponse:
     """LLM 응답 데이터"""
 
     content: str
     model: str
-    usage: dict  # {"input_tokens": int, "output_tokens": int}
+    usage: Usage
+
+    def __post_init__(self):
+        # 하위 호환: dict로 전달된 사용량을 Usage로 변환
+        if not isinstance(self.usage, Usage):
+            self.usage = Usage.from_dict(self.usage or {})
 
 
 # ============================================================================
@@ -88,6 +139,39 @@ class LLMStrategy(Protocol):
         ...
 
 
+class AsyncLLMStrategy(Protocol):
+    """
+    비동기 LLM 전략 Protocol.
+
+    여러 요청을 asyncio.gather로 동시에 보내야 하는 경우에 사용합니다.
+    """
+
+    async def agenerate(
+        self,
+        messages: List[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> LLMResponse:
+        """메시지 기반 응답 생성 (비동기)"""
+        ...
+
+    def astream_generate(
+        self,
+        messages: List[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """스트리밍 응답 생성 (비동기)"""
+        ...
+
+    @property
+    def model_name(self) -> str:
+        """사용 중인 모델 이름"""
+        ...
+
+
 # ============================================================================
 # Fake LLM (Testing)
 # ============================================================================
@@ -107,6 +191,9 @@ class FakeLLM:
             response: 반환할 고정 응답 문자열
         """
         self._response = response
+        self._stream_chunks: tuple[str, ...] = tuple(
+            word + " " for word in response.split()
+        )
         self._model_name = "fake-llm"
         self._last_stream_usage: Optional[dict] = None
 
@@ -121,7 +208,7 @@ class FakeLLM:
         return LLMResponse(
             content=self._response,
             model=self._model_name,
-            usage={"input_tokens": 10, "output_tokens": 5},
+            usage=Usage(input_tokens=10, output_tokens=5),
         )
 
     def stream_generate(
@@ -133,9 +220,7 @@ class FakeLLM:
     ) -> Iterator[str]:
         """고정된 응답을 청크로 반환"""
         self._last_stream_usage = None
-        words = self._response.split()
-        for word in words:
-            yield word + " "
+        yield from self._stream_chunks
         self._last_stream_usage = {"input_tokens": 10, "output_tokens": 5}
 
     @property
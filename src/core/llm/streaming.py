@@ -0,0 +1,54 @@
+"""
+Streaming Utilities
+
+스트리밍 응답 청크 처리 유틸리티.
+토큰 단위로 잘게 들어오는 delta를 묶어 yield 횟수(및 호출 측 flush)를 줄입니다.
+"""
+
+import time
+from typing import Iterable, Iterator
+
+
+DEFAULT_MIN_CHUNK_CHARS = 64
+DEFAULT_FLUSH_INTERVAL = 0.05  # seconds
+
+
+def batch_chunks(
+    chunks: Iterable[str],
+    *,
+    min_chunk_chars: int = DEFAULT_MIN_CHUNK_CHARS,
+    flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+) -> Iterator[str]:
+    """
+    텍스트 청크를 버퍼링하여 묶어서 반환.
+
+    첫 청크는 첫 토큰 지연(TTFT)을 늘리지 않도록 즉시 반환하고,
+    이후에는 버퍼 길이가 min_chunk_chars 이상이거나 마지막 flush 후
+    flush_interval이 지나면 반환합니다. 스트림 종료 시 남은 버퍼를 반환합니다.
+
+    Args:
+        chunks: 원본 텍스트 청크 이터러블
+        min_chunk_chars: flush 기준 문자 수 (0이면 묶지 않음)
+        flush_interval: flush 기준 시간 간격 (초)
+
+    Yields:
+        묶인 텍스트 청크
+    """
+    buffer: list[str] = []
+    size = 0
+    first = True
+    last_flush = time.monotonic()
+
+    for text in chunks:
+        buffer.append(text)
+        size += len(text)
+        now = time.monotonic()
+        if first or size >= min_chunk_chars or now - last_flush >= flush_interval:
+            yield "".join(buffer)
+            buffer.clear()
+            size = 0
+            first = False
+            last_flush = now
+
+    if buffer:
+        yield "".join(buffer)
@@ -0,0 +1,98 @@
+"""
+Project Refresher Module
+
+ProjectWatcher를 실행하고, 변경 이벤트가 있었던 프로젝트만 주기적으로
+재스캔하여 DB의 수정 시각/파일 수를 최신으로 유지하는 백그라운드 작업.
+앱 Lifespan에서 시작/중지합니다 (watchfiles 미설치 시 사용하지 않음).
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from core.project.scanner import ProjectScanner
+from core.project.watcher import ProjectWatcher
+
+logger = logging.getLogger(__name__)
+
+# dirty 프로젝트 재스캔 간격 (초)
+DEFAULT_REFRESH_INTERVAL = 30.0
+
+
+class ProjectRefresher:
+    """
+    watcher 기반 프로젝트 메타데이터 갱신 스레드.
+
+    사용법:
+        refresher = ProjectRefresher(engine, vault_root)
+        refresher.start()
+        ...
+        refresher.stop()
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        vault_root: Path,
+        interval: float = DEFAULT_REFRESH_INTERVAL,
+        watcher: Optional[ProjectWatcher] = None,
+    ):
+        """
+        Args:
+            engine: DB 엔진 (스캔마다 새 Session 생성)
+            vault_root: Obsidian Vault 루트 경로
+            interval: 재스캔 간격 (초)
+            watcher: 파일 변경 감시자 (None이면 vault_root로 생성)
+        """
+        self.engine = engine
+        self.interval = interval
+        self.watcher = watcher if watcher is not None else ProjectWatcher(vault_root)
+        # 서브트리/stat 캐시와 watch generation을 유지하도록 scanner는 한 번만 생성
+        self._scanner = ProjectScanner(None, vault_root, watcher=self.watcher)
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """감시 시작 및 재스캔 스레드 실행"""
+        self.watcher.start()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="project-refresher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """재스캔 스레드와 감시 중지"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.watcher.stop()
+
+    def refresh(self) -> int:
+        """
+        변경된 프로젝트를 한 번 재스캔.
+
+        Returns:
+            업데이트된 프로젝트 수
+        """
+        with Session(self.engine) as session:
+            self._scanner.session = session
+            try:
+                return self._scanner.scan_all()
+            finally:
+                self._scanner.session = None
+
+    def _run(self) -> None:
+        # 첫 실행에서 등록된 모든 프로젝트를 sync_projects로 dirty 표시 후 스캔
+        while True:
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("프로젝트 재스캔 실패")
+            if self._stop_event.wait(self.interval):
+                return
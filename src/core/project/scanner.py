@@ -5,6 +5,8 @@ Project Scanner Module
 메타데이터(last_modified_at)를 동기화합니다.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 from datetime import datetime, timezone
@@ -12,8 +14,98 @@ from datetime import datetime, timezone
 from sqlmodel import Session, select
 
 from core.domain.project import Project
-from core.sync.folder_scanner import FolderScanner
-from core.sync.file_tracker import FileTracker
+from core.sync.folder_scanner import DEFAULT_IGNORE_PATTERNS
+from core.project.stat_cache import StatCache, SubtreeCache, default_stat_cache
+from core.project.watcher import ProjectWatcher
+
+# scan_all 병렬 스캔 최대 스레드 수 (동시에 열린 디렉터리 fd 수도 이 값으로 제한됨)
+MAX_SCAN_WORKERS = 32
+
+
+def _scan_mtimes(
+    path: Path,
+    stat_cache: Optional[StatCache] = None,
+    subtree_cache: Optional[SubtreeCache] = None,
+    dir_mtime_ns: Optional[int] = None,
+) -> tuple[float, int]:
+    """
+    폴더를 재귀 탐색하여 .md 파일의 최신 mtime과 파일 수 계산.
+
+    os.scandir의 DirEntry를 사용하므로 파일 종류 판별에 추가 syscall이 없고,
+    mtime도 탐색과 같은 패스에서 읽습니다. FolderScanner와 동일하게
+    숨김 폴더와 DEFAULT_IGNORE_PATTERNS 폴더는 제외합니다.
+
+    Args:
+        path: 스캔할 폴더 경로
+        stat_cache: mtime 캐시 (None이면 매번 stat)
+        subtree_cache: 디렉터리별 결과 캐시 (mtime이 같은 하위 트리는 재탐색 생략)
+        dir_mtime_ns: path의 st_mtime_ns (subtree_cache 사용 시, None이면 직접 stat)
+
+    Returns:
+        (max_mtime, file_count) 튜플 (파일이 없으면 (0.0, 0))
+    """
+    key = str(path)
+    if subtree_cache is not None:
+        if dir_mtime_ns is None:
+            try:
+                dir_mtime_ns = os.stat(key).st_mtime_ns
+            except OSError:
+                return 0.0, 0
+        cached = subtree_cache.get(key, dir_mtime_ns)
+        if cached is not None:
+            return cached
+
+    max_mtime = 0.0
+    count = 0
+    subdirs = []
+
+    # 하위 폴더는 scandir을 닫은 뒤 탐색 (동시에 열린 fd를 1개로 유지)
+    try:
+        with os.scandir(key) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith(".md"):
+                    if not entry.is_file(follow_symlinks=False):
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry)
+                        continue
+                    count += 1
+                    try:
+                        if stat_cache is None:
+                            mtime = entry.stat(follow_symlinks=False).st_mtime
+                        else:
+                            mtime = stat_cache.get_mtime(entry.path, entry.stat)
+                    except OSError:
+                        continue
+                    if mtime > max_mtime:
+                        max_mtime = mtime
+                elif (
+                    not name.startswith(".")
+                    and name not in DEFAULT_IGNORE_PATTERNS
+                    and entry.is_dir(follow_symlinks=False)
+                ):
+                    subdirs.append(entry)
+    except OSError:
+        return max_mtime, count
+
+    for entry in subdirs:
+        sub_mtime_ns = None
+        if subtree_cache is not None:
+            try:
+                sub_mtime_ns = entry.stat(follow_symlinks=False).st_mtime_ns
+            except OSError:
+                continue
+        sub_max, sub_count = _scan_mtimes(
+            entry.path, stat_cache, subtree_cache, sub_mtime_ns
+        )
+        count += sub_count
+        if sub_max > max_mtime:
+            max_mtime = sub_max
+
+    if subtree_cache is not None:
+        subtree_cache.put(key, dir_mtime_ns, max_mtime, count)
+    return max_mtime, count
+
 
 class ProjectScanner:
     """
@@ -25,14 +117,32 @@ class ProjectScanner:
     - Project DB 레코드 업데이트 (Stale Project 식별용)
     """
     
-    def __init__(self, session: Session, vault_root: Path):
+    def __init__(
+        self,
+        session: Session,
+        vault_root: Path,
+        watcher: Optional[ProjectWatcher] = None,
+        stat_cache: Optional[StatCache] = None,
+        subtree_cache: Optional[SubtreeCache] = None,
+    ):
         """
         Args:
             session: DB 세션
             vault_root: Obsidian Vault 루트 경로
+            watcher: 파일 변경 감시자 (실행 중이면 변경된 프로젝트만 스캔)
+            stat_cache: 파일 mtime 캐시 (None이면 프로세스 전역 캐시, watcher 실행 중에만 사용)
+            subtree_cache: 디렉터리별 스캔 결과 캐시 (watcher 실행 중에만 사용)
         """
         self.session = session
         self.vault_root = vault_root
+        self.watcher = watcher
+        self.stat_cache = stat_cache if stat_cache is not None else default_stat_cache
+        self.subtree_cache = subtree_cache if subtree_cache is not None else SubtreeCache()
+        self._watch_generation: Optional[int] = None
+        if watcher is not None:
+            # 변경 이벤트가 온 경로는 TTL과 무관하게 즉시 무효화
+            watcher.add_listener(self.stat_cache.invalidate)
+            watcher.add_listener(self.subtree_cache.invalidate)
     
     def scan_project(self, project: Project) -> bool:
         """
@@ -44,49 +154,137 @@ class ProjectScanner:
         Returns:
             bool: 업데이트 여부 (True if changed)
         """
-        # 1. 프로젝트 절대 경로 계산
-        project_path = self.vault_root / project.path
-        
-        if not project_path.exists() or not project_path.is_dir():
+        subtree_cache = self._active_subtree_cache()
+        state = self._compute_state(
+            self.vault_root / project.path, subtree_cache, self._active_stat_cache()
+        )
+        if state is None:
             # 프로젝트 폴더가 없으면 스킵 (로깅 필요하지만 현재는 패스)
             return False
-            
-        # 2. 폴더 내 파일 스캔 (.md 파일만 대상)
+
+        if self._apply_state(project, *state):
+            self._commit([project])
+            return True
+
+        return False
+
+    def scan_all(self) -> int:
+        """
+        모든 활성 프로젝트를 스캔하고 업데이트된 프로젝트 수 반환.
+
+        watcher가 실행 중이면 마지막 스캔 이후 변경 이벤트가 있었던
+        프로젝트만 스캔합니다.
+
+        파일 시스템 탐색은 프로젝트별로 스레드 풀에서 병렬 수행하고,
+        DB 반영은 Session이 스레드 안전하지 않으므로 메인 스레드에서
+        한 번의 커밋으로 처리합니다.
+        """
+        projects = self.session.exec(select(Project).where(Project.is_active == True)).all()
+
+        if self.watcher is not None:
+            self.watcher.sync_projects({p.id: p.path for p in projects})
+            dirty = self.watcher.drain_dirty()
+            # 감시 중일 때만 dirty 프로젝트로 한정 (아니면 이벤트 누락 가능성이 있어 전체 스캔)
+            if self.watcher.is_running:
+                projects = [p for p in projects if p.id in dirty]
+
+        if not projects:
+            return 0
+
+        # ORM 객체는 워커에 넘기지 않고 경로만 전달
+        paths = [self.vault_root / project.path for project in projects]
+        subtree_cache = self._active_subtree_cache()
+        stat_cache = self._active_stat_cache()
+        max_workers = min(MAX_SCAN_WORKERS, len(paths))
+        if max_workers == 1:
+            states = [self._compute_state(paths[0], subtree_cache, stat_cache)]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                states = list(
+                    executor.map(
+                        self._compute_state,
+                        paths,
+                        [subtree_cache] * len(paths),
+                        [stat_cache] * len(paths),
+                    )
+                )
+
+        updated = [
+            project
+            for project, state in zip(projects, states)
+            if state is not None and self._apply_state(project, *state)
+        ]
+        if updated:
+            self._commit(updated)
+
+        return len(updated)
+
+    def _active_subtree_cache(self) -> Optional[SubtreeCache]:
+        """
+        사용 가능한 서브트리 캐시 반환.
+
+        파일 내용 수정은 디렉터리 mtime을 바꾸지 않으므로 변경 이벤트로
+        무효화가 보장될 때(watcher 실행 중)만 캐시를 사용합니다.
+        감시가 중단되었거나 재시작된 경우 그 사이 이벤트가 누락되었을 수 있어 캐시를 비웁니다.
+        """
+        if self.watcher is None or not self.watcher.is_running:
+            self._watch_generation = None
+            self.subtree_cache.clear()
+            return None
+
+        if self.watcher.generation != self._watch_generation:
+            self.subtree_cache.clear()
+            self.stat_cache.clear()
+            self._watch_generation = self.watcher.generation
+        return self.subtree_cache
+
+    def _active_stat_cache(self) -> Optional[StatCache]:
+        """
+        사용 가능한 mtime 캐시 반환.
+
+        TTL 동안 수정이 반영되지 않으므로 변경 이벤트로 무효화가 보장될 때
+        (watcher 실행 중)만 사용하고, 아니면 매번 stat합니다.
+        """
+        if self.watcher is None or not self.watcher.is_running:
+            return None
+        return self.stat_cache
+
+    def _compute_state(
+        self,
+        project_path: Path,
+        subtree_cache: Optional[SubtreeCache] = None,
+        stat_cache: Optional[StatCache] = None,
+    ) -> Optional[tuple[float, int]]:
+        """
+        프로젝트 폴더의 (max_mtime, file_count) 계산 (파일 시스템 작업만 수행).
+
+        Returns:
+            (max_mtime, file_count) 튜플 (폴더가 없으면 None)
+        """
+        if not project_path.is_dir():
+            return None
         # 지식 관리 목적이므로 마크다운 파일 수정만 감지합니다.
-        scanner = FolderScanner(root_path=project_path, extensions=[".md"])
-        scanned_files = scanner.scan()
-        
-        if not scanned_files:
-            if project.file_count != 0:
-                project.file_count = 0
-                self.session.add(project)
-                self.session.commit()
-                self.session.refresh(project)
-                return True
-            return False
-            
-        # 3. 최신 mtime 찾기
-        max_mtime = 0.0
-        for f in scanned_files:
-            try:
-                mtime = FileTracker.get_file_mtime(f.full_path)
-                if mtime > max_mtime:
-                    max_mtime = mtime
-            except OSError:
-                continue
-                
+        # watcher 이벤트 경로와 캐시 키가 일치하도록 실제 경로로 변환
+        return _scan_mtimes(project_path.resolve(), stat_cache, subtree_cache)
+
+    @staticmethod
+    def _apply_state(project: Project, max_mtime: float, file_count: int) -> bool:
+        """
+        스캔 결과를 Project 객체에 반영 (커밋은 호출 측에서 수행).
+
+        Returns:
+            bool: 변경 여부
+        """
         updated = False
-        
-        # Update file count
-        if project.file_count != len(scanned_files):
-            project.file_count = len(scanned_files)
+
+        if project.file_count != file_count:
+            project.file_count = file_count
             updated = True
 
         if max_mtime > 0.0:
-            # 4. DB 업데이트 (변경된 경우에만)
             # timestamp to datetime (UTC)
             last_modified = datetime.fromtimestamp(max_mtime, tz=timezone.utc)
-            
+
             # 기존 값과 비교 (DB에서 naive로 올 경우 UTC로 가정)
             current_last_modified = project.last_modified_at
             if current_last_modified and current_last_modified.tzinfo is None:
@@ -95,26 +293,17 @@ class ProjectScanner:
             if current_last_modified is None or last_modified > current_last_modified:
                 project.last_modified_at = last_modified
                 updated = True
-        
-        if updated:
-            self.session.add(project)
-            self.session.commit()
-            self.session.refresh(project)
-            if project.last_modified_at and project.last_modified_at.tzinfo is None:
-                project.last_modified_at = project.last_modified_at.replace(tzinfo=timezone.utc)
-            return True
-            
-        return False
 
-    def scan_all(self) -> int:
-        """
-        모든 활성 프로젝트를 스캔하고 업데이트된 프로젝트 수 반환.
-        """
-        projects = self.session.exec(select(Project).where(Project.is_active == True)).all()
-        updated_count = 0
-        
+        return updated
+
+    def _commit(self, projects: List[Project]) -> None:
+        """변경된 프로젝트들을 한 번에 커밋하고 최신 상태로 갱신"""
+        # 커밋 후에는 객체가 만료되므로 id는 미리 수집
+        ids = [project.id for project in projects]
+        self.session.add_all(projects)
+        self.session.commit()
+        # 프로젝트마다 refresh 하지 않고 한 번의 SELECT로 만료된 객체들을 다시 로드
+        self.session.exec(select(Project).where(Project.id.in_(ids))).all()
         for project in projects:
-            if self.scan_project(project):
-                updated_count += 1
-                
-        return updated_count
+            if project.last_modified_at and project.last_modified_at.tzinfo is None:
+                project.last_modified_at = project.last_modified_at.replace(tzinfo=timezone.utc)
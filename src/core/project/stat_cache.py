@@ -0,0 +1,134 @@
+"""
+Stat Cache Module
+
+파일 mtime 조회 결과를 짧은 TTL 동안 캐시합니다.
+대시보드 새로고침 등으로 scan이 반복될 때 같은 파일에 대한 stat() 호출을 줄이며,
+ProjectWatcher 이벤트로 변경된 경로는 즉시 무효화됩니다.
+TTL 동안 수정이 보이지 않을 수 있으므로 ProjectScanner는 watcher 실행 중에만 사용합니다.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+
+class StatCache:
+    """
+    경로별 mtime LRU 캐시 (TTL 적용, 스레드 안전).
+
+    사용법:
+        cache = StatCache(maxsize=10000, ttl=5.0)
+        mtime = cache.get_mtime("/vault/note.md")
+        cache.invalidate("/vault/note.md")
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 5.0):
+        """
+        Args:
+            maxsize: 최대 캐시 항목 수
+            ttl: 캐시 유효 시간 (초)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_mtime(
+        self,
+        path: str,
+        stat: Optional[Callable[[], os.stat_result]] = None,
+    ) -> float:
+        """
+        파일 mtime 조회 (캐시 만료 시 stat 수행).
+
+        Args:
+            path: 파일 경로
+            stat: stat 함수 (예: DirEntry.stat, 기본값: os.stat(path))
+
+        Returns:
+            st_mtime
+
+        Raises:
+            OSError: stat 실패 시
+        """
+        key = str(path)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[1] < self.ttl:
+                self._entries.move_to_end(key)
+                return entry[0]
+
+        mtime = (stat() if stat is not None else os.stat(key)).st_mtime
+
+        with self._lock:
+            self._entries[key] = (mtime, now)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return mtime
+
+    def invalidate(self, path: str) -> None:
+        """경로의 캐시 항목 제거 (파일 변경 이벤트 수신 시 호출)"""
+        with self._lock:
+            self._entries.pop(str(path), None)
+
+    def clear(self) -> None:
+        """전체 캐시 제거"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# 프로세스 전역 기본 캐시 (ProjectScanner 공용)
+default_stat_cache = StatCache()
+
+
+class SubtreeCache:
+    """
+    디렉터리별 서브트리 스캔 결과 캐시 (스레드 안전).
+
+    {dir_path: (st_mtime_ns, max_mtime, file_count)} 형태로 저장하며,
+    디렉터리 mtime이 같으면 하위 트리 재탐색을 생략합니다.
+    파일 내용 수정은 디렉터리 mtime을 바꾸지 않으므로, 변경 이벤트로
+    invalidate가 호출되는 경우(ProjectWatcher 실행 중)에만 사용해야 합니다.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, tuple[int, float, int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: str, mtime_ns: int) -> Optional[tuple[float, int]]:
+        """디렉터리 mtime이 일치하면 (max_mtime, file_count) 반환"""
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is None or entry[0] != mtime_ns:
+            return None
+        return entry[1], entry[2]
+
+    def put(self, path: str, mtime_ns: int, max_mtime: float, file_count: int) -> None:
+        with self._lock:
+            self._entries[path] = (mtime_ns, max_mtime, file_count)
+
+    def invalidate(self, path: str) -> None:
+        """변경 경로와 모든 상위 디렉터리의 캐시 항목 제거"""
+        path = str(path)
+        with self._lock:
+            while True:
+                self._entries.pop(path, None)
+                parent = os.path.dirname(path)
+                if parent == path:
+                    break
+                path = parent
+
+    def clear(self) -> None:
+        """전체 캐시 제거"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,5 +1,6 @@
-from datetime import datetime, timedelta, timezone
-from typing import Tuple
+import time
+from datetime import timezone
+from typing import Optional, Tuple
 from core.domain.project import Project
 
 class ProjectStatus:
@@ -8,12 +9,15 @@ class ProjectStatus:
     STALE_THRESHOLD_DAYS = 30
 
     @staticmethod
-    def calculate_staleness(project: Project) -> Tuple[bool, int]:
+    def calculate_staleness(
+        project: Project, now_ts: Optional[float] = None
+    ) -> Tuple[bool, int]:
         """
         Calculate if a project is stale based on last_modified_at.
         
         Args:
             project: Project entity
+            now_ts: Current epoch seconds (pass once when evaluating many projects)
             
         Returns:
             Tuple[bool, int]: (is_stale, days_inactive)
@@ -22,16 +26,16 @@ class ProjectStatus:
         base_date = project.last_modified_at or project.created_at
         
         if not base_date:
-            base_date = datetime.now(timezone.utc)
+            return False, 0
 
         # Enforce timezone awareness (assume UTC if naive)
         if base_date.tzinfo is None:
             base_date = base_date.replace(tzinfo=timezone.utc)
             
-        # Compare with current UTC time
-        now = datetime.now(timezone.utc)
-        delta = now - base_date
-        days_inactive = max(0, delta.days)
+        # Compare raw epoch seconds (no datetime/timedelta allocation per project)
+        if now_ts is None:
+            now_ts = time.time()
+        days_inactive = max(0, int((now_ts - base_date.timestamp()) // 86400))
         
         is_stale = days_inactive >= ProjectStatus.STALE_THRESHOLD_DAYS
         
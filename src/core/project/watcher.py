@@ -0,0 +1,181 @@
+"""
+Project Watcher Module
+
+OS 파일 시스템 이벤트(inotify/FSEvents/ReadDirectoryChangesW)를 구독하여
+변경이 발생한 프로젝트만 dirty로 표시합니다.
+ProjectScanner는 dirty 프로젝트만 재스캔하여 유휴 상태의 전체 탐색 비용을 제거합니다.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set
+
+try:
+    import watchfiles
+except ImportError:  # pragma: no cover - 선택적 의존성
+    watchfiles = None
+
+
+# 네트워크 드라이브(NFS 등)용 폴링 간격 (ms)
+POLLING_DELAY_MS = 60_000
+
+
+class ProjectWatcher:
+    """
+    프로젝트 폴더 변경 감시자.
+
+    프로젝트 서브트리마다 watch를 등록하고(볼트 루트 전체를 감시하지 않음),
+    이벤트가 발생한 경로를 프로젝트 id로 매핑하여 dirty 집합에 추가합니다.
+
+    사용법:
+        watcher = ProjectWatcher(vault_root)
+        watcher.sync_projects({project.id: project.path for project in projects})
+        watcher.start()
+        dirty_ids = watcher.drain_dirty()
+    """
+
+    def __init__(self, vault_root: Path, force_polling: bool = False):
+        """
+        Args:
+            vault_root: Obsidian Vault 루트 경로
+            force_polling: 이벤트 대신 폴링 사용 (네트워크 드라이브용)
+        """
+        self.vault_root = vault_root
+        self.force_polling = force_polling
+        self._project_paths: Dict[int, str] = {}
+        self._dirty: Set[int] = set()
+        self._listeners: List[Callable[[str], None]] = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._enabled = False
+        self._generation = 0
+
+    @staticmethod
+    def is_available() -> bool:
+        """watchfiles 설치 여부"""
+        return watchfiles is not None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def generation(self) -> int:
+        """감시 스레드 시작 횟수 (값이 바뀌었다면 그 사이 이벤트가 누락되었을 수 있음)"""
+        return self._generation
+
+    def sync_projects(self, projects: Dict[int, str]) -> None:
+        """
+        감시 대상 프로젝트 목록 갱신.
+
+        새로 추가되었거나 경로가 바뀐 프로젝트는 dirty로 표시됩니다.
+        감시 경로가 바뀌면 watch를 재시작하며, 재시작 사이의 이벤트 누락에
+        대비해 모든 프로젝트를 dirty로 표시합니다.
+
+        Args:
+            projects: {project_id: vault 기준 상대 경로}
+        """
+        new_paths = {
+            project_id: str((self.vault_root / path).resolve())
+            for project_id, path in projects.items()
+        }
+        with self._lock:
+            changed = new_paths != self._project_paths
+            for project_id, path in new_paths.items():
+                if self._project_paths.get(project_id) != path:
+                    self._dirty.add(project_id)
+            self._project_paths = new_paths
+
+        if changed and self._enabled:
+            self._halt()
+            with self._lock:
+                self._dirty.update(self._project_paths)
+            self._launch()
+
+    def add_listener(self, callback: Callable[[str], None]) -> None:
+        """변경된 경로(절대 경로 문자열)를 전달받을 콜백 등록 (중복 등록은 무시)"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def mark_dirty(self, project_id: int) -> None:
+        """프로젝트를 수동으로 dirty 표시"""
+        with self._lock:
+            self._dirty.add(project_id)
+
+    def drain_dirty(self) -> Set[int]:
+        """dirty 프로젝트 id 집합을 반환하고 비움"""
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        return dirty
+
+    def start(self) -> None:
+        """백그라운드 스레드에서 감시 시작"""
+        if watchfiles is None:
+            raise ImportError(
+                "watchfiles is not installed. Install it with: pip install watchfiles"
+            )
+        self._enabled = True
+        self._launch()
+
+    def stop(self) -> None:
+        """감시 중지"""
+        self._enabled = False
+        self._halt()
+
+    def _launch(self) -> None:
+        if self.is_running:
+            return
+
+        with self._lock:
+            paths = [p for p in self._project_paths.values() if os.path.isdir(p)]
+        if not paths:
+            return
+
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(paths, self._stop_event),
+            name="project-watcher",
+            daemon=True,
+        )
+        self._thread.start()
+        self._generation += 1
+
+    def _halt(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self, paths: List[str], stop_event: threading.Event) -> None:
+        for changes in watchfiles.watch(
+            *paths,
+            stop_event=stop_event,
+            force_polling=self.force_polling,
+            poll_delay_ms=POLLING_DELAY_MS,
+            raise_interrupt=False,
+        ):
+            self._on_changes(path for _, path in changes)
+
+    def _on_changes(self, changed_paths) -> None:
+        """변경 경로를 프로젝트 id로 매핑하여 dirty 표시"""
+        with self._lock:
+            roots = [
+                (project_id, path + os.sep)
+                for project_id, path in self._project_paths.items()
+            ]
+
+        for changed in changed_paths:
+            for listener in self._listeners:
+                listener(changed)
+            candidate = changed + os.sep
+            matched = {
+                project_id
+                for project_id, root in roots
+                if candidate.startswith(root)
+            }
+            if matched:
+                with self._lock:
+                    self._dirty.update(matched)
@@ -2,6 +2,7 @@
 """RAG 파이프라인 모듈"""
 
 from .retriever import Retriever, RetrievedChunk, RetrievalResult
+from .query_cache import QueryCache
 from .prompt import (
     PromptBuilder,
     PromptTemplate,
@@ -26,6 +27,7 @@ __all__ = [
     "Retriever",
     "RetrievedChunk",
     "RetrievalResult",
+    "QueryCache",
     "PromptBuilder",
     "PromptTemplate",
     "DEFAULT_RAG_TEMPLATE",
@@ -1,10 +1,12 @@
+import os
 import re
-import uuid
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class HierarchicalChunk:
     id: str
     text: str
@@ -23,7 +25,11 @@ class HierarchicalChunk:
 
 
 class HierarchicalChunker:
-    HEADER_RE = re.compile(r"^(#{1,6})\s+(.+?)$", re.MULTILINE)
+    # [ \t]+ / [^\n]+ : 헤더가 다음 줄로 넘어가 매칭되지 않도록 한 줄로 제한
+    HEADER_RE = re.compile(r"^(#{1,6})[ \t]+([^\n]+)", re.MULTILINE)
+    _PARA_RE = re.compile(r"\n\n+")
+    _SAFE_SOURCE_RE = re.compile(r"[^a-zA-Z0-9]")
+    _BREAK_DELIMITERS = ("\n\n", "\n", ". ", ", ", " ")
 
     def __init__(
         self,
@@ -42,15 +48,25 @@ class HierarchicalChunker:
         text: str,
         source: str = "unknown",
     ) -> Tuple[List[HierarchicalChunk], List[HierarchicalChunk]]:
-        parents = self._create_parent_chunks(text, source)
+        parents = list(self._create_parent_chunks(text, source))
         children = []
 
         for parent in parents:
-            parent_children = self._split_to_children(parent)
-            children.extend(parent_children)
+            children.extend(self._split_to_children(parent))
 
         return parents, children
 
+    def iter_chunks(
+        self,
+        text: str,
+        source: str = "unknown",
+    ) -> Iterator[HierarchicalChunk]:
+        # parent 하나씩 yield 후 바로 해당 children을 yield (전체 목록을 메모리에 유지하지 않음)
+        for parent in self._create_parent_chunks(text, source):
+            children = list(self._split_to_children(parent))
+            yield parent
+            yield from children
+
     def chunk_flat(
         self,
         text: str,
@@ -63,18 +79,21 @@ class HierarchicalChunker:
         self,
         text: str,
         source: str,
-    ) -> List[HierarchicalChunk]:
+    ) -> Iterator[HierarchicalChunk]:
+        # 모든 청크 metadata가 같은 문자열 객체를 참조하도록 intern
+        source = sys.intern(source)
         headers = list(self.HEADER_RE.finditer(text))
 
         if not headers:
-            return self._chunk_by_size(text, source, "parent")
+            yield from self._chunk_by_size(text, source, "parent")
+            return
 
-        chunks = []
         header_stack: List[str] = []
 
         for i, match in enumerate(headers):
             level = len(match.group(1))
-            title = match.group(2).strip()
+            # "Summary" 같은 흔한 헤더는 여러 문서에 걸쳐 하나의 객체로 공유
+            title = sys.intern(match.group(2).strip())
 
             start = match.start()
             end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
@@ -89,41 +108,39 @@ class HierarchicalChunker:
                 continue
 
             if len(section_text) > self.parent_chunk_size:
-                sub_chunks = self._chunk_by_size(
+                yield from self._chunk_by_size(
                     section_text, source, "parent", base_headers=list(header_stack)
                 )
-                chunks.extend(sub_chunks)
             else:
                 chunk_id = self._generate_id(source, i, "parent")
-                chunks.append(
-                    HierarchicalChunk(
-                        id=chunk_id,
-                        text=section_text,
-                        metadata={
-                            "source": source,
-                            "headers": list(header_stack),
-                            "level": level,
-                        },
-                        level="parent",
-                    )
+                yield HierarchicalChunk(
+                    id=chunk_id,
+                    text=section_text,
+                    metadata={
+                        "source": source,
+                        "headers": list(header_stack),
+                        "level": level,
+                    },
+                    level="parent",
                 )
 
-        return chunks
-
     def _chunk_by_size(
         self,
         text: str,
         source: str,
         level: str,
         base_headers: Optional[List[str]] = None,
-    ) -> List[HierarchicalChunk]:
-        chunks = []
+    ) -> Iterator[HierarchicalChunk]:
         target_size = (
             self.parent_chunk_size if level == "parent" else self.child_chunk_size
         )
 
-        paragraphs = re.split(r"\n\n+", text)
-        current_chunk = ""
+        # 같은 섹션의 청크들은 headers 리스트를 공유 (청크마다 복사하지 않음)
+        headers = base_headers or []
+        paragraphs = self._PARA_RE.split(text)
+        # 문단을 리스트에 모았다가 flush 시점에만 join (반복 문자열 연결 방지)
+        buf: List[str] = []
+        buf_len = 0
         chunk_idx = 0
 
         for para in paragraphs:
@@ -131,56 +148,50 @@ class HierarchicalChunker:
             if not para:
                 continue
 
-            if len(current_chunk) + len(para) + 2 <= target_size:
-                if current_chunk:
-                    current_chunk += "\n\n" + para
-                else:
-                    current_chunk = para
+            if buf_len + len(para) + 2 <= target_size:
+                if buf:
+                    buf_len += 2
+                buf.append(para)
+                buf_len += len(para)
             else:
-                if current_chunk and len(current_chunk) >= self.min_chunk_size:
+                if buf and buf_len >= self.min_chunk_size:
                     chunk_id = self._generate_id(source, chunk_idx, level)
-                    chunks.append(
-                        HierarchicalChunk(
-                            id=chunk_id,
-                            text=current_chunk,
-                            metadata={
-                                "source": source,
-                                "headers": base_headers or [],
-                                "chunk_index": chunk_idx,
-                            },
-                            level=level,
-                        )
+                    yield HierarchicalChunk(
+                        id=chunk_id,
+                        text="\n\n".join(buf),
+                        metadata={
+                            "source": source,
+                            "headers": headers,
+                            "chunk_index": chunk_idx,
+                        },
+                        level=level,
                     )
                     chunk_idx += 1
 
-                current_chunk = para
+                buf = [para]
+                buf_len = len(para)
 
-        if current_chunk and len(current_chunk) >= self.min_chunk_size:
+        if buf and buf_len >= self.min_chunk_size:
             chunk_id = self._generate_id(source, chunk_idx, level)
-            chunks.append(
-                HierarchicalChunk(
-                    id=chunk_id,
-                    text=current_chunk,
-                    metadata={
-                        "source": source,
-                        "headers": base_headers or [],
-                        "chunk_index": chunk_idx,
-                    },
-                    level=level,
-                )
+            yield HierarchicalChunk(
+                id=chunk_id,
+                text="\n\n".join(buf),
+                metadata={
+                    "source": source,
+                    "headers": headers,
+                    "chunk_index": chunk_idx,
+                },
+                level=level,
             )
 
-        return chunks
-
     def _split_to_children(
         self,
         parent: HierarchicalChunk,
-    ) -> List[HierarchicalChunk]:
+    ) -> Iterator[HierarchicalChunk]:
         text = parent.text
-        children = []
 
         if len(text) <= self.child_chunk_size:
-            return []
+            return
 
         start = 0
         idx = 0
@@ -213,9 +224,9 @@ class HierarchicalChunker:
                     parent_id=parent.id,
                     level="child",
                 )
-                children.append(child)
                 parent.children_ids.append(child_id)
                 idx += 1
+                yield child
 
             next_start = end - self.child_overlap
             if next_start <= start:
@@ -226,31 +237,46 @@ class HierarchicalChunker:
 
             start = next_start
 
-        return children
-
     def _find_break_point(self, text: str, start: int, end: int) -> int:
-        search_text = text[start:end]
+        # 슬라이스 복사 없이 구간 후반부만 C 레벨 rfind로 탐색
+        lower = start + (end - start) // 2 + 1
 
-        for delimiter in ["\n\n", "\n", ". ", ", ", " "]:
-            last_pos = search_text.rfind(delimiter)
-            if last_pos > len(search_text) // 2:
-                return start + last_pos + len(delimiter)
+        for delimiter in self._BREAK_DELIMITERS:
+            last_pos = text.rfind(delimiter, lower, end)
+            if last_pos != -1:
+                return last_pos + len(delimiter)
 
         return end
 
     def _generate_id(self, source: str, index: int, level: str) -> str:
-        short_uuid = str(uuid.uuid4())[:8]
-        safe_source = re.sub(r"[^a-zA-Z0-9]", "_", source)[:20]
+        # uuid4 문자열의 앞 8자리와 같은 형식(랜덤 hex 8자리)을 UUID 객체 생성 없이 만듦
+        short_uuid = os.urandom(4).hex()
+        safe_source = self._sanitize_source(source)
         return f"{safe_source}::{level}_{index}_{short_uuid}"
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _sanitize_source(source: str) -> str:
+        return HierarchicalChunker._SAFE_SOURCE_RE.sub("_", source)[:20]
+
+    @staticmethod
+    def build_parent_index(
+        parents: List[HierarchicalChunk],
+    ) -> Dict[str, HierarchicalChunk]:
+        return {parent.id: parent for parent in parents}
+
     def get_parent_for_child(
         self,
         child: HierarchicalChunk,
-        parents: List[HierarchicalChunk],
+        parents: Union[List[HierarchicalChunk], Dict[str, HierarchicalChunk]],
     ) -> Optional[HierarchicalChunk]:
+        # 여러 child를 조회할 때는 build_parent_index() 결과를 넘기면 O(1) 조회
         if not child.parent_id:
             return None
 
+        if isinstance(parents, dict):
+            return parents.get(child.parent_id)
+
         for parent in parents:
             if parent.id == child.parent_id:
                 return parent
@@ -1,13 +1,14 @@
 import asyncio
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from typing import List, Optional, Set, TYPE_CHECKING
+from heapq import heappush, heapreplace
+from typing import List, Optional, Set, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from core.rag.retriever import Retriever, RetrievalResult, RetrievedChunk
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregatedResult:
     queries: List[str]
     chunks: List["RetrievedChunk"]
@@ -23,6 +24,18 @@ class ParallelQueryProcessor:
     ):
         self._retriever = retriever
         self._max_workers = max_workers
+        # 호출마다 스레드 풀을 만들지 않도록 인스턴스 수명 동안 재사용
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="rag-parallel"
+        )
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    def __del__(self):
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
 
     def process_queries(
         self,
@@ -36,17 +49,17 @@ class ParallelQueryProcessor:
             return [self._retriever.retrieve(queries[0], top_k=top_k)]
 
         results = []
-        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
-            future_to_query = {
-                executor.submit(self._retriever.retrieve, q, top_k): q for q in queries
-            }
-
-            for future in as_completed(future_to_query):
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception:
-                    pass
+        future_to_query = {
+            self._executor.submit(self._retriever.retrieve, q, top_k): q
+            for q in queries
+        }
+
+        for future in as_completed(future_to_query):
+            try:
+                result = future.result()
+                results.append(result)
+            except Exception:
+                pass
 
         return results
 
@@ -58,20 +71,19 @@ class ParallelQueryProcessor:
         if not queries:
             return []
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
-        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
-            tasks = [
-                loop.run_in_executor(
-                    executor,
-                    self._retriever.retrieve,
-                    q,
-                    top_k,
-                )
-                for q in queries
-            ]
+        tasks = [
+            loop.run_in_executor(
+                self._executor,
+                self._retriever.retrieve,
+                q,
+                top_k,
+            )
+            for q in queries
+        ]
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
         return [r for r in results if not isinstance(r, Exception)]
 
@@ -88,8 +100,12 @@ class ParallelQueryProcessor:
                 total_count=0,
             )
 
-        all_chunks: List["RetrievedChunk"] = []
+        # 중복 제거와 top-k 선택을 한 번의 순회로 처리 (전체 목록을 만들지 않음)
+        # heap 원소: (score, -순번, chunk) -> 순번이 유일하므로 chunk끼리는 비교되지 않고,
+        # 동점이면 먼저 나온 청크가 남음
+        heap: List[Tuple[float, int, "RetrievedChunk"]] = []
         seen_ids: Set[str] = set()
+        total_count = 0
         queries = []
         query_results = {}
 
@@ -98,19 +114,26 @@ class ParallelQueryProcessor:
             query_results[result.query] = result
 
             for chunk in result.chunks:
-                if dedup and chunk.id in seen_ids:
-                    continue
-
-                all_chunks.append(chunk)
                 if dedup:
+                    if chunk.id in seen_ids:
+                        continue
                     seen_ids.add(chunk.id)
 
-        all_chunks.sort(key=lambda c: c.score, reverse=True)
+                total_count += 1
+                if top_k <= 0:
+                    continue
+                item = (chunk.score, -total_count, chunk)
+                if len(heap) < top_k:
+                    heappush(heap, item)
+                elif item > heap[0]:
+                    heapreplace(heap, item)
+
+        top_chunks = [chunk for _, _, chunk in sorted(heap, reverse=True)]
 
         return AggregatedResult(
             queries=queries,
-            chunks=all_chunks[:top_k],
-            total_count=len(all_chunks),
+            chunks=top_chunks,
+            total_count=total_count,
             query_results=query_results,
         )
 
@@ -7,7 +7,7 @@ if TYPE_CHECKING:
     from core.llm.strategy import LLMStrategy, Message
 
 
-@dataclass
+@dataclass(slots=True)
 class RewriteResult:
     is_clear: bool
     rewritten_queries: List[str]
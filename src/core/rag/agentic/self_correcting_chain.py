@@ -1,12 +1,19 @@
+import asyncio
+import inspect
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Optional, TYPE_CHECKING
+from typing import Generator, List, Optional, TYPE_CHECKING
+
+from core.rag.agentic.parallel_processor import ParallelQueryProcessor
+from core.rag.query_cache import QueryCache
 
 if TYPE_CHECKING:
     from core.llm.strategy import LLMStrategy, Message
     from core.rag.retriever import Retriever, RetrievalResult
 
 
-@dataclass
+@dataclass(slots=True)
 class CorrectionResult:
     answer: str
     attempts: int
@@ -19,6 +26,8 @@ class CorrectionResult:
 class SelfCorrectingRAGChain:
     QUALITY_THRESHOLD = 0.5
     MAX_RETRIES = 2
+    # 같은 쿼리의 확장 결과 재사용 (LRU)
+    BROADEN_CACHE_SIZE = 256
 
     BROADEN_PROMPT = """The following search query did not find good results.
 Please rewrite it to be broader and more likely to find relevant documents.
@@ -29,6 +38,15 @@ Original query: {query}
 
 Rewritten query:"""
 
+    BROADEN_MULTI_PROMPT = """The following search query did not find good results.
+Please rewrite it in {count} different ways, each broader and more likely to find relevant documents.
+Keep the core meaning but use more general terms or synonyms.
+Respond with ONLY the rewritten queries, one per line, nothing else.
+
+Original query: {query}
+
+Rewritten queries:"""
+
     ANSWER_PROMPT = """Based on the following context, answer the question.
 If the context doesn't contain enough information, say so honestly.
 
@@ -39,17 +57,32 @@ Question: {question}
 
 Answer:"""
 
+    NO_RESULT_ANSWER = "I couldn't find relevant information to answer your question."
+    EMPTY_QUESTION_ANSWER = "Please provide a question."
+
     def __init__(
         self,
         retriever: "Retriever",
         llm: "LLMStrategy",
         quality_threshold: float = 0.5,
         max_retries: int = 2,
+        broaden_candidates: int = 1,
     ):
+        """
+        Args:
+            broaden_candidates: 재시도마다 생성할 확장 쿼리 후보 수.
+                2 이상이면 후보를 한 번의 LLM 호출로 받아 동시에 검색하고
+                품질이 가장 높은 결과를 사용합니다 (LLM 왕복 횟수 감소).
+        """
         self._retriever = retriever
         self._llm = llm
         self.QUALITY_THRESHOLD = quality_threshold
         self.MAX_RETRIES = max_retries
+        self._broaden_candidates = max(1, broaden_candidates)
+        self._processor: Optional[ParallelQueryProcessor] = None
+        self._broaden_cache: "OrderedDict[str, str]" = OrderedDict()
+        # 체인 인스턴스가 요청(스레드) 간에 공유되므로 LRU 조작은 락으로 보호
+        self._broaden_lock = threading.Lock()
 
     def query(
         self,
@@ -57,20 +90,156 @@ Answer:"""
         top_k: int = 5,
         temperature: float = 0.7,
     ) -> CorrectionResult:
+        if not question.strip():
+            return self._empty_question_result(question)
+
+        correction = self._correct(question, top_k)
+        correction.answer = self._generate_answer(
+            question, correction.retrieval_result, temperature
+        )
+        return correction
+
+    def stream_query(
+        self,
+        question: str,
+        top_k: int = 5,
+        temperature: float = 0.7,
+    ) -> Generator[str, None, CorrectionResult]:
+        """
+        query()의 스트리밍 버전.
+
+        검색/쿼리 확장 루프는 전체 응답이 필요하므로 그대로 수행하고,
+        최종 답변 생성만 청크 단위로 전달합니다. 제너레이터가 끝나면
+        StopIteration.value로 CorrectionResult를 돌려줍니다.
+        """
+        if not question.strip():
+            correction = self._empty_question_result(question)
+            yield correction.answer
+            return correction
+
+        correction = self._correct(question, top_k)
+        messages = self._answer_messages(question, correction.retrieval_result)
+        if messages is None:
+            correction.answer = self.NO_RESULT_ANSWER
+            yield correction.answer
+            return correction
+
+        parts: List[str] = []
+        for chunk in self._llm.stream_generate(messages, temperature=temperature):
+            parts.append(chunk)
+            yield chunk
+        correction.answer = "".join(parts)
+        return correction
+
+    def _correct(self, question: str, top_k: int) -> CorrectionResult:
+        """
+        품질 기준을 넘을 때까지 검색/쿼리 확장 반복 (answer는 비워서 반환).
+
+        확장 쿼리가 이미 검색한 쿼리와 같으면(정규화 기준) 같은 결과가 나오므로
+        다시 검색하지 않고, 새 쿼리가 하나도 없으면 재시도를 중단합니다.
+        """
         current_query = question
         attempts = 0
         all_queries = [question]
+        pending = [question]
+        seen = {QueryCache.normalize_query(question)}
         result = None
         quality = 0.0
 
         while attempts <= self.MAX_RETRIES:
             attempts += 1
 
-            result = self._retriever.retrieve(current_query, top_k=top_k)
+            current_query, result, quality = self._retrieve_best(pending, top_k)
+
+            if quality >= self.QUALITY_THRESHOLD:
+                break
+
+            if attempts <= self.MAX_RETRIES:
+                if self._broaden_candidates > 1:
+                    candidates = self._broaden_query_candidates(current_query)
+                else:
+                    candidates = [self._broaden_query(current_query)]
+                pending = self._unseen_queries(candidates, seen)
+                if not pending:
+                    break
+                all_queries.extend(pending)
+
+        return CorrectionResult(
+            answer="",
+            attempts=attempts,
+            final_query=current_query,
+            retrieval_quality=quality,
+            all_queries=all_queries,
+            retrieval_result=result,
+        )
+
+    def _retrieve_best(
+        self, queries: List[str], top_k: int
+    ) -> "tuple[str, RetrievalResult, float]":
+        """
+        쿼리 후보들을 검색하고 품질이 가장 높은 (쿼리, 결과, 품질) 반환.
+
+        후보가 여럿이면 ParallelQueryProcessor로 동시에 검색합니다.
+        """
+        if len(queries) > 1:
+            if self._processor is None:
+                self._processor = ParallelQueryProcessor(
+                    self._retriever, max_workers=self._broaden_candidates
+                )
+            results = self._processor.process_queries(queries, top_k=top_k)
+            if results:
+                scored = [(self._evaluate_quality(r), r) for r in results]
+                quality, result = max(scored, key=lambda item: item[0])
+                return result.query, result, quality
+
+        result = self._retriever.retrieve(queries[0], top_k=top_k)
+        return queries[0], result, self._evaluate_quality(result)
+
+    async def aquery(
+        self,
+        question: str,
+        top_k: int = 5,
+        temperature: float = 0.7,
+        speculative: bool = False,
+    ) -> CorrectionResult:
+        """
+        query()의 비동기 버전.
+
+        speculative=True이면 검색을 기다리는 동안 다음 시도에 쓸 확장 쿼리를
+        미리 생성합니다. 품질 미달 시 검색 + 쿼리 확장 RTT가 겹쳐 시도당 1 RTT를
+        절약하지만, 품질을 통과하는 시도에서도 LLM 호출이 시작되므로 (취소되더라도
+        과금될 수 있음) 기본값은 False입니다.
+        """
+        if not question.strip():
+            return self._empty_question_result(question)
+
+        current_query = question
+        attempts = 0
+        all_queries = [question]
+        seen = {QueryCache.normalize_query(question)}
+        result = None
+        quality = 0.0
+
+        while attempts <= self.MAX_RETRIES:
+            attempts += 1
+            can_retry = attempts <= self.MAX_RETRIES
+
+            broaden_task = None
+            if speculative and can_retry:
+                broaden_task = asyncio.create_task(self._abroaden_query(current_query))
+
+            try:
+                result = await self._aretrieve(current_query, top_k)
+            except BaseException:
+                if broaden_task is not None:
+                    broaden_task.cancel()
+                raise
             quality = self._evaluate_quality(result)
 
             if quality >= self.QUALITY_THRESHOLD:
-                answer = self._generate_answer(question, result, temperature)
+                if broaden_task is not None:
+                    broaden_task.cancel()
+                answer = await self._agenerate_answer(question, result, temperature)
                 return CorrectionResult(
                     answer=answer,
                     attempts=attempts,
@@ -80,11 +249,17 @@ Answer:"""
                     retrieval_result=result,
                 )
 
-            if attempts <= self.MAX_RETRIES:
-                current_query = self._broaden_query(current_query)
+            if can_retry:
+                if broaden_task is not None:
+                    broadened = await broaden_task
+                else:
+                    broadened = await self._abroaden_query(current_query)
+                if not self._unseen_queries([broadened], seen):
+                    break
+                current_query = broadened
                 all_queries.append(current_query)
 
-        answer = self._generate_answer(question, result, temperature)
+        answer = await self._agenerate_answer(question, result, temperature)
         return CorrectionResult(
             answer=answer,
             attempts=attempts,
@@ -94,6 +269,57 @@ Answer:"""
             retrieval_result=result,
         )
 
+    async def _aretrieve(self, query: str, top_k: int) -> "RetrievalResult":
+        return await asyncio.to_thread(self._retriever.retrieve, query, top_k=top_k)
+
+    async def _agenerate(self, messages: List["Message"], temperature: float):
+        # AsyncLLMStrategy를 구현한 LLM은 직접 await, 아니면 스레드에서 동기 호출
+        agenerate = getattr(self._llm, "agenerate", None)
+        if inspect.iscoroutinefunction(agenerate):
+            return await agenerate(messages, temperature=temperature)
+        return await asyncio.to_thread(
+            self._llm.generate, messages, temperature=temperature
+        )
+
+    async def _abroaden_query(self, query: str) -> str:
+        cached = self._cached_broaden(query)
+        if cached is not None:
+            return cached
+        response = await self._agenerate(self._broaden_messages(query), 0.3)
+        return self._store_broaden(query, response.content.strip())
+
+    async def _agenerate_answer(
+        self,
+        question: str,
+        result: Optional["RetrievalResult"],
+        temperature: float,
+    ) -> str:
+        messages = self._answer_messages(question, result)
+        if messages is None:
+            return self.NO_RESULT_ANSWER
+        response = await self._agenerate(messages, temperature)
+        return response.content
+
+    @staticmethod
+    def _unseen_queries(candidates: List[str], seen: "set[str]") -> List[str]:
+        """이번 질의에서 아직 검색하지 않은 쿼리만 반환하고 seen에 추가"""
+        unseen: List[str] = []
+        for candidate in candidates:
+            normalized = QueryCache.normalize_query(candidate)
+            if normalized and normalized not in seen:
+                seen.add(normalized)
+                unseen.append(candidate)
+        return unseen
+
+    def _empty_question_result(self, question: str) -> CorrectionResult:
+        return CorrectionResult(
+            answer=self.EMPTY_QUESTION_ANSWER,
+            attempts=0,
+            final_query=question,
+            retrieval_quality=0.0,
+            all_queries=[],
+        )
+
     def _evaluate_quality(self, result: "RetrievalResult") -> float:
         if not result or not result.chunks:
             return 0.0
@@ -106,12 +332,53 @@ Answer:"""
         return sum(scores) / len(scores)
 
     def _broaden_query(self, query: str) -> str:
-        prompt = self.BROADEN_PROMPT.format(query=query)
+        cached = self._cached_broaden(query)
+        if cached is not None:
+            return cached
+        response = self._llm.generate(
+            self._broaden_messages(query),
+            temperature=0.3,
+        )
+        return self._store_broaden(query, response.content.strip())
+
+    def _broaden_query_candidates(self, query: str) -> List[str]:
+        """확장 쿼리 후보 여러 개를 한 번의 LLM 호출로 생성"""
+        prompt = self.BROADEN_MULTI_PROMPT.format(
+            count=self._broaden_candidates, query=query
+        )
         response = self._llm.generate(
             [{"role": "user", "content": prompt}],
             temperature=0.3,
         )
-        return response.content.strip()
+
+        candidates: List[str] = []
+        for line in response.content.splitlines():
+            # "1. ...", "- ..." 형태의 번호/목록 표시 제거
+            candidate = line.strip().lstrip("-*•").strip()
+            head, sep, rest = candidate.partition(". ")
+            if sep and head.isdigit():
+                candidate = rest.strip()
+            if candidate and candidate not in candidates:
+                candidates.append(candidate)
+
+        if not candidates:
+            return [query]
+        return candidates[: self._broaden_candidates]
+
+    def _cached_broaden(self, query: str) -> Optional[str]:
+        with self._broaden_lock:
+            broadened = self._broaden_cache.get(query)
+            if broadened is not None:
+                self._broaden_cache.move_to_end(query)
+            return broadened
+
+    def _store_broaden(self, query: str, broadened: str) -> str:
+        with self._broaden_lock:
+            self._broaden_cache[query] = broadened
+            self._broaden_cache.move_to_end(query)
+            if len(self._broaden_cache) > self.BROADEN_CACHE_SIZE:
+                self._broaden_cache.popitem(last=False)
+        return broadened
 
     def _generate_answer(
         self,
@@ -119,23 +386,38 @@ Answer:"""
         result: Optional["RetrievalResult"],
         temperature: float,
     ) -> str:
-        if not result or not result.chunks:
-            return "I couldn't find relevant information to answer your question."
+        messages = self._answer_messages(question, result)
+        if messages is None:
+            return self.NO_RESULT_ANSWER
+
+        response = self._llm.generate(
+            messages,
+            temperature=temperature,
+        )
+        return response.content
 
-        context_parts = []
-        for i, chunk in enumerate(result.chunks[:5], 1):
-            source = chunk.metadata.get("source", "unknown")
-            context_parts.append(f"[{i}] Source: {source}\n{chunk.text}")
+    def _broaden_messages(self, query: str) -> List["Message"]:
+        prompt = self.BROADEN_PROMPT.format(query=query)
+        return [{"role": "user", "content": prompt}]
+
+    def _answer_messages(
+        self,
+        question: str,
+        result: Optional["RetrievalResult"],
+    ) -> Optional[List["Message"]]:
+        if not result or not result.chunks:
+            return None
 
-        context = "\n\n".join(context_parts)
+        chunks = result.chunks
+        if len(chunks) > 5:
+            chunks = chunks[:5]
+        context = "\n\n".join([
+            f"[{i}] Source: {chunk.metadata.get('source', 'unknown')}\n{chunk.text}"
+            for i, chunk in enumerate(chunks, 1)
+        ])
 
         prompt = self.ANSWER_PROMPT.format(
             context=context,
             question=question,
         )
-
-        response = self._llm.generate(
-            [{"role": "user", "content": prompt}],
-            temperature=temperature,
-        )
-        return response.content
+        return [{"role": "user", "content": prompt}]
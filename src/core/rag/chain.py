@@ -5,7 +5,7 @@ Retriever + PromptBuilder + LLM을 연결하는 통합 RAG 파이프라인.
 """
 
 from dataclasses import dataclass
-from typing import Iterator, List, Optional, Tuple
+from typing import Generator, Iterator, List, Optional, Tuple
 
 from .retriever import Retriever, RetrievalResult
 from .prompt import PromptBuilder, PromptTemplate, DEFAULT_RAG_TEMPLATE
@@ -16,7 +16,7 @@ from core.llm.strategy import LLMStrategy, Message, LLMResponse
 # Data Classes
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class RAGResponse:
     """RAG 파이프라인 응답 데이터"""
 
@@ -97,7 +97,7 @@ class RAGChain:
         """
         # 1. 검색
         retrieval_result = self._retriever.retrieve(question, top_k=top_k)
-        context = self._retriever.retrieve_with_context(question, top_k=top_k)
+        context = self._retriever.format_context(retrieval_result)
 
         # 2. 프롬프트 생성
         messages = self._prompt_builder.build(
@@ -143,7 +143,7 @@ class RAGChain:
         """
         # 1. 검색
         retrieval_result = self._retriever.retrieve(question, top_k=top_k)
-        context = self._retriever.retrieve_with_context(question, top_k=top_k)
+        context = self._retriever.format_context(retrieval_result)
 
         # 2. 프롬프트 생성 (이력 포함)
         messages = self._prompt_builder.build_with_history(
@@ -174,16 +174,20 @@ class RAGChain:
         top_k: int = 5,
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
-    ) -> Tuple[RetrievalResult, Iterator[str]]:
+    ) -> Tuple[RetrievalResult, Generator[str, None, RAGResponse]]:
         """
         스트리밍 RAG 응답 생성.
 
+        검색은 즉시 수행하고, LLM 응답은 생성되는 대로 청크 단위로 전달합니다.
+        제너레이터가 끝나면 StopIteration.value(`yield from`의 결과)로
+        전체 RAGResponse(answer, usage 포함)를 돌려줍니다.
+
         Returns:
             (retrieval_result, content_generator) 튜플
         """
         # 1. 검색
         retrieval_result = self._retriever.retrieve(question, top_k=top_k)
-        context = self._retriever.retrieve_with_context(question, top_k=top_k)
+        context = self._retriever.format_context(retrieval_result)
 
         # 2. 프롬프트 생성
         if history:
@@ -205,4 +209,22 @@ class RAGChain:
             max_tokens=max_tokens,
         )
 
-        return retrieval_result, generator
+        return retrieval_result, self._collect_stream(generator, retrieval_result)
+
+    def _collect_stream(
+        self,
+        generator: Iterator[str],
+        retrieval_result: RetrievalResult,
+    ) -> Generator[str, None, RAGResponse]:
+        """청크를 그대로 전달하면서 모아 두었다가 최종 RAGResponse 반환"""
+        parts: List[str] = []
+        for chunk in generator:
+            parts.append(chunk)
+            yield chunk
+
+        return RAGResponse(
+            answer="".join(parts),
+            retrieval_result=retrieval_result,
+            model=self._llm.model_name,
+            usage=getattr(self._llm, "_last_stream_usage", None) or {},
+        )
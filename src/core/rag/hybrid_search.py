@@ -4,22 +4,56 @@ Hybrid Search Module
 Dense (Vector) + Sparse (BM25) 하이브리드 검색 구현.
 """
 
+import heapq
+import logging
+import os
+import pickle
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Protocol
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Protocol, Sequence, Union
+
+import numpy as np
+
+from core.rag.query_cache import QueryCache
 
 if TYPE_CHECKING:
     from db.chroma_store import ChromaStore
 
+logger = logging.getLogger(__name__)
+
 
 class _BM25Like(Protocol):
-    def get_scores(self, query: list[str]) -> list[float]: ...
+    def get_scores(self, query: list[str]) -> Union[Sequence[float], np.ndarray]: ...
 
 
 class _BM25OkapiCtor(Protocol):
     def __call__(self, corpus: list[list[str]]) -> _BM25Like: ...
 
 
-@dataclass
+class _BM25sIndex:
+    """
+    bm25s 인덱스를 BM25Okapi와 같은 인터페이스로 감싼 어댑터.
+
+    bm25s는 점수 계산을 scipy.sparse/NumPy로 수행하므로 rank-bm25의
+    문서별 Python 루프보다 쿼리당 수백 배 빠릅니다. 토큰화는 HybridSearcher의
+    _tokenize 결과를 그대로 사용합니다. 점수식은 lucene 변형으로, IDF가 음수가 되지 않아
+    (BM25Okapi의 epsilon 하한과 유사) 흔한 단어가 점수를 깎지 않습니다.
+    """
+
+    def __init__(self, corpus: list[list[str]]):
+        import bm25s
+
+        self._doc_count = len(corpus)
+        self._index = bm25s.BM25(method="lucene")
+        self._index.index(corpus, show_progress=False)
+
+    def get_scores(self, query: list[str]) -> np.ndarray:
+        if not query:
+            return np.zeros(self._doc_count, dtype=np.float64)
+        return self._index.get_scores(query)
+
+
+@dataclass(slots=True)
 class HybridSearchResult:
     id: str
     text: str
@@ -37,13 +71,38 @@ class HybridSearcher:
         searcher = HybridSearcher(vector_store)
         searcher.index_documents(documents, ids)
         results = searcher.search("검색어", top_k=10)
+
+        # 증분 갱신 (변경된 문서만 새 세그먼트로 인덱싱)
+        searcher.add_documents(changed_documents, changed_ids)
+        searcher.remove_documents(deleted_ids)
+
+    BM25 인덱스는 기본 세그먼트(index_documents/compact) + 증분 세그먼트(add_documents)로
+    구성됩니다. 세그먼트마다 IDF 통계가 따로 계산되므로 세그먼트가 MAX_SEGMENTS를
+    넘으면 살아있는 문서로 기본 세그먼트를 다시 만듭니다(compact).
+
+    cache_dir를 지정하면 save() 또는 compact() 시 인덱스를 파일로 저장하고, 다음 프로세스
+    시작 시 vector_store가 저장 이후 바뀌지 않았으면 재인덱싱 없이 불러옵니다.
+    파일이 손상되었으면 vector_store의 문서로 다시 인덱싱합니다.
+
+        searcher = HybridSearcher(vector_store, cache_dir="./.cache")
+        if not searcher.is_indexed:
+            searcher.index_documents(documents, ids)
+            searcher.save()
     """
 
+    # 증분 세그먼트 최대 개수 (초과 시 compact)
+    MAX_SEGMENTS = 8
+    # cache_dir 내 인덱스 파일명 / 포맷 버전 (필드 구성이 바뀌면 올림)
+    INDEX_FILENAME = "bm25_index.pkl"
+    INDEX_FORMAT_VERSION = 1
+
     def __init__(
         self,
         vector_store: "ChromaStore",
         dense_weight: float = 0.7,
         sparse_weight: float = 0.3,
+        cache: Optional[QueryCache] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
     ):
         if not (0 <= dense_weight <= 1 and 0 <= sparse_weight <= 1):
             raise ValueError("Weights must be between 0 and 1")
@@ -54,82 +113,352 @@ class HybridSearcher:
         self._dense_weight = dense_weight
         self._sparse_weight = sparse_weight
         self._bm25: Optional[_BM25Like] = None
+        # add_documents()로 추가된 세그먼트 (문서 위치는 _bm25 뒤에 순서대로 이어짐)
+        self._segments: List[_BM25Like] = []
+        # 삭제/갱신되어 검색에서 제외할 문서 위치 (None이면 전부 유효)
+        self._deleted: Optional[np.ndarray] = None
+        # remove_documents()로 제거된 id (vector_store에 남아 있어도 결과에서 제외)
+        self._removed_ids: set[str] = set()
         self._documents: List[str] = []
         self._doc_ids: List[str] = []
+        # doc_id -> _documents 인덱스 (index_documents()에서 한 번 구축)
+        self._id_to_idx: Optional[Dict[str, int]] = None
+        # 검색 결과 캐시 (재인덱싱 또는 vector_store 변경 시 무효화)
+        self._cache = cache
+        self._index_version = 0
+        # 인덱스 영속화 경로 (None이면 메모리에만 유지)
+        self._index_path = (
+            Path(cache_dir) / self.INDEX_FILENAME if cache_dir is not None else None
+        )
+        if self._index_path is not None and self._index_path.exists():
+            try:
+                self.load(self._index_path, require_fresh=True)
+            except (pickle.UnpicklingError, EOFError, ImportError, AttributeError, OSError) as exc:
+                logger.warning("BM25 인덱스 로드 실패 (%s): %s", self._index_path, exc)
+                self._rebuild_from_store()
 
     def _load_bm25(self) -> _BM25OkapiCtor:
+        # bm25s(벡터화 구현)가 설치되어 있으면 우선 사용
+        try:
+            import bm25s  # noqa: F401
+
+            return _BM25sIndex
+        except ImportError:
+            pass
+
         try:
             from rank_bm25 import BM25Okapi
 
             return BM25Okapi
         except ImportError as exc:
             raise ImportError(
-                "rank-bm25 패키지가 필요합니다. 설치: pip install rank-bm25"
+                "rank-bm25 패키지가 필요합니다. 설치: pip install rank-bm25 "
+                "(또는 더 빠른 pip install bm25s)"
             ) from exc
 
     def _tokenize(self, text: str) -> list[str]:
         return text.lower().split()
 
+    @staticmethod
+    def _build_id_index(ids: List[str]) -> Dict[str, int]:
+        # 중복 id는 list.index()와 동일하게 첫 번째 위치를 사용
+        id_to_idx: Dict[str, int] = {}
+        for i, doc_id in enumerate(ids):
+            id_to_idx.setdefault(doc_id, i)
+        return id_to_idx
+
     def index_documents(self, documents: List[str], ids: List[str]) -> None:
+        self._reset_index(documents, ids)
+
+    def _reset_index(self, documents: List[str], ids: List[str]) -> None:
         if len(documents) != len(ids):
             raise ValueError("documents와 ids 길이가 일치해야 합니다")
 
-        self._documents = documents
-        self._doc_ids = ids
+        self._documents = list(documents)
+        self._doc_ids = list(ids)
+        self._id_to_idx = self._build_id_index(ids)
+        self._segments = []
+        self._deleted = None
+        self._removed_ids = set()
+        self._index_version += 1
 
-        BM25Okapi = self._load_bm25()
-        tokenized = [self._tokenize(doc) for doc in documents]
-        self._bm25 = BM25Okapi(tokenized)
+        self._bm25 = self._build_segment(documents)
 
-    def search(self, query: str, top_k: int = 10) -> List[HybridSearchResult]:
+    def add_documents(self, documents: List[str], ids: List[str]) -> None:
+        """
+        문서를 새 세그먼트로 추가 (기존 문서는 다시 토큰화하지 않음).
+
+        이미 인덱싱된 id는 이전 위치를 삭제 처리하고 새 내용으로 대체합니다.
+        """
+        if len(documents) != len(ids):
+            raise ValueError("documents와 ids 길이가 일치해야 합니다")
         if self._bm25 is None:
-            raise RuntimeError("index_documents()를 먼저 호출하세요")
+            self.index_documents(documents, ids)
+            return
+        if not documents:
+            return
+
+        id_to_idx = self._ensure_id_index()
+        self._mark_deleted([id_to_idx[i] for i in ids if i in id_to_idx])
+
+        offset = len(self._documents)
+        self._segments.append(self._build_segment(documents))
+        self._documents.extend(documents)
+        self._doc_ids.extend(ids)
+        for i, doc_id in enumerate(ids):
+            id_to_idx[doc_id] = offset + i
+        self._removed_ids.difference_update(ids)
+        if self._deleted is not None:
+            self._deleted = np.concatenate(
+                [self._deleted, np.zeros(len(documents), dtype=bool)]
+            )
+        self._index_version += 1
 
-        dense_results = self._vector_store.query(query, n_results=top_k * 2)
-        dense_scores = {
-            r["id"]: 1 / (1 + r["distance"]) if r["distance"] else 0.0
-            for r in dense_results
+        if len(self._segments) > self.MAX_SEGMENTS:
+            self.compact()
+
+    def remove_documents(self, ids: List[str]) -> None:
+        """문서를 검색 대상에서 제외 (실제 제거는 compact 시 수행)"""
+        if self._bm25 is None:
+            return
+        id_to_idx = self._ensure_id_index()
+        positions = [id_to_idx.pop(i) for i in ids if i in id_to_idx]
+        self._removed_ids.update(ids)
+        if positions:
+            self._mark_deleted(positions)
+            self._index_version += 1
+
+    def compact(self) -> None:
+        """삭제된 문서를 정리하고 모든 세그먼트를 하나의 기본 세그먼트로 합침"""
+        if self._bm25 is None or (not self._segments and self._deleted is None):
+            return
+        id_to_idx = self._ensure_id_index()
+        live = sorted(id_to_idx.values())
+        removed_ids = self._removed_ids
+        self._reset_index(
+            [self._documents[i] for i in live], [self._doc_ids[i] for i in live]
+        )
+        self._removed_ids = removed_ids
+        self._persist()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> None:
+        """
+        BM25 인덱스(세그먼트, 문서, id 매핑, 삭제 표시)를 파일로 저장.
+
+        임시 파일에 쓴 뒤 교체하므로 저장 도중 중단되어도 기존 파일은 유지됩니다.
+
+        Args:
+            path: 저장 경로 (None이면 cache_dir의 인덱스 파일)
+        """
+        if self._bm25 is None:
+            raise RuntimeError("index_documents()를 먼저 호출하세요")
+        if path is None:
+            if self._index_path is None:
+                raise ValueError("path 또는 cache_dir가 필요합니다")
+            path = self._index_path
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            "format": self.INDEX_FORMAT_VERSION,
+            "fingerprint": self._store_fingerprint(),
+            "documents": self._documents,
+            "doc_ids": self._doc_ids,
+            "id_to_idx": self._ensure_id_index(),
+            "bm25": self._bm25,
+            "segments": self._segments,
+            "deleted": self._deleted,
+            "removed_ids": self._removed_ids,
         }
-        dense_texts = {r["id"]: r["text"] for r in dense_results}
-        dense_metadata = {r["id"]: r["metadata"] for r in dense_results}
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def load(self, path: Union[str, Path], require_fresh: bool = False) -> bool:
+        """
+        save()로 저장한 인덱스 로드 (index_documents() 생략).
+
+        Args:
+            path: 인덱스 파일 경로
+            require_fresh: True면 저장 이후 vector_store가 변경되었을 때 로드하지 않음
+
+        Returns:
+            로드 여부 (포맷 버전이 다르거나 fresh하지 않으면 False)
+        """
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+
+        if state.get("format") != self.INDEX_FORMAT_VERSION:
+            return False
+        if require_fresh and state.get("fingerprint") != self._store_fingerprint():
+            return False
+
+        self._documents = state["documents"]
+        self._doc_ids = state["doc_ids"]
+        self._id_to_idx = state["id_to_idx"]
+        self._bm25 = state["bm25"]
+        self._segments = state["segments"]
+        self._deleted = state["deleted"]
+        self._removed_ids = state["removed_ids"]
+        self._index_version += 1
+        return True
+
+    def _persist(self) -> None:
+        if self._index_path is not None and self._bm25 is not None:
+            self.save(self._index_path)
+
+    def _rebuild_from_store(self) -> None:
+        # 저장된 인덱스를 쓸 수 없을 때 vector_store의 문서로 다시 인덱싱
+        get_documents = getattr(self._vector_store, "get_documents", None)
+        if get_documents is None:
+            return
+        documents, ids = get_documents()
+        if documents:
+            self.index_documents(documents, ids)
+            self._persist()
+
+    def _store_fingerprint(self) -> Optional[tuple]:
+        """vector_store 상태 요약 (컬렉션명, 문서 수, 쓰기 표시). 알 수 없으면 None"""
+        get_stats = getattr(self._vector_store, "get_stats", None)
+        if get_stats is None:
+            return None
+        try:
+            stats = get_stats()
+            return (str(stats["name"]), int(stats["count"]), stats.get("write_stamp"))
+        except Exception:
+            return None
 
-        tokenized_query = self._tokenize(query)
-        bm25_scores_raw = self._bm25.get_scores(tokenized_query)
+    def _build_segment(self, documents: List[str]) -> _BM25Like:
+        BM25Okapi = self._load_bm25()
+        tokenized = [self._tokenize(doc) for doc in documents]
+        return BM25Okapi(tokenized)
 
-        max_bm25 = max(bm25_scores_raw) if max(bm25_scores_raw) > 0 else 1.0
-        sparse_scores = {
-            self._doc_ids[i]: score / max_bm25
-            for i, score in enumerate(bm25_scores_raw)
-        }
+    def _ensure_id_index(self) -> Dict[str, int]:
+        if self._id_to_idx is None:
+            self._id_to_idx = self._build_id_index(self._doc_ids)
+        return self._id_to_idx
 
-        all_ids = set(dense_scores.keys()) | set(sparse_scores.keys())
-        combined: List[HybridSearchResult] = []
+    def _mark_deleted(self, positions: List[int]) -> None:
+        if not positions:
+            return
+        if self._deleted is None:
+            self._deleted = np.zeros(len(self._documents), dtype=bool)
+        self._deleted[positions] = True
+
+    def search(self, query: str, top_k: int = 10) -> List[HybridSearchResult]:
+        if self._bm25 is None:
+            raise RuntimeError("index_documents()를 먼저 호출하세요")
 
-        for doc_id in all_ids:
-            d_score = dense_scores.get(doc_id, 0.0)
-            s_score = sparse_scores.get(doc_id, 0.0)
-            final_score = self._dense_weight * d_score + self._sparse_weight * s_score
+        if self._cache is None:
+            return self._search(query, top_k)
 
-            text = dense_texts.get(doc_id, "")
-            metadata = dense_metadata.get(doc_id, {})
+        key = QueryCache.make_key(query, top_k)
+        version = (self._index_version, getattr(self._vector_store, "version", None))
+        cached = self._cache.get(key, version=version)
+        if cached is None:
+            cached = self._search(query, top_k)
+            self._cache.put(key, cached, version=version)
+        return list(cached)
+
+    def _search(self, query: str, top_k: int) -> List[HybridSearchResult]:
+        dense_results = self._vector_store.query(query, n_results=top_k * 2)
+        # 한 번의 순회로 점수 계산, text/metadata는 최종 결과 생성 시에만 꺼냄
+        dense_index: Dict[str, tuple[float, Dict[str, Any]]] = {}
+        for r in dense_results:
+            distance = r["distance"]
+            dense_index[r["id"]] = (1 / (1 + distance) if distance else 0.0, r)
 
-            if not text and doc_id in self._doc_ids:
-                idx = self._doc_ids.index(doc_id)
-                text = self._documents[idx]
+        id_to_idx = self._id_to_idx
+        if id_to_idx is None:
+            id_to_idx = self._build_id_index(self._doc_ids)
 
+        # 코퍼스 전체 점수는 배열 연산으로 정규화/결합 (문서별 Python 루프 없음)
+        tokenized_query = self._tokenize(query)
+        sparse_vec = np.asarray(
+            self._bm25.get_scores(tokenized_query), dtype=np.float64
+        )
+        if self._segments:
+            sparse_vec = np.concatenate(
+                [sparse_vec]
+                + [
+                    np.asarray(seg.get_scores(tokenized_query), dtype=np.float64)
+                    for seg in self._segments
+                ]
+            )
+        deleted = self._deleted
+        if deleted is not None:
+            sparse_vec[deleted] = 0.0
+        max_raw = float(sparse_vec.max()) if sparse_vec.size else 0.0
+        if max_raw > 0:
+            sparse_vec = sparse_vec / max_raw
+
+        final = self._sparse_weight * sparse_vec
+        dense_only: List[str] = []
+        for doc_id, (d_score, _) in dense_index.items():
+            idx = id_to_idx.get(doc_id)
+            if idx is None:
+                if doc_id not in self._removed_ids:
+                    dense_only.append(doc_id)
+            else:
+                final[idx] += self._dense_weight * d_score
+        live_count = final.size
+        if deleted is not None:
+            final[deleted] = -np.inf
+            live_count -= int(deleted.sum())
+
+        # 전체 정렬 대신 argpartition으로 상위 top_k 후보만 선택 (O(N))
+        # 삭제된 위치는 -inf이므로 k를 살아있는 문서 수로 제한하면 선택되지 않음
+        k = max(0, min(top_k, live_count))
+        if k == 0:
+            top_idx = np.empty(0, dtype=np.intp)
+        elif k < final.size:
+            top_idx = np.argpartition(final, -k)[-k:]
+        else:
+            top_idx = np.arange(final.size)
+
+        # HybridSearchResult는 후보에 대해서만 생성
+        combined: List[HybridSearchResult] = []
+        for idx in top_idx.tolist():
+            doc_id = self._doc_ids[idx]
+            dense = dense_index.get(doc_id)
+            if dense is None:
+                d_score, text, metadata = 0.0, self._documents[idx], {}
+            else:
+                d_score, r = dense
+                text = r["text"] or self._documents[idx]
+                metadata = r["metadata"]
             combined.append(
                 HybridSearchResult(
                     id=doc_id,
                     text=text,
                     metadata=metadata,
-                    score=final_score,
+                    score=float(final[idx]),
+                    dense_score=d_score,
+                    sparse_score=float(sparse_vec[idx]),
+                )
+            )
+
+        # BM25 인덱스에 없는 dense 결과 (인덱싱 이후 추가된 문서 등)
+        for doc_id in dense_only:
+            d_score, r = dense_index[doc_id]
+            combined.append(
+                HybridSearchResult(
+                    id=doc_id,
+                    text=r["text"],
+                    metadata=r["metadata"],
+                    score=self._dense_weight * d_score,
                     dense_score=d_score,
-                    sparse_score=s_score,
+                    sparse_score=0.0,
                 )
             )
 
-        combined.sort(key=lambda x: x.score, reverse=True)
-        return combined[:top_k]
+        # 후보(top_k + dense 전용)에서 최종 top_k만 힙으로 선택 (동점은 먼저 나온 순서 유지)
+        return heapq.nlargest(top_k, combined, key=lambda x: x.score)
 
     @property
     def is_indexed(self) -> bool:
@@ -137,4 +466,6 @@ class HybridSearcher:
 
     @property
     def document_count(self) -> int:
-        return len(self._documents)
+        if self._deleted is None:
+            return len(self._documents)
+        return len(self._documents) - int(self._deleted.sum())
@@ -4,8 +4,9 @@ PromptBuilder Module
 Retrieved context를 LLM 프롬프트에 주입하는 템플릿 빌더.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from string import Formatter
+from typing import List, Optional, Tuple
 
 from core.llm.strategy import Message
 
@@ -14,7 +15,7 @@ from core.llm.strategy import Message
 # Data Classes
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PromptTemplate:
     """프롬프트 템플릿 정의"""
 
@@ -26,6 +27,49 @@ class PromptTemplate:
     context_intro: str = "다음은 관련 문서에서 검색된 내용입니다:"
     no_context_message: str = "관련 문서를 찾지 못했습니다."
 
+    # user_template을 미리 분해한 (리터럴, 필드명) 목록 (render 전용 캐시)
+    _parts: Optional[Tuple[Tuple[str, Optional[str]], ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _parts_source: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    _FIELDS = frozenset({"question", "context_section"})
+
+    def render(self, question: str, context_section: str) -> str:
+        """
+        user_template.format(question=..., context_section=...)과 같은 결과를 반환.
+
+        템플릿은 처음 한 번만 파싱하고 이후에는 문자열 join만 수행합니다.
+        변환/포맷 지정자나 알 수 없는 필드가 있으면 str.format을 그대로 사용합니다.
+        """
+        if self._parts_source is not self.user_template:
+            self._parts = self._compile(self.user_template)
+            self._parts_source = self.user_template
+
+        if self._parts is None:
+            return self.user_template.format(
+                question=question, context_section=context_section
+            )
+
+        values = {"question": question, "context_section": context_section}
+        out: List[str] = []
+        for literal, name in self._parts:
+            out.append(literal)
+            if name is not None:
+                out.append(values[name])
+        return "".join(out)
+
+    @classmethod
+    def _compile(cls, template: str) -> Optional[Tuple[Tuple[str, Optional[str]], ...]]:
+        parts = []
+        for literal, name, spec, conversion in Formatter().parse(template):
+            if name is not None and (name not in cls._FIELDS or spec or conversion):
+                return None
+            parts.append((literal, name))
+        return tuple(parts)
+
 
 # ============================================================================
 # Default Templates
@@ -107,10 +151,7 @@ class PromptBuilder:
             system_content += f"\n\n{additional_context}"
 
         # 사용자 메시지
-        user_content = self._template.user_template.format(
-            question=question,
-            context_section=context_section,
-        )
+        user_content = self._template.render(question, context_section)
 
         return [
             {"role": "system", "content": system_content},
@@ -148,10 +189,7 @@ class PromptBuilder:
         else:
             context_section = ""
 
-        current_content = self._template.user_template.format(
-            question=question,
-            context_section=context_section,
-        )
+        current_content = self._template.render(question, context_section)
         messages.append({"role": "user", "content": current_content})
 
         return messages
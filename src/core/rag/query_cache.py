@@ -0,0 +1,187 @@
+"""
+Query Cache Module
+
+검색 결과를 정규화된 쿼리 문자열 기준으로 캐시합니다.
+채팅 세션처럼 같은 질문(또는 거의 같은 질문)이 반복될 때
+임베딩 + 벡터 검색(또는 BM25 점수 계산)을 생략합니다.
+
+- 정확 일치: (정규화 쿼리, top_k, 필터 ...) 키로 LRU 조회
+- 근사 일치(선택): 쿼리 임베딩의 코사인 유사도가 임계값 이상인 항목 재사용
+- 저장소 버전이 바뀌면(문서 추가/삭제) 캐시 전체 무효화
+- ttl초가 지난 항목은 만료 (다른 프로세스의 쓰기 등 버전으로 감지할 수 없는 변경 대비)
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 캐시 항목 기본 유효 시간 (초)
+DEFAULT_TTL = 300.0
+
+
+class QueryCache:
+    """
+    쿼리 결과 LRU 캐시 (스레드 안전).
+
+    사용법:
+        cache = QueryCache(maxsize=1024, ttl=300)
+        key = QueryCache.make_key("What is RAG?", 5)
+        result = cache.get(key, version=store.version)
+        if result is None:
+            result = search(...)
+            cache.put(key, result, version=store.version)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        similarity_threshold: Optional[float] = None,
+        ttl: Optional[float] = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            maxsize: 최대 캐시 항목 수
+            similarity_threshold: 근사 일치 코사인 유사도 임계값 (None이면 정확 일치만)
+            ttl: 항목 유효 시간 (초, None이면 만료 없음)
+        """
+        self.maxsize = maxsize
+        self.similarity_threshold = similarity_threshold
+        self.ttl = ttl
+        self._clock = clock
+        # key -> (value, 정규화된 쿼리 임베딩 or None, 저장 시각)
+        self._entries: OrderedDict[
+            Tuple, Tuple[Any, Optional[np.ndarray], float]
+        ] = OrderedDict()
+        self._version: Optional[Hashable] = None
+        self._lock = threading.Lock()
+
+    @property
+    def semantic(self) -> bool:
+        """근사 일치(임베딩 비교) 사용 여부"""
+        return self.similarity_threshold is not None
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """대소문자/공백 차이를 무시하도록 쿼리 정규화"""
+        return " ".join(query.lower().split())
+
+    @classmethod
+    def make_key(cls, query: str, *params: Any) -> Tuple:
+        """
+        캐시 키 생성.
+
+        Args:
+            query: 검색 쿼리
+            *params: 결과에 영향을 주는 나머지 인자 (top_k, where 등).
+                     dict는 중첩될 수 있으므로 정렬된 JSON 문자열로 변환합니다.
+
+        Returns:
+            (정규화 쿼리, *params) 튜플
+        """
+        return (cls.normalize_query(query),) + tuple(
+            json.dumps(p, sort_keys=True, default=str) if isinstance(p, (dict, list)) else p
+            for p in params
+        )
+
+    def get(
+        self,
+        key: Tuple,
+        embedding: Optional[Sequence[float]] = None,
+        version: Optional[Hashable] = None,
+    ) -> Optional[Any]:
+        """
+        캐시 조회.
+
+        Args:
+            key: make_key() 결과
+            embedding: 쿼리 임베딩 (근사 일치 조회용)
+            version: 저장소 버전 (이전 조회와 다르면 캐시를 비우고 miss)
+
+        Returns:
+            캐시된 값 (없으면 None)
+        """
+        vec = self._unit(embedding)
+        with self._lock:
+            self._sync_version(version)
+            self._expire()
+
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+
+            if vec is None or not self.semantic:
+                return None
+
+            # 근사 일치: 쿼리 외 인자(top_k, 필터)가 같은 항목만 비교
+            best_key = None
+            best_sim = self.similarity_threshold
+            for cached_key, (_, cached_vec, _) in self._entries.items():
+                if cached_vec is None or cached_key[1:] != key[1:]:
+                    continue
+                if cached_vec.shape != vec.shape:
+                    continue
+                sim = float(np.dot(cached_vec, vec))
+                if sim >= best_sim:
+                    best_key, best_sim = cached_key, sim
+
+            if best_key is None:
+                return None
+            self._entries.move_to_end(best_key)
+            return self._entries[best_key][0]
+
+    def put(
+        self,
+        key: Tuple,
+        value: Any,
+        embedding: Optional[Sequence[float]] = None,
+        version: Optional[Hashable] = None,
+    ) -> None:
+        """캐시 저장 (maxsize 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+        vec = self._unit(embedding) if self.semantic else None
+        with self._lock:
+            self._sync_version(version)
+            self._entries[key] = (value, vec, self._clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """전체 캐시 제거"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expire(self) -> None:
+        # lock을 잡은 상태에서 호출. LRU 순서와 저장 시각 순서가 다르므로 전체 순회
+        if self.ttl is None:
+            return
+        deadline = self._clock() - self.ttl
+        expired = [k for k, (_, _, stored_at) in self._entries.items() if stored_at <= deadline]
+        for k in expired:
+            del self._entries[k]
+
+    def _sync_version(self, version: Optional[Hashable]) -> None:
+        # lock을 잡은 상태에서 호출
+        if version != self._version:
+            self._entries.clear()
+            self._version = version
+
+    @staticmethod
+    def _unit(embedding: Optional[Sequence[float]]) -> Optional[np.ndarray]:
+        """코사인 유사도를 내적으로 계산할 수 있도록 단위 벡터로 변환"""
+        if embedding is None:
+            return None
+        vec = np.asarray(embedding, dtype=np.float64).ravel()
+        norm = float(np.linalg.norm(vec))
+        if norm == 0.0:
+            return None
+        return vec / norm
+
@@ -5,21 +5,34 @@ Cross-Encoder 기반 재순위화로 검색 정밀도 향상.
 """
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, List, Optional, Protocol
+from typing import TYPE_CHECKING, Any, List, Optional, Protocol, Sequence, Union
+
+import numpy as np
 
 if TYPE_CHECKING:
     from .retriever import Retriever, RetrievalResult, RetrievedChunk
 
 
 class _CrossEncoderLike(Protocol):
-    def predict(self, pairs: list[tuple[str, str]]) -> list[float]: ...
+    def predict(
+        self, pairs: list[tuple[str, str]], **kwargs: Any
+    ) -> Union[Sequence[float], np.ndarray]: ...
 
 
 class _CrossEncoderCtor(Protocol):
-    def __call__(self, model_name: str) -> _CrossEncoderLike: ...
+    def __call__(self, model_name: str, **kwargs: Any) -> _CrossEncoderLike: ...
+
+
+def _detect_device() -> Optional[str]:
+    """CUDA 사용 가능하면 "cuda", 아니면 None (CrossEncoder 기본값 사용)"""
+    try:
+        import torch
+    except ImportError:
+        return None
+    return "cuda" if torch.cuda.is_available() else None
 
 
-@dataclass
+@dataclass(slots=True)
 class RankedDocument:
     text: str
     score: float
@@ -36,12 +49,34 @@ class Reranker:
     사용법:
         reranker = Reranker()
         ranked = reranker.rerank("검색어", ["문서1", "문서2", ...], top_k=5)
+
+        # GPU 강제 지정 / 입력 길이 제한 / half precision
+        reranker = Reranker(device="cuda", max_length=256, fp16=True)
     """
 
     DEFAULT_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
 
-    def __init__(self, model_name: str = DEFAULT_MODEL):
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL,
+        batch_size: int = 32,
+        device: Optional[str] = None,
+        max_length: Optional[int] = None,
+        fp16: bool = False,
+    ):
+        """
+        Args:
+            model_name: HuggingFace Cross-Encoder 모델 ID
+            batch_size: predict 배치 크기
+            device: 실행 디바이스 (None이면 CUDA 사용 가능 시 "cuda")
+            max_length: 최대 입력 토큰 길이 (None이면 모델 기본값)
+            fp16: CUDA에서 half precision 추론 사용 여부 (점수가 미세하게 달라질 수 있어 opt-in)
+        """
         self._model_name = model_name
+        self._batch_size = batch_size
+        self._device = device
+        self._max_length = max_length
+        self._fp16 = fp16
         self._model: Optional[_CrossEncoderLike] = None
 
     def _load_model(self) -> None:
@@ -49,13 +84,24 @@ class Reranker:
             return
         try:
             from sentence_transformers import CrossEncoder
-
-            self._model = CrossEncoder(self._model_name)
         except ImportError as exc:
             raise ImportError(
                 "sentence-transformers 패키지가 필요합니다. 설치: pip install sentence-transformers"
             ) from exc
 
+        device = self._device or _detect_device()
+        kwargs: dict[str, Any] = {}
+        if device is not None:
+            kwargs["device"] = device
+        if self._max_length is not None:
+            kwargs["max_length"] = self._max_length
+        model = CrossEncoder(self._model_name, **kwargs)
+
+        if self._fp16 and device is not None and device.startswith("cuda"):
+            # 내부 transformers 모델만 half로 변환 (tokenizer/activation은 그대로)
+            model.model.half()
+        self._model = model
+
     def rerank(
         self,
         query: str,
@@ -69,14 +115,33 @@ class Reranker:
         assert self._model is not None
 
         pairs = [(query, doc) for doc in documents]
-        scores = self._model.predict(pairs)
-
-        ranked = [
-            RankedDocument(text=doc, score=float(score), original_index=i)
-            for i, (doc, score) in enumerate(zip(documents, scores))
+        scores = np.asarray(
+            self._model.predict(
+                pairs,
+                batch_size=self._batch_size,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+            ),
+            dtype=np.float64,
+        ).ravel()
+
+        # 전체 정렬 대신 k번째 점수 이상인 후보만 골라 그 안에서만 정렬
+        # (argpartition은 경계 동점 중 임의의 것을 고르므로 경계 점수의 동점은 모두 후보에 포함)
+        k = max(0, min(top_k, scores.size))
+        if k == 0:
+            return []
+        candidates = np.arange(scores.size)
+        if k < scores.size:
+            kth_score = -np.partition(-scores, k - 1)[k - 1]
+            if not np.isnan(kth_score):
+                candidates = np.flatnonzero(scores >= kth_score)
+        # 동점은 원래 순서 유지 (stable)
+        top_idx = candidates[np.argsort(-scores[candidates], kind="stable")][:k]
+
+        return [
+            RankedDocument(text=documents[i], score=float(scores[i]), original_index=i)
+            for i in top_idx.tolist()
         ]
-        ranked.sort(key=lambda x: x.score, reverse=True)
-        return ranked[:top_k]
 
     @property
     def model_name(self) -> str:
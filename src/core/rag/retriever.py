@@ -7,17 +7,16 @@ Retriever Module
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# core와 db는 같은 소스 루트(src)의 최상위 패키지 (uvicorn --app-dir src, pytest rootdir)
 from db.chroma_store import ChromaStore
+from core.rag.query_cache import QueryCache
 
 
 # ============================================================================
 # Data Classes
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class RetrievedChunk:
     """검색된 청크 정보를 담는 데이터클래스."""
 
@@ -28,7 +27,7 @@ class RetrievedChunk:
     score: float             # 유사도 점수 (0~1, 높을수록 유사)
 
 
-@dataclass
+@dataclass(slots=True)
 class RetrievalResult:
     """검색 결과 전체를 담는 데이터클래스."""
 
@@ -65,14 +64,20 @@ class Retriever:
             top_k=3,
             where={"folder_path": {"$contains": "programming"}}
         )
+
+        # 반복/유사 쿼리 캐시
+        retriever = Retriever(store, cache=QueryCache(similarity_threshold=0.98))
     """
 
-    def __init__(self, store: ChromaStore):
+    def __init__(self, store: ChromaStore, cache: Optional[QueryCache] = None):
         """
         Args:
             store: ChromaDB 벡터 스토어 인스턴스
+            cache: 검색 결과 캐시 (None이면 캐시하지 않음).
+                   store.version이 바뀌면(문서 추가/삭제) 자동으로 비워집니다.
         """
         self._store = store
+        self._cache = cache
 
     def retrieve(
         self,
@@ -93,25 +98,70 @@ class Retriever:
         Returns:
             RetrievalResult 객체 (검색된 청크 목록 포함)
         """
+        cache = self._cache
+        if cache is None:
+            return self._search(query, top_k, where, where_document)
+
+        key = QueryCache.make_key(query, top_k, where, where_document)
+        version = getattr(self._store, "version", None)
+        embedding = None
+
+        cached = cache.get(key, version=version)
+        if cached is None and cache.semantic:
+            # 근사 일치 조회용 임베딩은 miss 시 검색에도 그대로 재사용
+            embedding = self._store.embed_query(query)
+            cached = cache.get(key, embedding, version)
+
+        if cached is not None:
+            return RetrievalResult(
+                query=query,
+                chunks=list(cached.chunks),
+                total_count=cached.total_count,
+            )
+
+        result = self._search(query, top_k, where, where_document, embedding)
+        cache.put(key, result, embedding, version)
+        return RetrievalResult(
+            query=query,
+            chunks=list(result.chunks),
+            total_count=result.total_count,
+        )
+
+    def _search(
+        self,
+        query: str,
+        top_k: int,
+        where: Optional[Dict[str, Any]],
+        where_document: Optional[Dict[str, Any]],
+        embedding: Optional[List[float]] = None,
+    ) -> RetrievalResult:
+        """ChromaStore 검색 후 RetrievalResult로 변환 (캐시 미사용)"""
+        query_kwargs: Dict[str, Any] = {}
+        if embedding is not None:
+            query_kwargs["query_embedding"] = embedding
+
         # ChromaStore.query() 호출
         raw_results = self._store.query(
             query_text=query,
             n_results=top_k,
             where=where,
             where_document=where_document,
+            **query_kwargs,
         )
 
-        # 결과 변환
-        chunks = [
-            RetrievedChunk(
-                id=r["id"],
-                text=r["text"] or "",
-                metadata=r["metadata"] or {},
-                distance=r["distance"] or 0.0,
-                score=self._distance_to_score(r["distance"]),
+        # 결과 변환 (점수 변환식은 _distance_to_score와 동일, 청크당 호출/조회를 줄이려 인라인)
+        chunks: List[RetrievedChunk] = []
+        for r in raw_results:
+            distance = r["distance"]
+            chunks.append(
+                RetrievedChunk(
+                    r["id"],
+                    r["text"] or "",
+                    r["metadata"] or {},
+                    distance or 0.0,
+                    0.0 if distance is None else 1.0 / (1.0 + distance),
+                )
             )
-            for r in raw_results
-        ]
 
         return RetrievalResult(
             query=query,
@@ -150,18 +200,32 @@ class Retriever:
             포맷팅된 컨텍스트 문자열
         """
         result = self.retrieve(query, top_k=top_k)
+        return self.format_context(result, context_format)
 
+    @staticmethod
+    def format_context(
+        result: RetrievalResult,
+        context_format: str = "numbered",
+    ) -> str:
+        """
+        이미 수행한 검색 결과를 컨텍스트 문자열로 포맷팅 (재검색 없음).
+
+        Args:
+            result: retrieve() 결과
+            context_format: "numbered" | "simple"
+
+        Returns:
+            포맷팅된 컨텍스트 문자열
+        """
         if not result.chunks:
             return ""
 
         if context_format == "numbered":
-            lines = []
-            for i, chunk in enumerate(result.chunks, 1):
-                source = chunk.metadata.get("source", "unknown")
-                lines.append(f"[{i}] Source: {source}")
-                lines.append(chunk.text)
-                lines.append("")
-            return "\n".join(lines).strip()
+            # 청크당 문자열 하나만 만들고 마지막에 한 번 join
+            return "\n\n".join([
+                f"[{i}] Source: {chunk.metadata.get('source', 'unknown')}\n{chunk.text}"
+                for i, chunk in enumerate(result.chunks, 1)
+            ]).strip()
 
         else:  # simple
             return "\n\n---\n\n".join(c.text for c in result.chunks)
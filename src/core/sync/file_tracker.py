@@ -10,19 +10,51 @@ import os
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set
+
+# 선택적 고속 해시 (설치되어 있으면 MD5 대신 사용)
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+# ============================================================================
+# Hash Algorithms
+# ============================================================================
+
+# 레지스트리에 알고리즘 필드가 없던 시절의 기본값
+LEGACY_HASH_ALGO = "md5"
+
+# 변경 감지용 콘텐츠 지문 (암호학적 강도 불필요). 모두 32자 hex로 맞춤
+_HASH_FACTORIES: Dict[str, Callable[[], Any]] = {"md5": hashlib.md5}
+if xxhash is not None:
+    _HASH_FACTORIES["xxh3_128"] = xxhash.xxh3_128
+if blake3 is not None:
+    # 파일 단위 병렬화(IncrementalSyncer)와 겹치지 않도록 단일 스레드 해시
+    _HASH_FACTORIES["blake3"] = blake3.blake3
+
+# 사용 가능한 가장 빠른 알고리즘 (blake3 > xxh3_128 > md5)
+DEFAULT_HASH_ALGO = next(
+    algo for algo in ("blake3", "xxh3_128", "md5") if algo in _HASH_FACTORIES
+)
 
 
 # ============================================================================
 # Data Classes
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class FileState:
     """파일 상태 정보"""
     relative_path: str       # 루트 기준 상대 경로
     mtime: float            # 수정 시간 (Unix timestamp)
-    content_hash: str       # 콘텐츠 MD5 해시
+    content_hash: str       # 콘텐츠 해시 (FileTracker.hash_algo)
     
     def to_dict(self) -> dict:
         """레지스트리 저장용 딕셔너리"""
@@ -33,7 +65,7 @@ class FileState:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ChangeSet:
     """파일 변경 분류 결과"""
     added: List[FileState]     # 새로 추가된 파일
@@ -68,45 +100,78 @@ class FileTracker:
         tracker = FileTracker()
         file_state = tracker.get_file_state(path, root)
         changes = tracker.detect_changes(current_files, registry_data)
+
+    해시 알고리즘은 blake3 / xxhash가 설치되어 있으면 자동으로 사용하고,
+    없으면 MD5를 사용합니다. 레지스트리와 비교할 때는 같은 알고리즘이어야 하므로
+    IncrementalSyncer가 레지스트리에 기록된 알고리즘을 지정합니다.
     """
-    
+
+    def __init__(self, hash_algo: Optional[str] = None):
+        """
+        Args:
+            hash_algo: 콘텐츠 해시 알고리즘 (None이면 DEFAULT_HASH_ALGO)
+        """
+        self.hash_algo = hash_algo or DEFAULT_HASH_ALGO
+        if not self.is_hash_available(self.hash_algo):
+            raise ValueError(f"사용할 수 없는 해시 알고리즘: {self.hash_algo}")
+
     @staticmethod
-    def compute_file_hash(file_path: Path) -> str:
+    def is_hash_available(algo: str) -> bool:
+        """현재 환경에서 해당 해시 알고리즘을 계산할 수 있는지 여부"""
+        return algo in _HASH_FACTORIES
+
+    @staticmethod
+    def compute_file_hash(file_path: Path, algo: str = DEFAULT_HASH_ALGO) -> str:
         """
-        파일 콘텐츠의 MD5 해시 계산.
+        파일 콘텐츠 해시 계산.
         
         Args:
             file_path: 해시를 계산할 파일 경로
+            algo: 해시 알고리즘 ("md5" | "xxh3_128" | "blake3")
         
         Returns:
-            MD5 해시 문자열 (32자)
+            해시 문자열 (32자 hex)
         """
-        hasher = hashlib.md5()
         with open(file_path, "rb") as f:
-            # 대용량 파일 대비 청크 단위 읽기
-            for chunk in iter(lambda: f.read(8192), b""):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+            # 버퍼를 재사용하며 청크 단위로 읽음 (대용량 파일 대비)
+            hasher = hashlib.file_digest(f, _HASH_FACTORIES[algo])
+        # blake3는 기본 32바이트 출력이므로 앞 16바이트(32자)만 사용
+        return hasher.hexdigest()[:32]
     
     @staticmethod
     def get_file_mtime(file_path: Path) -> float:
         """파일 수정 시간(mtime) 반환"""
         return os.path.getmtime(file_path)
     
-    def get_file_state(self, file_path: Path, root_path: Path) -> FileState:
+    def get_file_state(
+        self,
+        file_path: Path,
+        root_path: Path,
+        mtime: Optional[float] = None,
+        known: Optional[dict] = None,
+    ) -> FileState:
         """
         파일의 현재 상태(mtime, hash) 수집.
         
         Args:
             file_path: 파일 절대 경로
             root_path: 루트 폴더 경로
+            mtime: 이미 알고 있는 수정 시간 (예: FolderScanner 스캔 결과, None이면 stat)
+            known: 레지스트리에 기록된 이 파일의 정보 ({"mtime", "content_hash"}).
+                   mtime이 같으면 파일을 다시 읽지 않고 기록된 해시를 재사용
+                   (기록된 해시가 self.hash_algo로 계산된 경우에만 전달할 것)
         
         Returns:
             FileState 객체
         """
         relative_path = str(file_path.relative_to(root_path))
-        mtime = self.get_file_mtime(file_path)
-        content_hash = self.compute_file_hash(file_path)
+        if mtime is None:
+            mtime = self.get_file_mtime(file_path)
+        if known and known.get("mtime") == mtime and known.get("content_hash"):
+            # mtime 우선 fast path: 변경 없는 파일은 해시 생략
+            content_hash = known["content_hash"]
+        else:
+            content_hash = self.compute_file_hash(file_path, self.hash_algo)
         
         return FileState(
             relative_path=relative_path,
@@ -177,12 +242,15 @@ class FileTracker:
 # Convenience Functions
 # ============================================================================
 
-def compute_file_hash(file_path: Path) -> str:
+def compute_file_hash(file_path: Path, algo: str = DEFAULT_HASH_ALGO) -> str:
     """파일 해시 계산 편의 함수"""
-    return FileTracker.compute_file_hash(file_path)
+    return FileTracker.compute_file_hash(file_path, algo)
+
+
+# FileTracker는 hash_algo 외 상태가 없으므로 호출마다 만들지 않고 공유
+_DEFAULT_TRACKER = FileTracker()
 
 
 def get_file_state(file_path: Path, root_path: Path) -> FileState:
     """파일 상태 수집 편의 함수"""
-    tracker = FileTracker()
-    return tracker.get_file_state(file_path, root_path)
+    return _DEFAULT_TRACKER.get_file_state(file_path, root_path)
@@ -5,6 +5,7 @@ Folder Scanner for RAG
 폴더 경로와 파일명을 메타데이터로 추출하는 모듈.
 """
 
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional, Set
@@ -34,7 +35,7 @@ DEFAULT_IGNORE_PATTERNS: Set[str] = {
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ScannedFile:
     """스캔된 파일 정보"""
 
@@ -42,6 +43,8 @@ class ScannedFile:
     relative_path: Path  # root 기준 상대 경로
     filename: str  # 파일명 (확장자 포함)
     folder_path: str  # 상위 폴더 경로 (상대, / 구분자)
+    mtime: Optional[float] = None  # 스캔 시 읽은 수정 시간 (재-stat 방지)
+    size: Optional[int] = None  # 스캔 시 읽은 파일 크기 (bytes)
 
     def to_metadata(self) -> dict:
         """Chunk 메타데이터용 딕셔너리 변환"""
@@ -73,6 +76,7 @@ class FolderScanner:
         ignore_patterns: Optional[Set[str]] = None,
         extensions: Optional[List[str]] = None,
         include_paths: Optional[List[str]] = None,
+        include_symlinks: bool = False,
     ):
         """
         Args:
@@ -80,68 +84,103 @@ class FolderScanner:
             ignore_patterns: 제외할 폴더명 패턴 (기본값: .obsidian, .git 등)
             extensions: 스캔할 파일 확장자 목록 (기본값: [".md"])
             include_paths: 포함할 폴더 경로 목록 (기본값: None, 전체 스캔)
+            include_symlinks: 파일 심볼릭 링크 포함 여부 (기본값: False, 폴더 링크는 항상 제외)
         """
         self.root_path = Path(root_path).resolve()
         self.ignore_patterns = ignore_patterns or DEFAULT_IGNORE_PATTERNS
         self.extensions = extensions or [".md"]
         self.include_paths = include_paths
+        self.include_symlinks = include_symlinks
+        self._ignore = frozenset(self.ignore_patterns)
 
         if not self.root_path.exists():
             raise FileNotFoundError(f"Root path does not exist: {self.root_path}")
         if not self.root_path.is_dir():
             raise NotADirectoryError(f"Root path is not a directory: {self.root_path}")
 
-    def _should_ignore(self, path: Path) -> bool:
-        """경로가 무시 패턴에 해당하는지 확인"""
-        for part in path.parts[:-1]:  # 마지막(파일명) 제외, 폴더만 체크
-            # .으로 시작하는 모든 폴더 제외 (숨김 폴더)
-            if part.startswith("."):
-                return True
-            # 명시적 제외 패턴
-            if part in self.ignore_patterns:
-                return True
-        return False
+    def _should_ignore_dir(self, name: str) -> bool:
+        """폴더명이 무시 패턴에 해당하는지 확인"""
+        # .으로 시작하는 모든 폴더 제외 (숨김 폴더) + 명시적 제외 패턴
+        return name.startswith(".") or name in self._ignore
+
+    def _may_contain_included(self, folder_path: str) -> bool:
+        """
+        폴더 아래 파일 중 include_paths 접두사와 일치할 수 있는 것이 있는지 확인.
+
+        파일 필터는 relative.startswith(p)이므로 폴더 접두사("a/b/")와 p 중
+        하나가 다른 하나의 접두사이면 하위에 일치하는 파일이 있을 수 있습니다.
+        """
+        if not self.include_paths:
+            return True
+        prefix = f"{folder_path}/"
+        return any(
+            prefix.startswith(p) or p.startswith(prefix) for p in self.include_paths
+        )
 
     def scan(self) -> List[ScannedFile]:
         """
         재귀적으로 폴더를 스캔하여 대상 파일 목록 반환.
 
+        os.scandir 한 번의 탐색으로 파일 판별과 mtime/size 수집을 함께 수행하므로
+        이후 FileTracker가 같은 파일을 다시 stat 하지 않아도 됩니다.
+        무시 대상 폴더와 include_paths에 해당할 수 없는 폴더는 하위로 내려가지 않고
+        바로 건너뜁니다.
+
         Returns:
             ScannedFile 객체 리스트
         """
         scanned_files: List[ScannedFile] = []
-
-        for ext in self.extensions:
-            # 확장자 앞에 *가 없으면 추가
-            pattern = f"*{ext}" if not ext.startswith("*") else ext
-
-            for file_path in self.root_path.rglob(pattern):
-                # 상대 경로 계산
-                relative_path = file_path.relative_to(self.root_path)
-
-                # 포함 경로 필터링
-                if self.include_paths:
-                    if not any(
-                        str(relative_path).startswith(p) for p in self.include_paths
-                    ):
-                        continue
-
-                # 무시 패턴 체크
-                if self._should_ignore(relative_path):
-                    continue
-
-                # 폴더 경로 추출 (파일 제외)
-                folder_path = str(relative_path.parent)
-                if folder_path == ".":
-                    folder_path = ""
-
-                scanned_file = ScannedFile(
-                    full_path=file_path,
-                    relative_path=relative_path,
-                    filename=file_path.name,
-                    folder_path=folder_path,
-                )
-                scanned_files.append(scanned_file)
+        # 스캔마다 한 번 루프용 형태로 변환 (include_paths 등은 생성 후 바뀔 수 있음):
+        # frozenset 멤버십, str.endswith/startswith 튜플
+        self._ignore = frozenset(self.ignore_patterns)
+        suffixes = tuple(ext.lstrip("*") for ext in self.extensions)
+        include_prefixes = tuple(self.include_paths) if self.include_paths else None
+        # 링크를 따라가지 않으면 파일 판별은 readdir의 d_type만으로 끝나고 stat은 1회
+        follow = self.include_symlinks
+
+        # (절대 경로, root 기준 상대 폴더 경로)
+        stack = [(str(self.root_path), "")]
+        while stack:
+            dir_path, folder_path = stack.pop()
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if self._should_ignore_dir(name):
+                                    continue
+                                sub_folder = f"{folder_path}/{name}" if folder_path else name
+                                # include_paths 밖의 폴더는 하위로 내려가지 않음
+                                if self._may_contain_included(sub_folder):
+                                    stack.append((entry.path, sub_folder))
+                                continue
+                            if not name.endswith(suffixes) or not entry.is_file(
+                                follow_symlinks=follow
+                            ):
+                                continue
+                            stat = entry.stat(follow_symlinks=follow)
+                        except OSError:
+                            continue
+
+                        relative = f"{folder_path}/{name}" if folder_path else name
+
+                        # 포함 경로 필터링
+                        if include_prefixes and not relative.startswith(include_prefixes):
+                            continue
+
+                        scanned_files.append(
+                            ScannedFile(
+                                full_path=Path(entry.path),
+                                relative_path=Path(relative),
+                                filename=name,
+                                folder_path=folder_path,
+                                mtime=stat.st_mtime,
+                                size=stat.st_size,
+                            )
+                        )
+            except OSError:
+                continue
 
         # 정렬: 폴더 경로 -> 파일명 순
         scanned_files.sort(key=lambda f: (f.folder_path, f.filename))
@@ -5,9 +5,15 @@ Incremental Syncer for RAG
 ChromaDB에 업데이트합니다.
 """
 
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import datetime
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from .file_tracker import ChangeSet, FileState, FileTracker
 from .folder_scanner import FolderScanner, ScannedFile
@@ -15,6 +21,13 @@ from .sync_registry import SyncRegistry
 from ..preprocessing import Chunk, semantic_chunk
 
 
+# 파일 상태(해시) 수집 동시 작업 수 (hashlib/파일 읽기는 GIL을 놓으므로 스레드로 충분)
+MAX_HASH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# upsert 중인 파일 외에 미리 읽고 청킹해 둘 파일 수 (메모리 상한)
+CHUNK_PREFETCH = 2
+
+
 # ============================================================================
 # Data Classes
 # ============================================================================
@@ -107,27 +120,43 @@ class IncrementalSyncer:
         Returns:
             SyncResult 객체
         """
+        # 임베딩 형식(정규화 여부)이 바뀐 컬렉션은 기존 벡터를 재사용할 수 없음
+        if self.chroma_store.needs_reindex:
+            return self.full_sync()
+
         result = SyncResult()
+        # 이번 동기화에서 처리한 파일은 모두 같은 last_synced를 기록
+        synced_at = datetime.now().isoformat()
 
         # 1. 현재 파일 스캔
         scanned_files = self.folder_scanner.scan()
 
-        # 2. 각 파일의 상태(mtime, hash) 수집
+        # 레지스트리 해시와 비교하려면 같은 알고리즘으로 해시해야 함
+        # (기록된 알고리즘을 이 환경에서 계산할 수 없으면 새 알고리즘으로 비교)
+        registry_algo = self.registry.content_hash_algo
+        target_algo = self._file_tracker.hash_algo
+        if registry_algo != target_algo and FileTracker.is_hash_available(registry_algo):
+            tracker = FileTracker(registry_algo)
+        else:
+            tracker = self._file_tracker
+
+        # 2. 각 파일의 상태(mtime, hash) 수집 (여러 파일을 동시에 해시, 결과는 스캔 순서 유지)
         current_states: List[FileState] = []
         file_map: dict[str, ScannedFile] = {}  # relative_path -> ScannedFile
 
-        for scanned_file in scanned_files:
-            try:
-                state = self._file_tracker.get_file_state(
-                    scanned_file.full_path,
-                    self.folder_scanner.root_path,
-                )
-                current_states.append(state)
-                file_map[state.relative_path] = scanned_file
-            except Exception as e:
+        # 기록된 해시를 재사용(mtime fast path)하려면 같은 알고리즘이어야 함
+        known_files = self.registry.files if tracker.hash_algo == registry_algo else {}
+
+        for scanned_file, state, error in self._collect_states(
+            scanned_files, tracker, known_files
+        ):
+            if error is not None:
                 result.errors.append(
-                    f"Failed to get state for {scanned_file.relative_path}: {e}"
+                    f"Failed to get state for {scanned_file.relative_path}: {error}"
                 )
+                continue
+            current_states.append(state)
+            file_map[state.relative_path] = scanned_file
 
         # 3. 레지스트리와 비교
         changes = self._file_tracker.detect_changes(
@@ -136,36 +165,33 @@ class IncrementalSyncer:
         )
 
         # 4. 변경 처리
-        # 4a. 새 파일 처리
-        for file_state in changes.added:
+        # 레지스트리가 현재 내용과 일치하는 파일 (해시 마이그레이션 대상)
+        synced_paths = set(changes.unchanged)
+        # 4a. 새 파일 / 4b. 수정된 파일 처리
+        # (다음 파일의 읽기·청킹을 현재 파일 upsert와 겹쳐 수행, 저장은 순서대로)
+        pending = [(s, False) for s in changes.added] + [(s, True) for s in changes.modified]
+        for (file_state, is_modified), chunks, error in self._iter_chunked(pending, file_map):
+            path = file_state.relative_path
+            action = "modify" if is_modified else "add"
+            if error is not None:
+                result.errors.append(f"Failed to {action} {path}: {error}")
+                continue
             try:
-                chunk_count = self._process_file(
-                    file_state, file_map[file_state.relative_path]
-                )
-                result.added += 1
-                result.total_chunks += chunk_count
-            except Exception as e:
-                result.errors.append(f"Failed to add {file_state.relative_path}: {e}")
-
-        # 4b. 수정된 파일 처리
-        for file_state in changes.modified:
-            try:
-                chunk_count = self._process_file(
-                    file_state, file_map[file_state.relative_path]
-                )
+                # 레지스트리가 새 청크 수로 갱신되기 전에 기존 청크 수 확인
+                old_info = self.registry.get_file_info(path) if is_modified else None
+                old_count = old_info.get("chunk_count", 0) if old_info else 0
+                chunk_count = self._store_chunks(file_state, chunks, synced_at)
                 # 기존 청크 수보다 새 청크 수가 적으면 초과 청크 삭제
-                old_info = self.registry.get_file_info(file_state.relative_path)
-                if old_info and old_info.get("chunk_count", 0) > chunk_count:
-                    self.chroma_store.delete_chunks_by_prefix(
-                        file_state.relative_path,
-                        chunk_count,
-                    )
-                result.modified += 1
+                if old_count > chunk_count:
+                    self.chroma_store.delete_chunks_by_prefix(path, chunk_count)
+                if is_modified:
+                    result.modified += 1
+                else:
+                    result.added += 1
                 result.total_chunks += chunk_count
+                synced_paths.add(path)
             except Exception as e:
-                result.errors.append(
-                    f"Failed to modify {file_state.relative_path}: {e}"
-                )
+                result.errors.append(f"Failed to {action} {path}: {e}")
 
         # 4c. 삭제된 파일 처리
         for relative_path in changes.deleted:
@@ -179,27 +205,111 @@ class IncrementalSyncer:
         # 4d. 변경 없는 파일 카운트
         result.skipped = len(changes.unchanged)
 
+        # 4e. 해시 알고리즘 마이그레이션 (1회 재해시, 재임베딩 없음)
+        if registry_algo != target_algo:
+            self._migrate_hashes(
+                [s for s in current_states if s.relative_path in synced_paths],
+                file_map,
+                tracker,
+            )
+
         # 5. 레지스트리 저장
         self.registry.save()
 
         return result
 
-    def _process_file(self, file_state: FileState, scanned_file: ScannedFile) -> int:
+    def _migrate_hashes(
+        self,
+        current_states: List[FileState],
+        file_map: dict[str, ScannedFile],
+        tracker: FileTracker,
+    ) -> None:
         """
-        단일 파일 처리 (청킹 → upsert → 레지스트리 업데이트).
+        레지스트리 해시를 새 알고리즘(self._file_tracker.hash_algo)으로 교체.
 
-        Args:
-            file_state: 파일 상태
-            scanned_file: 스캔된 파일 정보
+        current_states에는 이번 동기화 후 레지스트리가 현재 내용과 일치하는 파일
+        (변경 없음 또는 처리 성공)만 전달합니다. 처리에 실패한 파일까지 현재 내용의
+        해시를 기록하면 다음 동기화에서 변경 없음으로 판단되어 다시 인덱싱되지 않으므로,
+        나머지 항목은 해시를 비워 다음 동기화에서 재처리되게 합니다.
+        """
+        if tracker.hash_algo == self._file_tracker.hash_algo:
+            new_hashes = {s.relative_path: s.content_hash for s in current_states}
+        else:
+            scanned = [file_map[s.relative_path] for s in current_states]
+            new_hashes = {
+                state.relative_path: state.content_hash
+                for _, state, error in self._collect_states(scanned, self._file_tracker)
+                if error is None
+            }
+        self.registry.rehash(new_hashes, self._file_tracker.hash_algo)
+
+    def _collect_states(
+        self,
+        scanned_files: List[ScannedFile],
+        tracker: FileTracker,
+        known_files: Optional[dict] = None,
+    ) -> List[Tuple[ScannedFile, Optional[FileState], Optional[Exception]]]:
+        """
+        스캔된 파일들의 FileState를 스레드 풀에서 수집 (파일별 예외는 결과로 반환).
 
-        Returns:
-            처리된 청크 수
+        known_files(레지스트리 files)에서 mtime이 같은 파일은 해시를 다시 계산하지 않음.
         """
-        # 파일 읽기
+        get_state = partial(self._get_state, tracker, known_files or {})
+        max_workers = min(MAX_HASH_WORKERS, len(scanned_files))
+        if max_workers <= 1:
+            return [get_state(f) for f in scanned_files]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(get_state, scanned_files))
+
+    def _get_state(
+        self, tracker: FileTracker, known_files: dict, scanned_file: ScannedFile
+    ) -> Tuple[ScannedFile, Optional[FileState], Optional[Exception]]:
+        try:
+            state = tracker.get_file_state(
+                scanned_file.full_path,
+                self.folder_scanner.root_path,
+                mtime=scanned_file.mtime,
+                known=known_files.get(str(scanned_file.relative_path)),
+            )
+        except Exception as e:
+            return scanned_file, None, e
+        return scanned_file, state, None
+
+    def _iter_chunked(
+        self,
+        pending: List[Tuple[FileState, bool]],
+        file_map: dict[str, ScannedFile],
+    ) -> Iterator[Tuple[Tuple[FileState, bool], Optional[List[Chunk]], Optional[Exception]]]:
+        """
+        파일을 백그라운드 스레드에서 읽고 청킹하며 순서대로 반환.
+
+        호출 측이 파일 N을 upsert(임베딩/DB I/O)하는 동안 파일 N+1..N+CHUNK_PREFETCH를
+        미리 청킹합니다. 앞서 준비하는 파일 수를 제한해 메모리 사용을 묶어 둡니다.
+        """
+        if not pending:
+            return
+        items = iter(pending)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+
+            def submit(item: Tuple[FileState, bool]):
+                return item, executor.submit(self._chunk_file, file_map[item[0].relative_path])
+
+            futures = deque(submit(item) for item in islice(items, CHUNK_PREFETCH + 1))
+            while futures:
+                item, future = futures.popleft()
+                next_item = next(items, None)
+                if next_item is not None:
+                    futures.append(submit(next_item))
+                try:
+                    yield item, future.result(), None
+                except Exception as e:
+                    yield item, None, e
+
+    def _chunk_file(self, scanned_file: ScannedFile) -> List[Chunk]:
+        """파일 읽기 → 청킹"""
         text = scanned_file.full_path.read_text(encoding="utf-8")
 
-        # 청킹
-        chunks = semantic_chunk(
+        return semantic_chunk(
             text=text,
             source=scanned_file.filename,
             extra_metadata=scanned_file.to_metadata(),
@@ -208,22 +318,47 @@ class IncrementalSyncer:
             chunk_level=self.chunk_level,
         )
 
-        # ChromaDB upsert
+    def _store_chunks(
+        self,
+        file_state: FileState,
+        chunks: List[Chunk],
+        synced_at: Optional[str] = None,
+    ) -> int:
+        """청크 upsert → 레지스트리 업데이트, 저장된 청크 수 반환"""
         chunk_count = self.chroma_store.upsert_chunks(
             chunks,
             file_state.relative_path,
         )
 
-        # 레지스트리 업데이트
         self.registry.update_file_info(
             relative_path=file_state.relative_path,
             content_hash=file_state.content_hash,
             mtime=file_state.mtime,
             chunk_count=chunk_count,
+            last_synced=synced_at,
         )
 
         return chunk_count
 
+    def _process_file(
+        self,
+        file_state: FileState,
+        scanned_file: ScannedFile,
+        synced_at: Optional[str] = None,
+    ) -> int:
+        """
+        단일 파일 처리 (청킹 → upsert → 레지스트리 업데이트).
+
+        Args:
+            file_state: 파일 상태
+            scanned_file: 스캔된 파일 정보
+            synced_at: 레지스트리에 기록할 동기화 시각 (None이면 현재 시각)
+
+        Returns:
+            처리된 청크 수
+        """
+        return self._store_chunks(file_state, self._chunk_file(scanned_file), synced_at)
+
     def full_sync(self) -> SyncResult:
         """
         전체 재동기화 (레지스트리 초기화 후 sync).
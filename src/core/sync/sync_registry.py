@@ -5,23 +5,47 @@ Sync Registry for Incremental Sync
 """
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional
+
+from .file_tracker import DEFAULT_HASH_ALGO, LEGACY_HASH_ALGO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # ============================================================================
 # Registry Schema
 # ============================================================================
 
-REGISTRY_VERSION = 1
+# v2: content_hash_algo 필드 추가 (v1은 항상 MD5)
+REGISTRY_VERSION = 2
 
 DEFAULT_REGISTRY = {
     "version": REGISTRY_VERSION,
+    "content_hash_algo": DEFAULT_HASH_ALGO,
     "files": {},
 }
 
 
+def _dumps(data: dict) -> bytes:
+    """레지스트리 직렬화 (orjson이 설치되어 있으면 사용)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes) -> dict:
+    """레지스트리 역직렬화 (orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 # ============================================================================
 # SyncRegistry Class
 # ============================================================================
@@ -35,7 +59,8 @@ class SyncRegistry:
 
     레지스트리 스키마:
         {
-            "version": 1,
+            "version": 2,
+            "content_hash_algo": "blake3",
             "files": {
                 "folder/note.md": {
                     "content_hash": "abc123...",
@@ -59,38 +84,79 @@ class SyncRegistry:
             registry_path: 레지스트리 JSON 파일 경로
         """
         self.registry_path = Path(registry_path)
+        # 마지막 저장 이후 변경 여부 (변경이 없으면 save()가 파일을 다시 쓰지 않음)
+        self._dirty = True
         self._data: dict = self._load()
 
     def _load(self) -> dict:
         """레지스트리 파일 로드 (없으면 기본값 생성)"""
         if self.registry_path.exists():
             try:
-                with open(self.registry_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                # 버전 체크 (향후 마이그레이션 대비)
-                if data.get("version") != REGISTRY_VERSION:
-                    # 버전 불일치 시 경고 (현재는 그냥 사용)
-                    pass
+                data = _loads(self.registry_path.read_bytes())
+                # v1 레지스트리는 알고리즘 필드 없이 MD5 해시만 저장
+                # (새 알고리즘으로의 재해시는 IncrementalSyncer.sync에서 수행)
+                data.setdefault("content_hash_algo", LEGACY_HASH_ALGO)
+                data.setdefault("files", {})
+                self._dirty = False
                 return data
             except (json.JSONDecodeError, IOError):
                 # 파일 손상 시 기본값으로 초기화
-                return {"version": REGISTRY_VERSION, "files": {}}
+                return self._empty()
         else:
-            return {"version": REGISTRY_VERSION, "files": {}}
+            return self._empty()
+
+    @staticmethod
+    def _empty() -> dict:
+        return {
+            "version": REGISTRY_VERSION,
+            "content_hash_algo": DEFAULT_HASH_ALGO,
+            "files": {},
+        }
 
     def save(self) -> None:
-        """레지스트리를 파일에 저장"""
+        """
+        레지스트리를 파일에 저장 (임시 파일에 쓴 뒤 교체하므로 중간에 중단돼도 손상되지 않음).
+
+        로드/저장 이후 변경이 없으면 아무것도 쓰지 않습니다 (변경 없는 동기화는 I/O 없음).
+        """
+        if not self._dirty:
+            return
         # 부모 디렉토리 생성
         self.registry_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(self.registry_path, "w", encoding="utf-8") as f:
-            json.dump(self._data, f, indent=2, ensure_ascii=False)
+        tmp_path = self.registry_path.with_name(self.registry_path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps(self._data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.registry_path)
+        self._dirty = False
 
     @property
     def files(self) -> dict:
         """파일 정보 딕셔너리 반환"""
         return self._data.get("files", {})
 
+    @property
+    def content_hash_algo(self) -> str:
+        """저장된 content_hash의 해시 알고리즘"""
+        return self._data.get("content_hash_algo", LEGACY_HASH_ALGO)
+
+    def rehash(self, content_hashes: Dict[str, str], algo: str) -> None:
+        """
+        저장된 해시를 다른 알고리즘으로 교체 (mtime, chunk_count는 유지).
+
+        Args:
+            content_hashes: {relative_path: 새 해시}. 여기에 없는 항목은
+                            새 알고리즘과 비교할 수 없으므로 해시를 비웁니다.
+            algo: 새 해시 알고리즘
+        """
+        for relative_path, info in self._data["files"].items():
+            info["content_hash"] = content_hashes.get(relative_path, "")
+        self._data["content_hash_algo"] = algo
+        self._data["version"] = REGISTRY_VERSION
+        self._dirty = True
+
     def get_file_info(self, relative_path: str) -> Optional[dict]:
         """
         특정 파일의 동기화 정보 조회.
@@ -109,22 +175,26 @@ class SyncRegistry:
         content_hash: str,
         mtime: float,
         chunk_count: int,
+        last_synced: Optional[str] = None,
     ) -> None:
         """
         파일 동기화 정보 업데이트.
 
         Args:
             relative_path: 루트 기준 상대 경로
-            content_hash: 콘텐츠 MD5 해시
+            content_hash: 콘텐츠 해시 (content_hash_algo)
             mtime: 수정 시간
             chunk_count: 저장된 청크 수
+            last_synced: 동기화 시각 (ISO 형식, None이면 현재 시각).
+                         여러 파일을 한 번에 동기화할 때 한 번만 계산해 전달
         """
         self._data["files"][relative_path] = {
             "content_hash": content_hash,
             "mtime": mtime,
             "chunk_count": chunk_count,
-            "last_synced": datetime.now().isoformat(),
+            "last_synced": last_synced or datetime.now().isoformat(),
         }
+        self._dirty = True
 
     def remove_file_info(self, relative_path: str) -> bool:
         """
@@ -138,6 +208,7 @@ class SyncRegistry:
         """
         if relative_path in self._data["files"]:
             del self._data["files"][relative_path]
+            self._dirty = True
             return True
         return False
 
@@ -147,14 +218,17 @@ class SyncRegistry:
 
     def set_vault_path(self, vault_path: str) -> None:
         """vault 경로 저장."""
-        self._data["vault_path"] = vault_path
+        if self._data.get("vault_path") != vault_path:
+            self._data["vault_path"] = vault_path
+            self._dirty = True
 
     def clear(self) -> None:
         """모든 파일 정보 초기화 (vault_path는 유지)."""
         vault_path = self._data.get("vault_path")
-        self._data = {"version": REGISTRY_VERSION, "files": {}}
+        self._data = self._empty()
         if vault_path:
             self._data["vault_path"] = vault_path
+        self._dirty = True
 
     def get_all_paths(self) -> list[str]:
         """저장된 모든 파일 경로 반환"""
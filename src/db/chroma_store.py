@@ -5,15 +5,25 @@ ChromaDB Vector Store
 EmbeddingStrategy 패턴을 통해 임베더 교체 가능.
 """
 
+import datetime
 import hashlib
+import json
+import math
 import re
+import threading
+import uuid
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import chromadb
 
 from core.embedding import EmbeddingStrategy, OpenAIEmbedder
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ============================================================================
 # Collection Name Utilities
@@ -58,6 +68,69 @@ def derive_collection_name(base_name: str, model_name: str) -> str:
     return sanitize_collection_name(combined)
 
 
+# ============================================================================
+# Collection Version
+# ============================================================================
+
+# (persist_path, collection_name) -> 쓰기 카운터.
+# 같은 컬렉션을 가리키는 모든 ChromaStore 인스턴스가 공유하므로 (예: API 동기화가 만든
+# 별도 인스턴스) 어느 인스턴스로 쓰든 검색 캐시가 무효화됩니다.
+_COLLECTION_VERSIONS: Dict[Tuple[str, str], int] = {}
+_COLLECTION_VERSIONS_LOCK = threading.Lock()
+
+# 쓰기마다 새 값으로 바뀌는 컬렉션 메타데이터 키 (다른 프로세스의 변경 감지용)
+WRITE_STAMP_KEY = "obrag:write_stamp"
+
+# 저장된 벡터가 L2 정규화되었는지 기록하는 컬렉션 메타데이터 키
+# (기록이 없으면 정규화 이전에 만들어진 컬렉션으로 간주)
+NORMALIZED_KEY = "obrag:normalized_embeddings"
+
+
+# ============================================================================
+# Metadata Utilities
+# ============================================================================
+
+
+def _json_string(value) -> str:
+    """
+    메타데이터 값을 JSON 문자열로 직렬화 (orjson이 설치되어 있으면 사용).
+
+    orjson 설치 여부와 관계없이 같은 문자열이 저장되도록 json 경로도
+    orjson 출력 형식(공백 없는 구분자, NaN/Infinity는 null, 날짜는 ISO 8601)에 맞춥니다.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode()
+        except TypeError:
+            # orjson.JSONEncodeError(TypeError 하위 클래스): 문자열이 아닌 키 등
+            pass
+    return json.dumps(
+        _replace_non_finite(value),
+        ensure_ascii=False,
+        separators=(",", ":"),
+        allow_nan=False,
+        default=_json_default,
+    )
+
+
+def _replace_non_finite(value):
+    """NaN/Infinity를 None으로 치환 (orjson과 동일하게 null로 저장)"""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _replace_non_finite(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_replace_non_finite(v) for v in value]
+    return value
+
+
+def _json_default(value):
+    """json 기본 인코더가 처리하지 못하는 값 (YAML frontmatter의 날짜 등)"""
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 # ============================================================================
 # Custom Embedding Function Adapter
 # ============================================================================
@@ -130,6 +203,9 @@ class ChromaStore:
         # 임베더 설정 (기본: OpenAIEmbedder)
         self._embedder = embedder or OpenAIEmbedder()
 
+        # 임베더가 L2 정규화된 벡터를 내는지 (컬렉션 메타데이터와 비교용)
+        self._normalized = bool(getattr(self._embedder, "normalizes_embeddings", False))
+
         # ChromaDB용 어댑터 생성
         self._embedding_fn = _EmbeddingFunctionAdapter(self._embedder)
 
@@ -139,12 +215,57 @@ class ChromaStore:
             name=collection_name,
             embedding_function=self._embedding_fn,
         )
+        # 같은 컬렉션에 대한 쓰기(add/upsert/delete/clear)마다 증가 (검색 캐시 무효화용)
+        self._version_key = (str(self.persist_path), collection_name)
+        with _COLLECTION_VERSIONS_LOCK:
+            _COLLECTION_VERSIONS.setdefault(self._version_key, 0)
 
     @property
     def embedder(self) -> EmbeddingStrategy:
         """현재 사용 중인 임베더"""
         return self._embedder
 
+    @property
+    def version(self) -> int:
+        """컬렉션 변경 카운터 (같은 컬렉션의 모든 인스턴스가 공유)"""
+        return _COLLECTION_VERSIONS[self._version_key]
+
+    def _bump_version(self) -> None:
+        with _COLLECTION_VERSIONS_LOCK:
+            _COLLECTION_VERSIONS[self._version_key] += 1
+        # 프로세스 간에는 카운터가 공유되지 않으므로 컬렉션 메타데이터에 쓰기 표시를 남김
+        metadata = {
+            k: v
+            for k, v in (self._collection.metadata or {}).items()
+            if not k.startswith("hnsw:")
+        }
+        metadata[WRITE_STAMP_KEY] = uuid.uuid4().hex
+        metadata[NORMALIZED_KEY] = self._normalized
+        self._collection.modify(metadata=metadata)
+
+    @property
+    def write_stamp(self) -> Optional[str]:
+        """마지막 쓰기 표시 (다른 프로세스의 쓰기도 반영, 쓰기 이력이 없으면 None)"""
+        collection = self._client.get_collection(self.collection_name)
+        return (collection.metadata or {}).get(WRITE_STAMP_KEY)
+
+    @property
+    def needs_reindex(self) -> bool:
+        """
+        저장된 벡터와 현재 임베더의 정규화 여부가 다른지.
+
+        정규화된 쿼리 벡터와 정규화되지 않은 문서 벡터는 거리 척도가 맞지 않으므로
+        이 경우 컬렉션 전체를 다시 임베딩해야 합니다 (IncrementalSyncer가 full_sync 수행).
+        """
+        if self._collection.count() == 0:
+            return False
+        stored = (self._collection.metadata or {}).get(NORMALIZED_KEY, False)
+        return bool(stored) != self._normalized
+
+    def embed_query(self, query_text: str) -> List[float]:
+        """쿼리 임베딩 (query()와 동일한 embed_query 경로 사용)"""
+        return self._embedding_fn.embed_query([query_text])[0]
+
     @staticmethod
     def _generate_chunk_id(chunk_text: str, source: str, index: int) -> str:
         """청크에 대한 고유 ID 생성"""
@@ -164,17 +285,13 @@ class ChromaStore:
         if not chunks:
             return 0
 
-        documents = []
-        metadatas = []
-        ids = []
-
-        for idx, chunk in enumerate(chunks):
-            source = chunk.metadata.get("source", "unknown")
-            chunk_id = self._generate_chunk_id(chunk.text, source, idx)
-
-            documents.append(chunk.text)
-            metadatas.append(chunk.metadata)
-            ids.append(chunk_id)
+        documents = [chunk.text for chunk in chunks]
+        metadatas = [chunk.metadata for chunk in chunks]
+        generate_id = self._generate_chunk_id
+        ids = [
+            generate_id(text, metadata.get("source", "unknown"), idx)
+            for idx, (text, metadata) in enumerate(zip(documents, metadatas))
+        ]
 
         # ChromaDB에 추가 (임베딩은 자동으로 수행됨)
         self._collection.add(
@@ -182,6 +299,7 @@ class ChromaStore:
             metadatas=metadatas,
             ids=ids,
         )
+        self._bump_version()
 
         return len(documents)
 
@@ -191,6 +309,7 @@ class ChromaStore:
         n_results: int = 5,
         where: Optional[dict] = None,
         where_document: Optional[dict] = None,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[dict]:
         """
         텍스트 쿼리로 유사 청크 검색.
@@ -200,14 +319,16 @@ class ChromaStore:
             n_results: 반환할 결과 수
             where: 메타데이터 필터 (예: {"source": "note.md"})
             where_document: 문서 내용 필터 (예: {"$contains": "keyword"})
+            query_embedding: 미리 계산한 쿼리 임베딩 (있으면 재임베딩 생략)
 
         Returns:
             검색 결과 리스트 [{"text": ..., "metadata": ..., "distance": ...}, ...]
         """
-        query_params = {
-            "query_texts": [query_text],
-            "n_results": n_results,
-        }
+        query_params = {"n_results": n_results}
+        if query_embedding is not None:
+            query_params["query_embeddings"] = [query_embedding]
+        else:
+            query_params["query_texts"] = [query_text]
 
         if where:
             query_params["where"] = where
@@ -242,15 +363,26 @@ class ChromaStore:
         컬렉션 통계 반환.
 
         Returns:
-            {"name": ..., "count": ..., "embedder": ...}
+            {"name": ..., "count": ..., "write_stamp": ..., "embedder": ...}
         """
         return {
             "name": self.collection_name,
             "count": self._collection.count(),
+            "write_stamp": self.write_stamp,
             "persist_path": str(self.persist_path),
             "embedder": repr(self._embedder),
         }
 
+    def get_documents(self) -> Tuple[List[str], List[str]]:
+        """
+        컬렉션의 모든 문서 텍스트와 id 반환 (임베딩 제외).
+
+        Returns:
+            (documents, ids)
+        """
+        result = self._collection.get(include=["documents"])
+        return result["documents"] or [], result["ids"]
+
     def clear(self) -> None:
         """컬렉션 내 모든 데이터 삭제"""
         # 컬렉션 삭제 후 재생성
@@ -259,6 +391,7 @@ class ChromaStore:
             name=self.collection_name,
             embedding_function=self._embedding_fn,
         )
+        self._bump_version()
 
     def delete_by_source(self, source: str) -> None:
         """
@@ -268,6 +401,7 @@ class ChromaStore:
             source: 삭제할 파일명
         """
         self._collection.delete(where={"source": source})
+        self._bump_version()
 
     # ========================================================================
     # Incremental Sync Methods
@@ -307,17 +441,15 @@ class ChromaStore:
         if not chunks:
             return 0
 
-        documents = []
-        metadatas = []
-        ids = []
-
-        for idx, chunk in enumerate(chunks):
-            chunk_id = self.generate_deterministic_id(relative_path, idx)
-
-            documents.append(chunk.text)
-            # ChromaDB 호환 메타데이터로 변환
-            metadatas.append(self._normalize_metadata(chunk.metadata))
-            ids.append(chunk_id)
+        documents = [chunk.text for chunk in chunks]
+        # ChromaDB 호환 메타데이터로 변환
+        # 같은 파일의 청크는 frontmatter 등 리스트/딕셔너리 값을 같은 객체로 공유하므로
+        # 값 객체(id)별로 한 번만 직렬화
+        normalize = self._normalize_metadata
+        json_cache: dict = {}
+        metadatas = [normalize(chunk.metadata, json_cache) for chunk in chunks]
+        generate_id = self.generate_deterministic_id
+        ids = [generate_id(relative_path, idx) for idx in range(len(chunks))]
 
         # ChromaDB upsert (있으면 update, 없으면 insert)
         self._collection.upsert(
@@ -325,11 +457,12 @@ class ChromaStore:
             metadatas=metadatas,
             ids=ids,
         )
+        self._bump_version()
 
         return len(documents)
 
     @staticmethod
-    def _normalize_metadata(metadata: dict) -> dict:
+    def _normalize_metadata(metadata: dict, json_cache: Optional[dict] = None) -> dict:
         """
         ChromaDB 호환 메타데이터로 변환.
 
@@ -338,19 +471,25 @@ class ChromaStore:
 
         Args:
             metadata: 원본 메타데이터
+            json_cache: 리스트/딕셔너리 값 id -> JSON 문자열 캐시.
+                        값 객체가 살아 있고 변경되지 않는 동안(한 번의 upsert)만 공유할 것
 
         Returns:
             정규화된 메타데이터
         """
-        import json
-
         normalized = {}
         for key, value in metadata.items():
             if isinstance(value, (str, int, float, bool)) or value is None:
                 normalized[key] = value
             elif isinstance(value, (list, dict)):
                 # 리스트/딕셔너리는 JSON 문자열로 변환
-                normalized[key] = json.dumps(value, ensure_ascii=False)
+                if json_cache is None:
+                    normalized[key] = _json_string(value)
+                else:
+                    encoded = json_cache.get(id(value))
+                    if encoded is None:
+                        encoded = json_cache[id(value)] = _json_string(value)
+                    normalized[key] = encoded
             else:
                 # 기타 타입은 문자열로 변환
                 normalized[key] = str(value)
@@ -366,32 +505,32 @@ class ChromaStore:
             relative_path: 삭제할 파일의 상대 경로
         """
         self._collection.delete(where={"relative_path": relative_path})
+        self._bump_version()
 
     def delete_chunks_by_prefix(self, relative_path: str, from_index: int) -> None:
         """
         특정 파일의 특정 인덱스 이상 청크 삭제.
 
         파일 수정 후 청크 수가 줄었을 때, 기존 초과 청크를 정리합니다.
+        relative_path 메타데이터로 이 파일의 청크 ID만 조회한 뒤
+        deterministic ID("path::chunk_N")의 인덱스로 골라 삭제합니다.
 
         Args:
             relative_path: 파일 상대 경로
             from_index: 이 인덱스부터 삭제 (0-based)
         """
-        # ID 패턴 기반으로 삭제할 청크 ID 목록 생성
-        # ChromaDB에서 prefix 기반 삭제가 어려우므로, 개별 ID로 삭제
-        ids_to_delete = []
-
-        # 최대 1000개 청크까지 지원 (충분히 큰 수)
-        for i in range(from_index, from_index + 1000):
-            chunk_id = self.generate_deterministic_id(relative_path, i)
-            ids_to_delete.append(chunk_id)
-
-        # 존재하지 않는 ID는 ChromaDB가 무시함
-        try:
+        existing = self._collection.get(where={"relative_path": relative_path}, include=[])
+        prefix = f"{relative_path}::chunk_"
+        ids_to_delete = [
+            chunk_id
+            for chunk_id in existing["ids"]
+            if chunk_id.startswith(prefix)
+            and chunk_id[len(prefix):].isdigit()
+            and int(chunk_id[len(prefix):]) >= from_index
+        ]
+        if ids_to_delete:
             self._collection.delete(ids=ids_to_delete)
-        except Exception:
-            # 삭제할 ID가 없으면 무시
-            pass
+            self._bump_version()
 
     def __repr__(self) -> str:
         return f"ChromaStore(collection='{self.collection_name}', count={self._collection.count()})"
@@ -107,6 +107,88 @@ class TestChromaStoreBasic:
         with pytest.raises(ValueError, match="API key required"):
             OpenAIEmbedder()
 
+    def test_openai_embedder_splits_large_inputs_into_batches(self):
+        """batch_size보다 많은 입력은 나눠 요청하고 입력 순서대로 결합"""
+        from types import SimpleNamespace
+
+        requests = []
+
+        def create(model, input):
+            requests.append(list(input))
+            # 응답 순서가 뒤섞여도 index로 정렬되는지 확인
+            data = [
+                SimpleNamespace(index=i, embedding=[float(text)])
+                for i, text in reversed(list(enumerate(input)))
+            ]
+            return SimpleNamespace(data=data)
+
+        embedder = OpenAIEmbedder(api_key="sk-test", batch_size=2, max_concurrency=3)
+        embedder._client = SimpleNamespace(embeddings=SimpleNamespace(create=create))
+
+        vectors = embedder.embed([str(i) for i in range(5)])
+
+        assert vectors == [[0.0], [1.0], [2.0], [3.0], [4.0]]
+        assert sorted(map(len, requests)) == [1, 2, 2]
+
+    def test_normalize_metadata_serializes_collections(self):
+        """리스트/딕셔너리는 JSON 문자열로 (한글 유지, 문자열이 아닌 키도 허용)"""
+        import json
+
+        normalized = ChromaStore._normalize_metadata(
+            {"tags": ["한글", "b"], "nested": {1: "x"}, "count": 3, "empty": None}
+        )
+
+        assert json.loads(normalized["tags"]) == ["한글", "b"]
+        assert "한글" in normalized["tags"]
+        assert json.loads(normalized["nested"]) == {"1": "x"}
+        assert normalized["count"] == 3
+        assert normalized["empty"] is None
+
+    def test_json_metadata_same_with_and_without_orjson(self, monkeypatch):
+        """orjson 설치 여부와 관계없이 같은 JSON 문자열로 저장"""
+        import datetime
+        from db import chroma_store
+
+        if chroma_store.orjson is None:
+            pytest.skip("orjson 미설치")
+        value = {
+            "tags": ["한글", "b"],
+            "score": float("nan"),
+            "range": [1.5, float("inf")],
+            "date": datetime.date(2024, 1, 2),
+            "at": datetime.datetime(2024, 1, 2, 3, 4, 5),
+        }
+
+        with_orjson = chroma_store._json_string(value)
+        monkeypatch.setattr(chroma_store, "orjson", None)
+        without_orjson = chroma_store._json_string(value)
+
+        assert without_orjson == with_orjson
+
+    def test_upsert_serializes_shared_metadata_values_once(self, store, monkeypatch):
+        """청크들이 공유하는 frontmatter 값은 upsert당 한 번만 직렬화"""
+        from db import chroma_store
+
+        calls = []
+        original = chroma_store._json_string
+
+        def counting_json_string(value):
+            calls.append(value)
+            return original(value)
+
+        monkeypatch.setattr(chroma_store, "_json_string", counting_json_string)
+        frontmatter = {"tags": ["a", "b"]}
+        chunks = [
+            Chunk(f"Content {i}", {"source": "n.md", "frontmatter": frontmatter, "headers": [f"H{i}"]})
+            for i in range(3)
+        ]
+
+        store.upsert_chunks(chunks, "n.md")
+
+        # frontmatter 1회 + 청크별 headers 3회
+        assert len(calls) == 4
+        assert store.get_stats()["count"] == 3
+
     def test_get_stats_empty_collection(self, store):
         """빈 컬렉션 통계"""
         stats = store.get_stats()
@@ -155,6 +237,41 @@ class TestChromaStoreOperations:
         store.clear()
         assert store.get_stats()["count"] == 0
 
+    def test_version_shared_across_instances(self, store, temp_db_path, fake_embedder, sample_chunks):
+        """같은 컬렉션을 여는 다른 인스턴스의 쓰기도 버전을 올림"""
+        other = ChromaStore(
+            persist_path=temp_db_path,
+            collection_name="test_collection",
+            embedder=fake_embedder,
+        )
+        before = store.version
+
+        other.add_chunks(sample_chunks)
+
+        assert store.version == other.version
+        assert store.version > before
+
+    def test_write_stamp_changes_on_every_write(self, store, sample_chunks):
+        """쓰기마다 컬렉션 메타데이터의 쓰기 표시가 바뀜 (clear 후에도 유지)"""
+        assert store.get_stats()["write_stamp"] is None
+
+        store.add_chunks(sample_chunks)
+        first = store.get_stats()["write_stamp"]
+        store.clear()
+        second = store.get_stats()["write_stamp"]
+
+        assert first is not None and second is not None
+        assert first != second
+
+    def test_get_documents_returns_texts_and_ids(self, store, sample_chunks):
+        """get_documents는 저장된 문서 텍스트와 id를 같은 순서로 반환"""
+        store.add_chunks(sample_chunks)
+
+        documents, ids = store.get_documents()
+
+        assert sorted(documents) == sorted(c.text for c in sample_chunks)
+        assert len(ids) == len(documents)
+
 
 # ============================================================================
 # Test: ChromaStore Query
@@ -12,6 +12,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
+import os
 import pytest
 from core.sync import (
     DEFAULT_IGNORE_PATTERNS,
@@ -224,6 +225,67 @@ class TestEdgeCases:
         assert len(files) == 1
         assert files[0].filename == "test.txt"
     
+    def test_scan_collects_mtime_and_size(self, tmp_path):
+        """스캔 결과에 mtime/size 포함 (재-stat 불필요)"""
+        note = tmp_path / "note.md"
+        note.write_text("# Hello")
+        os.utime(note, (1000, 1000))
+
+        files = FolderScanner(tmp_path).scan()
+
+        assert len(files) == 1
+        assert files[0].mtime == 1000
+        assert files[0].size == len("# Hello")
+
+    def test_symlinks_skipped_by_default(self, tmp_path):
+        """심볼릭 링크 파일은 기본적으로 제외, 옵션으로 포함"""
+        target = tmp_path / "outside"
+        target.mkdir()
+        (target / "real.md").write_text("# Real")
+        vault = tmp_path / "vault"
+        vault.mkdir()
+        (vault / "note.md").write_text("# Note")
+        (vault / "link.md").symlink_to(target / "real.md")
+        (vault / "linked_dir").symlink_to(target, target_is_directory=True)
+
+        files = FolderScanner(vault).scan()
+        assert [f.filename for f in files] == ["note.md"]
+
+        files = FolderScanner(vault, include_symlinks=True).scan()
+        assert [f.filename for f in files] == ["link.md", "note.md"]
+
+    def test_include_paths_prunes_other_folders(self, tmp_path, monkeypatch):
+        """include_paths 밖의 폴더는 탐색하지 않음"""
+        for folder in ("projects/app", "projects/lib", "archive/old", "projectsX"):
+            (tmp_path / folder).mkdir(parents=True)
+            (tmp_path / folder / "note.md").write_text("# Note")
+        (tmp_path / "root.md").write_text("# Root")
+
+        visited = []
+        real_scandir = os.scandir
+
+        def recording_scandir(path):
+            visited.append(Path(path).relative_to(tmp_path).as_posix())
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", recording_scandir)
+        files = FolderScanner(tmp_path, include_paths=["projects/app"]).scan()
+
+        assert [str(f.relative_path) for f in files] == ["projects/app/note.md"]
+        assert sorted(visited) == [".", "projects", "projects/app"]
+
+        files = FolderScanner(tmp_path, include_paths=["projects"]).scan()
+        assert [str(f.relative_path) for f in files] == [
+            "projects/app/note.md",
+            "projects/lib/note.md",
+            "projectsX/note.md",
+        ]
+
+        # 생성 후 include_paths를 바꿔도 다음 스캔에 반영 (api sync 라우터 사용 방식)
+        scanner = FolderScanner(tmp_path)
+        scanner.include_paths = ["archive"]
+        assert [str(f.relative_path) for f in scanner.scan()] == ["archive/old/note.md"]
+
     def test_nested_folder_structure(self, tmp_path):
         """중첩 폴더 구조"""
         # 중첩 폴더 생성
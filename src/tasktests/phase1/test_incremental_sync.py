@@ -271,6 +271,62 @@ class TestSyncRegistry:
         assert info["mtime"] == 100.0
         assert info["chunk_count"] == 3
     
+    def test_v1_registry_is_treated_as_md5(self, temp_dir):
+        """알고리즘 필드가 없는 v1 레지스트리는 MD5로 간주"""
+        # Given
+        registry_path = temp_dir / "registry.json"
+        registry_path.write_text(json.dumps({
+            "version": 1,
+            "files": {"note.md": {"content_hash": "abc", "mtime": 1.0, "chunk_count": 1}},
+        }), encoding="utf-8")
+        
+        # When
+        registry = SyncRegistry(registry_path)
+        registry.rehash({"note.md": "def"}, "blake3")
+        
+        # Then
+        assert registry.get_file_info("note.md")["content_hash"] == "def"
+        assert registry.get_file_info("note.md")["chunk_count"] == 1
+        assert registry.content_hash_algo == "blake3"
+
+    def test_save_is_atomic_and_corrupt_file_resets(self, temp_dir):
+        """임시 파일을 남기지 않고 저장, 손상된 파일은 빈 레지스트리로 로드"""
+        # Given
+        registry_path = temp_dir / "registry.json"
+        registry = SyncRegistry(registry_path)
+        registry.update_file_info("노트.md", "abc", 1.5, 2)
+
+        # When
+        registry.save()
+
+        # Then
+        assert not (temp_dir / "registry.json.tmp").exists()
+        assert json.loads(registry_path.read_text(encoding="utf-8"))["files"]["노트.md"]["mtime"] == 1.5
+
+        registry_path.write_text('{"files": ', encoding="utf-8")
+        assert len(SyncRegistry(registry_path)) == 0
+
+    def test_save_skips_write_when_unchanged(self, temp_dir):
+        """로드 이후 변경이 없으면 파일을 다시 쓰지 않음"""
+        # Given
+        registry_path = temp_dir / "registry.json"
+        registry = SyncRegistry(registry_path)
+        registry.update_file_info("note.md", "abc", 1.0, 1)
+        registry.save()
+        os.utime(registry_path, (1, 1))
+
+        # When - 변경 없음 / 같은 vault 경로
+        reloaded = SyncRegistry(registry_path)
+        reloaded.set_vault_path(reloaded.get_vault_path())
+        reloaded.save()
+
+        # Then
+        assert registry_path.stat().st_mtime == 1
+        reloaded.remove_file_info("note.md")
+        reloaded.save()
+        assert registry_path.stat().st_mtime != 1
+        assert len(SyncRegistry(registry_path)) == 0
+
     def test_update_file_info(self, sync_registry):
         """파일 정보 업데이트"""
         # When
@@ -391,6 +447,11 @@ This is note 2 in subfolder.
         assert len(env["registry"]) == 2
         assert env["registry"].get_file_info("note1.md") is not None
         assert env["registry"].get_file_info("subfolder/note2.md") is not None
+        # 한 번의 동기화는 같은 last_synced를 기록
+        assert (
+            env["registry"].get_file_info("note1.md")["last_synced"]
+            == env["registry"].get_file_info("subfolder/note2.md")["last_synced"]
+        )
     
     def test_sync_no_changes(self, setup_sync_env):
         """변경 없을 때 스킵 테스트"""
@@ -414,7 +475,32 @@ This is note 2 in subfolder.
         assert result.modified == 0
         assert result.deleted == 0
         assert result.skipped == 2
-    
+
+    def test_sync_skips_hashing_when_mtime_matches(self, setup_sync_env, monkeypatch):
+        """레지스트리 mtime과 같은 파일은 다시 해시하지 않음"""
+        # Given
+        env = setup_sync_env
+        syncer = IncrementalSyncer(FolderScanner(env["root"]), env["store"], env["registry"])
+        syncer.sync()
+
+        original_hash = FileTracker.compute_file_hash
+        hashed = []
+
+        def counting_hash(file_path, *args):
+            hashed.append(file_path.name)
+            return original_hash(file_path, *args)
+
+        monkeypatch.setattr(FileTracker, "compute_file_hash", staticmethod(counting_hash))
+        os.utime(env["file1"], (time.time() + 10, time.time() + 10))  # 내용 변경 없이 touch
+
+        # When
+        result = syncer.sync()
+
+        # Then
+        assert hashed == ["note1.md"]
+        assert result.modified == 0
+        assert result.skipped == 2
+
     def test_sync_modified_file(self, setup_sync_env):
         """수정된 파일 동기화 테스트"""
         # Given
@@ -447,7 +533,34 @@ Completely new content!
         assert result.modified == 1
         assert result.added == 0
         assert result.skipped == 1
-    
+
+    def test_sync_shrunk_file_removes_stale_chunks(self, setup_sync_env):
+        """수정 후 청크 수가 줄면 초과 청크 삭제, 읽기 실패는 에러로 기록"""
+        # Given - 섹션 3개짜리 노트
+        env = setup_sync_env
+        sections = "\n\n".join(f"## S{i}\n\n" + "word " * 60 for i in range(3))
+        env["file1"].write_text(f"# Long\n\n{sections}\n", encoding="utf-8")
+        syncer = IncrementalSyncer(
+            FolderScanner(env["root"]), env["store"], env["registry"], min_chunk_size=10
+        )
+        syncer.sync()
+        before = env["registry"].get_file_info("note1.md")["chunk_count"]
+
+        # When - 섹션 하나로 축소 + 읽을 수 없는 새 파일 추가
+        time.sleep(0.1)
+        env["file1"].write_text("# Short\n\n" + "word " * 60, encoding="utf-8")
+        (env["root"] / "broken.md").write_bytes(b"\xff\xfe\x00bad")
+        result = syncer.sync()
+
+        # Then
+        after = env["registry"].get_file_info("note1.md")["chunk_count"]
+        note2 = env["registry"].get_file_info("subfolder/note2.md")["chunk_count"]
+        assert before > after
+        assert result.modified == 1
+        assert env["store"].get_stats()["count"] == after + note2
+        assert len(result.errors) == 1
+        assert result.errors[0].startswith("Failed to add broken.md")
+
     def test_sync_deleted_file(self, setup_sync_env):
         """삭제된 파일 동기화 테스트"""
         # Given
@@ -495,6 +608,135 @@ Completely new content!
         assert result.added == 2
         assert env["store"].get_stats()["count"] == initial_count
 
+    def test_sync_collects_states_in_parallel_and_reports_errors(self, setup_sync_env, monkeypatch):
+        """여러 파일 해시를 동시에 수집하고, 실패한 파일만 에러로 기록"""
+        # Given
+        env = setup_sync_env
+        for i in range(6):
+            (env["root"] / f"extra{i}.md").write_text(f"# Extra {i}\n\nBody {i}.\n", encoding="utf-8")
+
+        original_hash = FileTracker.compute_file_hash
+
+        def flaky_hash(file_path, *args):
+            if file_path.name == "extra3.md":
+                raise OSError("read failed")
+            return original_hash(file_path, *args)
+
+        monkeypatch.setattr(FileTracker, "compute_file_hash", staticmethod(flaky_hash))
+        syncer = IncrementalSyncer(
+            folder_scanner=FolderScanner(env["root"]),
+            chroma_store=env["store"],
+            registry=env["registry"],
+        )
+
+        # When
+        result = syncer.sync()
+
+        # Then
+        assert result.added == 7
+        assert len(result.errors) == 1
+        assert "extra3.md" in result.errors[0]
+        assert env["registry"].get_file_info("extra3.md") is None
+
+
+    def test_sync_migrates_legacy_hashes_without_reprocessing(self, setup_sync_env, monkeypatch):
+        """MD5 레지스트리는 한 번 재해시되고, 파일은 다시 임베딩하지 않음"""
+        import hashlib
+        from core.sync import file_tracker
+
+        # Given - MD5로 동기화된 레지스트리
+        env = setup_sync_env
+        scanner = FolderScanner(env["root"])
+        legacy = IncrementalSyncer(scanner, env["store"], env["registry"])
+        legacy._file_tracker = FileTracker("md5")
+        legacy.sync()
+        assert env["registry"].content_hash_algo == "md5"
+
+        monkeypatch.setitem(
+            file_tracker._HASH_FACTORIES, "blake2s", lambda: hashlib.blake2s(digest_size=16)
+        )
+        syncer = IncrementalSyncer(scanner, env["store"], env["registry"])
+        syncer._file_tracker = FileTracker("blake2s")
+        os.utime(env["file1"], (time.time() + 10, time.time() + 10))  # 내용 변경 없이 touch
+
+        # When
+        result = syncer.sync()
+
+        # Then
+        assert result.modified == 0
+        assert result.skipped == 2
+        assert env["registry"].content_hash_algo == "blake2s"
+        assert env["registry"].get_file_info("note1.md")["content_hash"] == (
+            FileTracker.compute_file_hash(env["file1"], "blake2s")
+        )
+        assert syncer.sync().skipped == 2
+
+    def test_failed_file_during_hash_migration_is_reprocessed(self, setup_sync_env, monkeypatch):
+        """해시 마이그레이션 중 처리에 실패한 파일은 다음 동기화에서 다시 처리"""
+        import hashlib
+        from core.sync import file_tracker
+
+        # Given - MD5로 동기화된 레지스트리, 이후 note1.md 수정
+        env = setup_sync_env
+        scanner = FolderScanner(env["root"])
+        legacy = IncrementalSyncer(scanner, env["store"], env["registry"])
+        legacy._file_tracker = FileTracker("md5")
+        legacy.sync()
+
+        monkeypatch.setitem(
+            file_tracker._HASH_FACTORIES, "blake2s", lambda: hashlib.blake2s(digest_size=16)
+        )
+        syncer = IncrementalSyncer(scanner, env["store"], env["registry"])
+        syncer._file_tracker = FileTracker("blake2s")
+        env["file1"].write_text("# Note 1\n\nEdited content.", encoding="utf-8")
+        os.utime(env["file1"], (time.time() + 10, time.time() + 10))
+
+        # When - 알고리즘 전환 동기화에서 upsert 실패
+        real_upsert = env["store"].upsert_chunks
+
+        def failing_upsert(chunks, relative_path):
+            raise RuntimeError("store down")
+
+        monkeypatch.setattr(env["store"], "upsert_chunks", failing_upsert)
+        failed = syncer.sync()
+        monkeypatch.setattr(env["store"], "upsert_chunks", real_upsert)
+
+        # Then - 실패한 파일은 해시를 비워 두고, 다음 동기화에서 수정으로 처리
+        assert len(failed.errors) == 1
+        assert env["registry"].get_file_info("note1.md")["content_hash"] == ""
+        assert env["registry"].get_file_info("subfolder/note2.md")["content_hash"] == (
+            FileTracker.compute_file_hash(env["file2"], "blake2s")
+        )
+        retried = syncer.sync()
+        assert retried.modified == 1
+        assert retried.skipped == 1
+        assert not retried.errors
+
+    def test_sync_reindexes_when_embedding_normalization_changes(self, setup_sync_env, temp_dir):
+        """정규화되지 않은 벡터로 만든 컬렉션은 정규화 임베더로 전체 재인덱싱"""
+        # Given - 정규화 이전 임베더로 동기화된 컬렉션
+        env = setup_sync_env
+        scanner = FolderScanner(env["root"])
+        IncrementalSyncer(scanner, env["store"], env["registry"]).sync()
+        assert not env["store"].needs_reindex
+
+        normalized_embedder = FakeEmbedder()
+        normalized_embedder.normalizes_embeddings = True
+        store = ChromaStore(
+            persist_path=str(temp_dir / "test_chroma"),
+            collection_name="test_sync",
+            embedder=normalized_embedder,
+        )
+        assert store.needs_reindex
+
+        # When - 파일 변경 없이 동기화
+        result = IncrementalSyncer(scanner, store, env["registry"]).sync()
+
+        # Then - 모든 파일을 다시 임베딩하고, 이후에는 증분 동기화
+        assert result.added == 2
+        assert not store.needs_reindex
+        assert IncrementalSyncer(scanner, store, env["registry"]).sync().skipped == 2
+
 
 # ============================================================================
 # ChromaStore Incremental Methods Tests
@@ -543,6 +785,30 @@ class TestChromaStoreIncrementalMethods:
         assert count2 == 2
         assert chroma_store.get_stats()["count"] == 2
 
+    def test_delete_chunks_by_prefix(self, chroma_store):
+        """해당 파일의 from_index 이상 청크만 삭제 (두 자리 인덱스 포함, 이름이 겹치는 다른 파일은 유지)"""
+        # Given
+        from core.preprocessing import Chunk
+
+        def chunks(path, n):
+            return [Chunk(f"{path} {i}", {"source": path, "relative_path": path}) for i in range(n)]
+
+        chroma_store.upsert_chunks(chunks("a.md", 12), "a.md")
+        chroma_store.upsert_chunks(chunks("a.md2", 3), "a.md2")
+
+        # When
+        chroma_store.delete_chunks_by_prefix("a.md", 2)
+
+        # Then
+        remaining = sorted(chroma_store._collection.get(include=[])["ids"])
+        assert remaining == ["a.md2::chunk_0", "a.md2::chunk_1", "a.md2::chunk_2",
+                             "a.md::chunk_0", "a.md::chunk_1"]
+
+        # 지울 청크가 없으면 버전 유지 (검색 캐시가 무효화되지 않음)
+        version = chroma_store.version
+        chroma_store.delete_chunks_by_prefix("a.md", 2)
+        assert chroma_store.version == version
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
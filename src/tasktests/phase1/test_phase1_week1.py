@@ -101,6 +101,204 @@ class TestHybridSearcher:
             assert searcher.is_indexed
             assert searcher.document_count == 2
 
+    def test_sparse_only_results_use_indexed_text(self):
+        """dense 결과에 없는 문서는 인덱싱된 원문을 사용하고, 재인덱싱 시 갱신되는지 확인"""
+        from core.rag.hybrid_search import HybridSearcher
+
+        mock_store = MagicMock()
+        mock_store.query.return_value = []
+        searcher = HybridSearcher(mock_store)
+
+        with patch("core.rag.hybrid_search.HybridSearcher._load_bm25") as mock_load:
+            mock_load.return_value.return_value.get_scores.return_value = [0.2, 0.6]
+            searcher.index_documents(["first", "second"], ["id1", "id2"])
+            results = searcher.search("query", top_k=2)
+            assert [(r.id, r.text) for r in results] == [("id2", "second"), ("id1", "first")]
+
+            mock_load.return_value.return_value.get_scores.return_value = [0.0]
+            searcher.index_documents(["replaced"], ["id2"])
+            results = searcher.search("query", top_k=2)
+            assert [(r.id, r.text) for r in results] == [("id2", "replaced")]
+
+    def test_search_fuses_scores_and_keeps_dense_only_results(self):
+        """상위 top_k 선택과 BM25 인덱스에 없는 dense 결과 처리 확인"""
+        from core.rag.hybrid_search import HybridSearcher
+
+        mock_store = MagicMock()
+        mock_store.query.return_value = [
+            {"id": "id3", "text": "dense three", "metadata": {"k": 3}, "distance": 0.25},
+            {"id": "new", "text": "not indexed", "metadata": {"k": 0}, "distance": 0.0001},
+        ]
+        searcher = HybridSearcher(mock_store, dense_weight=0.5, sparse_weight=0.5)
+
+        with patch("core.rag.hybrid_search.HybridSearcher._load_bm25") as mock_load:
+            mock_load.return_value.return_value.get_scores.return_value = [4.0, 1.0, 2.0, 0.0]
+            searcher.index_documents(["a", "b", "c", "d"], ["id1", "id2", "id3", "id4"])
+            results = searcher.search("query", top_k=3)
+
+        assert [r.id for r in results] == ["id3", "id1", "new"]
+        assert results[0].text == "dense three"
+        assert results[0].metadata == {"k": 3}
+        assert results[0].sparse_score == pytest.approx(0.5)
+        assert results[0].score == pytest.approx(0.5 * 0.8 + 0.5 * 0.5)
+        assert results[1].text == "a"
+        assert results[1].score == pytest.approx(0.5)
+        assert results[2].text == "not indexed"
+        assert results[2].sparse_score == 0.0
+
+    def test_search_cache_invalidated_on_reindex(self):
+        """동일 쿼리는 캐시를 사용하고, 재인덱싱 후에는 다시 계산하는지 확인"""
+        from core.rag import QueryCache
+        from core.rag.hybrid_search import HybridSearcher
+
+        mock_store = MagicMock()
+        mock_store.version = 0
+        mock_store.query.return_value = []
+        searcher = HybridSearcher(mock_store, cache=QueryCache())
+
+        with patch("core.rag.hybrid_search.HybridSearcher._load_bm25") as mock_load:
+            bm25 = mock_load.return_value.return_value
+            bm25.get_scores.return_value = [1.0]
+            searcher.index_documents(["doc"], ["id1"])
+
+            searcher.search("Query", top_k=1)
+            searcher.search("query ", top_k=1)
+            assert bm25.get_scores.call_count == 1
+
+            searcher.index_documents(["doc"], ["id1"])
+            searcher.search("query", top_k=1)
+            assert bm25.get_scores.call_count == 2
+
+    def test_add_documents_builds_segment_without_reindexing(self):
+        """증분 추가는 새 문서만 인덱싱하고, 갱신/삭제된 문서는 결과에서 제외되는지 확인"""
+        from core.rag.hybrid_search import HybridSearcher
+
+        built = []
+
+        class _CountingBM25:
+            def __init__(self, corpus):
+                built.append(corpus)
+                self._corpus = corpus
+
+            def get_scores(self, query):
+                return [float(sum(tok in doc for tok in query)) for doc in self._corpus]
+
+        mock_store = MagicMock()
+        mock_store.query.return_value = [
+            {"id": "id2", "text": "", "metadata": {}, "distance": 0.5},
+        ]
+        searcher = HybridSearcher(mock_store, dense_weight=0.5, sparse_weight=0.5)
+
+        with patch.object(HybridSearcher, "_load_bm25", return_value=_CountingBM25):
+            searcher.index_documents(["apple pie", "banana bread"], ["id1", "id2"])
+            searcher.add_documents(["apple banana"], ["id3"])
+            assert built[-1] == [["apple", "banana"]]  # 기존 문서는 다시 토큰화하지 않음
+
+            results = searcher.search("apple", top_k=5)
+            assert {r.id for r in results} == {"id1", "id2", "id3"}
+
+            searcher.add_documents(["cherry tart"], ["id1"])  # 갱신
+            searcher.remove_documents(["id2"])
+            results = searcher.search("apple", top_k=5)
+            assert [r.id for r in results] == ["id3", "id1"]
+            assert results[1].text == "cherry tart"
+            assert searcher.document_count == 2
+
+            searcher.compact()
+            assert built[-1] == [["apple", "banana"], ["cherry", "tart"]]
+            assert searcher.document_count == 2
+            assert [r.id for r in searcher.search("apple", top_k=5)] == ["id3", "id1"]
+
+    def test_add_documents_compacts_after_max_segments(self):
+        """세그먼트가 MAX_SEGMENTS를 넘으면 하나로 합쳐지는지 확인"""
+        from core.rag.hybrid_search import HybridSearcher
+
+        mock_store = MagicMock()
+        mock_store.query.return_value = []
+        searcher = HybridSearcher(mock_store)
+
+        with patch("core.rag.hybrid_search.HybridSearcher._load_bm25"):
+            searcher.index_documents(["base"], ["id0"])
+            for i in range(1, HybridSearcher.MAX_SEGMENTS + 2):
+                searcher.add_documents([f"doc {i}"], [f"id{i}"])
+
+        assert len(searcher._segments) < HybridSearcher.MAX_SEGMENTS
+        assert searcher.document_count == HybridSearcher.MAX_SEGMENTS + 2
+
+    def test_cache_dir_persists_index_across_instances(self, tmp_path):
+        """cache_dir에 저장된 인덱스를 재인덱싱 없이 불러오고, 저장소가 바뀌면 무시하는지 확인"""
+        pytest.importorskip("rank_bm25")
+        from core.rag.hybrid_search import HybridSearcher
+
+        mock_store = MagicMock()
+        mock_store.query.return_value = []
+        mock_store.get_stats.return_value = {"name": "notes", "count": 3, "write_stamp": "w1"}
+
+        searcher = HybridSearcher(mock_store, cache_dir=tmp_path)
+        assert not searcher.is_indexed
+        searcher.index_documents(["python list", "rust guide", "go intro"], ["a", "b", "c"])
+        searcher.add_documents(["python typing"], ["b"])
+        assert not (tmp_path / HybridSearcher.INDEX_FILENAME).exists()  # 변경마다 저장하지 않음
+        searcher.save()
+        expected = [(r.id, r.score) for r in searcher.search("python", top_k=3)]
+
+        with patch.object(HybridSearcher, "_load_bm25") as mock_load:
+            restored = HybridSearcher(mock_store, cache_dir=tmp_path)
+            assert restored.is_indexed
+            assert restored.document_count == 3
+            assert [(r.id, r.score) for r in restored.search("python", top_k=3)] == expected
+            mock_load.assert_not_called()
+
+        mock_store.get_stats.return_value = {"name": "notes", "count": 4, "write_stamp": "w2"}
+        assert not HybridSearcher(mock_store, cache_dir=tmp_path).is_indexed
+
+        # 문서 수가 같아도 저장 이후 쓰기가 있었으면 무시
+        mock_store.get_stats.return_value = {"name": "notes", "count": 3, "write_stamp": "w2"}
+        assert not HybridSearcher(mock_store, cache_dir=tmp_path).is_indexed
+
+    def test_corrupt_index_file_rebuilds_from_store(self, tmp_path):
+        """cache_dir의 인덱스 파일이 손상되었으면 vector_store 문서로 다시 인덱싱하는지 확인"""
+        pytest.importorskip("rank_bm25")
+        from core.rag.hybrid_search import HybridSearcher
+
+        (tmp_path / HybridSearcher.INDEX_FILENAME).write_bytes(b"\x80\x05broken")
+        mock_store = MagicMock()
+        mock_store.query.return_value = []
+        mock_store.get_stats.return_value = {"name": "notes", "count": 3, "write_stamp": "w1"}
+        mock_store.get_documents.return_value = (
+            ["python list", "rust guide", "go intro"],
+            ["a", "b", "c"],
+        )
+
+        searcher = HybridSearcher(mock_store, cache_dir=tmp_path)
+
+        assert searcher.is_indexed
+        assert searcher.document_count == 3
+        assert [r.id for r in searcher.search("python", top_k=1)] == ["a"]
+        # 다시 만든 인덱스로 파일을 교체
+        assert HybridSearcher(mock_store, cache_dir=tmp_path).document_count == 3
+
+    def test_bm25s_backend_ranks_like_rank_bm25(self):
+        """bm25s 백엔드가 rank-bm25와 같은 순위를 내는지 확인"""
+        pytest.importorskip("bm25s")
+        from rank_bm25 import BM25Okapi
+        from core.rag.hybrid_search import HybridSearcher
+
+        mock_store = MagicMock()
+        mock_store.query.return_value = []
+        searcher = HybridSearcher(mock_store, dense_weight=0.0, sparse_weight=1.0)
+        docs = ["python list tutorial", "rust ownership guide", "python python typing"]
+        searcher.index_documents(docs, ["a", "b", "c"])
+
+        results = searcher.search("python tutorial", top_k=3)
+        expected = BM25Okapi([searcher._tokenize(d) for d in docs]).get_scores(
+            ["python", "tutorial"]
+        )
+
+        assert [r.id for r in results[:2]] == ["a", "c"]
+        assert expected[0] > expected[2] > expected[1]
+        assert searcher.search("", top_k=1)[0].sparse_score == 0.0
+
     def test_search_requires_indexing(self):
         """search가 인덱싱 없이 호출되면 에러 발생"""
         from core.rag.hybrid_search import HybridSearcher
@@ -159,6 +357,77 @@ class TestReranker:
         assert result[1].score == 0.8
 
 
+    def test_rerank_batches_predict_and_keeps_ties_stable(self):
+        """predict 배치 인자 전달과 동점 시 원래 순서 유지 확인"""
+        import numpy as np
+        from core.rag.reranker import Reranker
+
+        reranker = Reranker(batch_size=8)
+
+        mock_model = MagicMock()
+        mock_model.predict.return_value = np.array([0.2, 0.7, 0.7, 0.1, 0.9])
+        reranker._model = mock_model
+
+        result = reranker.rerank("query", ["a", "b", "c", "d", "e"], top_k=3)
+
+        assert [r.original_index for r in result] == [4, 1, 2]
+        assert isinstance(result[0].score, float)
+        _, kwargs = mock_model.predict.call_args
+        assert kwargs["batch_size"] == 8
+        assert kwargs["show_progress_bar"] is False
+
+    def test_rerank_ties_at_top_k_boundary_keep_original_order(self):
+        """top_k 경계의 동점은 전체 stable 정렬과 같이 앞선 문서를 선택"""
+        import numpy as np
+        from core.rag.reranker import Reranker
+
+        reranker = Reranker()
+        scores = np.array([0.5] * 20 + [0.9])
+        mock_model = MagicMock()
+        mock_model.predict.return_value = scores
+        reranker._model = mock_model
+
+        docs = [str(i) for i in range(scores.size)]
+        for top_k in range(1, scores.size + 1):
+            result = reranker.rerank("query", docs, top_k=top_k)
+            expected = np.argsort(-scores, kind="stable")[:top_k].tolist()
+            assert [r.original_index for r in result] == expected
+
+    def test_load_model_uses_cuda_with_fp16(self):
+        """CUDA 사용 가능 시 device/max_length 전달 및 fp16=True일 때 half precision 적용 확인"""
+        from core.rag import reranker as reranker_module
+        from core.rag.reranker import Reranker
+
+        cross_encoder = MagicMock()
+        fake_st = MagicMock(CrossEncoder=cross_encoder)
+        reranker = Reranker(max_length=256, fp16=True)
+
+        with patch.dict("sys.modules", {"sentence_transformers": fake_st}), patch.object(
+            reranker_module, "_detect_device", return_value="cuda"
+        ):
+            reranker._load_model()
+
+        cross_encoder.assert_called_once_with(
+            Reranker.DEFAULT_MODEL, device="cuda", max_length=256
+        )
+        cross_encoder.return_value.model.half.assert_called_once()
+
+    def test_load_model_keeps_full_precision_by_default(self):
+        """fp16을 지정하지 않으면 CUDA에서도 half precision을 적용하지 않음"""
+        from core.rag import reranker as reranker_module
+        from core.rag.reranker import Reranker
+
+        cross_encoder = MagicMock()
+        fake_st = MagicMock(CrossEncoder=cross_encoder)
+
+        with patch.dict("sys.modules", {"sentence_transformers": fake_st}), patch.object(
+            reranker_module, "_detect_device", return_value="cuda"
+        ):
+            Reranker()._load_model()
+
+        cross_encoder.return_value.model.half.assert_not_called()
+
+
 class TestEmbeddingStrategyProtocol:
     """EmbeddingStrategy 프로토콜 준수 테스트"""
 
@@ -7,7 +7,7 @@ API 키 또는 서버 연결이 없는 경우 해당 테스트를 건너뜁니
 
 import os
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import ANY, Mock, patch, MagicMock
 
 # src 경로 추가
 import sys
@@ -151,6 +151,7 @@ class TestOllamaLLM:
             mock_openai_cls.assert_called_once_with(
                 base_url="http://localhost:11434/v1",
                 api_key="ollama",
+                http_client=ANY,
             )
     
     @pytest.mark.skipif(True, reason="Requires local Ollama server running")
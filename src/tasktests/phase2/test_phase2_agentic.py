@@ -196,7 +196,11 @@ class TestSelfCorrectingRAGChain:
         mock_retriever.retrieve.return_value = low_quality_result
 
         mock_llm = MagicMock()
-        mock_llm.generate.return_value = MockLLMResponse(content="broadened query")
+        mock_llm.generate.side_effect = [
+            MockLLMResponse(content="broadened query"),
+            MockLLMResponse(content="broader query"),
+            MockLLMResponse(content="Final answer"),
+        ]
 
         chain = SelfCorrectingRAGChain(
             retriever=mock_retriever,
@@ -210,6 +214,59 @@ class TestSelfCorrectingRAGChain:
         assert result.attempts == 3
         assert result.retrieval_quality < 0.9
 
+    def test_query_stops_when_broadened_query_repeats(self):
+        from core.rag.agentic.self_correcting_chain import SelfCorrectingRAGChain
+
+        low_quality_result = MockRetrievalResult(
+            query="test",
+            chunks=[
+                MockRetrievedChunk(id="1", text="Low quality", metadata={}, score=0.1),
+            ],
+            total_count=1,
+        )
+
+        mock_retriever = MagicMock()
+        mock_retriever.retrieve.return_value = low_quality_result
+        mock_llm = MagicMock()
+        mock_llm.generate.side_effect = [
+            MockLLMResponse(content="broadened query"),
+            MockLLMResponse(content="Broadened  Query"),
+            MockLLMResponse(content="Final answer"),
+        ]
+
+        chain = SelfCorrectingRAGChain(
+            retriever=mock_retriever,
+            llm=mock_llm,
+            quality_threshold=0.9,
+            max_retries=2,
+        )
+
+        result = chain.query("test question")
+
+        # 같은 쿼리는 다시 검색하지 않고 재시도 중단
+        assert result.attempts == 2
+        assert result.all_queries == ["test question", "broadened query"]
+        assert mock_retriever.retrieve.call_count == 2
+        assert result.answer == "Final answer"
+
+    def test_empty_question_skips_retrieval(self):
+        import asyncio
+        from core.rag.agentic.self_correcting_chain import SelfCorrectingRAGChain
+
+        mock_retriever = MagicMock()
+        mock_llm = MagicMock()
+        chain = SelfCorrectingRAGChain(retriever=mock_retriever, llm=mock_llm)
+
+        result = chain.query("   ")
+        async_result = asyncio.run(chain.aquery(""))
+
+        assert result.answer == chain.EMPTY_QUESTION_ANSWER
+        assert result.attempts == 0
+        assert async_result.answer == chain.EMPTY_QUESTION_ANSWER
+        assert list(chain.stream_query("\n")) == [chain.EMPTY_QUESTION_ANSWER]
+        mock_retriever.retrieve.assert_not_called()
+        mock_llm.generate.assert_not_called()
+
     def test_handles_empty_retrieval(self):
         from core.rag.agentic.self_correcting_chain import SelfCorrectingRAGChain
 
@@ -232,6 +289,236 @@ class TestSelfCorrectingRAGChain:
         assert "couldn't find" in result.answer.lower()
 
 
+    def test_query_retrieves_broaden_candidates_together(self):
+        from core.rag.agentic.self_correcting_chain import SelfCorrectingRAGChain
+
+        def retrieve(query, top_k=5):
+            score = 0.9 if query == "beta" else 0.2
+            return MockRetrievalResult(
+                query=query,
+                chunks=[MockRetrievedChunk(id=query, text=query, metadata={}, score=score)],
+                total_count=1,
+            )
+
+        mock_retriever = MagicMock()
+        mock_retriever.retrieve.side_effect = retrieve
+        mock_llm = MagicMock()
+        mock_llm.generate.side_effect = [
+            MockLLMResponse(content="1. alpha\n2. beta\n\n- gamma\nalpha"),
+            MockLLMResponse(content="Final answer"),
+        ]
+
+        chain = SelfCorrectingRAGChain(
+            retriever=mock_retriever,
+            llm=mock_llm,
+            quality_threshold=0.5,
+            broaden_candidates=3,
+        )
+        result = chain.query("original")
+
+        # 후보 3개를 한 번의 LLM 호출로 생성 (확장 1회 + 답변 1회)
+        assert mock_llm.generate.call_count == 2
+        assert result.attempts == 2
+        assert result.final_query == "beta"
+        assert result.all_queries == ["original", "alpha", "beta", "gamma"]
+        assert mock_retriever.retrieve.call_count == 4
+        assert result.answer == "Final answer"
+
+    def test_broaden_query_is_cached(self):
+        from core.rag.agentic.self_correcting_chain import SelfCorrectingRAGChain
+
+        mock_llm = MagicMock()
+        mock_llm.generate.return_value = MockLLMResponse(content=" broader ")
+        chain = SelfCorrectingRAGChain(retriever=MagicMock(), llm=mock_llm)
+
+        assert chain._broaden_query("q") == "broader"
+        assert chain._broaden_query("q") == "broader"
+        assert mock_llm.generate.call_count == 1
+
+    def test_broaden_cache_is_thread_safe(self):
+        import threading
+        from core.rag.agentic.self_correcting_chain import SelfCorrectingRAGChain
+
+        mock_llm = MagicMock()
+        mock_llm.generate.return_value = MockLLMResponse(content="broader")
+        chain = SelfCorrectingRAGChain(retriever=MagicMock(), llm=mock_llm)
+        chain.BROADEN_CACHE_SIZE = 4
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(200):
+                    chain._broaden_query(f"q{(i + offset) % 16}")
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert not errors
+        assert len(chain._broaden_cache) <= 4
+
+    def test_aquery_overlaps_broaden_with_retrieval(self):
+        import asyncio
+        import time
+        from core.rag.agentic.self_correcting_chain import SelfCorrectingRAGChain
+
+        low = MockRetrievalResult(
+            query="test",
+            chunks=[MockRetrievedChunk(id="1", text="Low", metadata={}, score=0.2)],
+            total_count=1,
+        )
+        high = MockRetrievalResult(
+            query="broadened",
+            chunks=[MockRetrievedChunk(id="2", text="High", metadata={}, score=0.9)],
+            total_count=1,
+        )
+
+        class SlowRetriever:
+            def __init__(self):
+                self.queries = []
+
+            def retrieve(self, query, top_k=5):
+                self.queries.append(query)
+                time.sleep(0.01)
+                return low if len(self.queries) == 1 else high
+
+        class AsyncLLM:
+            def __init__(self):
+                self.prompts = []
+                self.cancelled = 0
+
+            async def agenerate(self, messages, temperature=0.7, max_tokens=None):
+                prompt = messages[0]["content"]
+                self.prompts.append(prompt)
+                if "Rewritten query" in prompt:
+                    try:
+                        await asyncio.sleep(0.01)
+                    except asyncio.CancelledError:
+                        self.cancelled += 1
+                        raise
+                    return MockLLMResponse(content="broadened query")
+                return MockLLMResponse(content="Final answer")
+
+        retriever = SlowRetriever()
+        llm = AsyncLLM()
+        chain = SelfCorrectingRAGChain(
+            retriever=retriever, llm=llm, quality_threshold=0.5, max_retries=2
+        )
+
+        result = asyncio.run(chain.aquery("test question", speculative=True))
+
+        assert result.answer == "Final answer"
+        assert result.attempts == 2
+        assert result.all_queries == ["test question", "broadened query"]
+        assert retriever.queries == ["test question", "broadened query"]
+        # 두 번째 시도에서 미리 시작한 확장 요청은 품질 통과 후 취소됨
+        assert llm.cancelled == 1
+
+    def test_aquery_does_not_broaden_when_first_attempt_passes(self):
+        import asyncio
+        from core.rag.agentic.self_correcting_chain import SelfCorrectingRAGChain
+
+        good = MockRetrievalResult(
+            query="test",
+            chunks=[MockRetrievedChunk(id="1", text="Good", metadata={}, score=0.9)],
+            total_count=1,
+        )
+        mock_retriever = MagicMock()
+        mock_retriever.retrieve.return_value = good
+        mock_llm = MagicMock()
+        mock_llm.generate.return_value = MockLLMResponse(content="Final answer")
+
+        chain = SelfCorrectingRAGChain(
+            retriever=mock_retriever, llm=mock_llm, quality_threshold=0.5
+        )
+        result = asyncio.run(chain.aquery("test"))
+
+        assert result.attempts == 1
+        # 기본값(speculative=False)에서는 답변 생성 외 LLM 호출 없음
+        assert mock_llm.generate.call_count == 1
+
+    def test_aquery_falls_back_to_sync_clients(self):
+        import asyncio
+        from core.rag.agentic.self_correcting_chain import SelfCorrectingRAGChain
+
+        empty_result = MockRetrievalResult(query="test", chunks=[], total_count=0)
+
+        mock_retriever = MagicMock()
+        mock_retriever.retrieve.return_value = empty_result
+        mock_llm = MagicMock()
+        mock_llm.generate.side_effect = [
+            MockLLMResponse(content="broadened"),
+            MockLLMResponse(content="broader"),
+        ]
+
+        chain = SelfCorrectingRAGChain(retriever=mock_retriever, llm=mock_llm)
+        result = asyncio.run(chain.aquery("test", speculative=False))
+
+        assert result.attempts == 3
+        assert mock_retriever.retrieve.call_count == 3
+        assert "couldn't find" in result.answer.lower()
+
+
+    def test_stream_query_streams_only_final_answer(self):
+        from core.rag.agentic.self_correcting_chain import (
+            SelfCorrectingRAGChain,
+            CorrectionResult,
+        )
+
+        low = MockRetrievalResult(
+            query="test",
+            chunks=[MockRetrievedChunk(id="1", text="Low", metadata={}, score=0.2)],
+            total_count=1,
+        )
+        high = MockRetrievalResult(
+            query="broadened",
+            chunks=[MockRetrievedChunk(id="2", text="High", metadata={}, score=0.9)],
+            total_count=1,
+        )
+
+        mock_retriever = MagicMock()
+        mock_retriever.retrieve.side_effect = [low, high]
+        mock_llm = MagicMock()
+        mock_llm.generate.return_value = MockLLMResponse(content="broadened")
+        mock_llm.stream_generate.return_value = iter(["The ", "answer."])
+
+        chain = SelfCorrectingRAGChain(retriever=mock_retriever, llm=mock_llm)
+        stream = chain.stream_query("test")
+
+        chunks = []
+        while True:
+            try:
+                chunks.append(next(stream))
+            except StopIteration as stop:
+                result = stop.value
+                break
+
+        assert chunks == ["The ", "answer."]
+        assert isinstance(result, CorrectionResult)
+        assert result.answer == "The answer."
+        assert result.final_query == "broadened"
+        assert mock_llm.generate.call_count == 1  # 쿼리 확장만 비스트리밍
+
+    def test_stream_query_without_results(self):
+        from core.rag.agentic.self_correcting_chain import SelfCorrectingRAGChain
+
+        mock_retriever = MagicMock()
+        mock_retriever.retrieve.return_value = MockRetrievalResult(
+            query="test", chunks=[], total_count=0
+        )
+        mock_llm = MagicMock()
+        mock_llm.generate.return_value = MockLLMResponse(content="broadened")
+
+        chain = SelfCorrectingRAGChain(retriever=mock_retriever, llm=mock_llm)
+
+        assert list(chain.stream_query("test")) == [chain.NO_RESULT_ANSWER]
+        mock_llm.stream_generate.assert_not_called()
+
+
 class TestParallelQueryProcessor:
     def test_process_single_query(self):
         from core.rag.agentic.parallel_processor import ParallelQueryProcessor
@@ -264,6 +551,50 @@ class TestParallelQueryProcessor:
         assert len(results) == 3
         assert mock_retriever.retrieve.call_count == 3
 
+    def test_executor_reused_across_calls(self):
+        import threading
+        from core.rag.agentic.parallel_processor import ParallelQueryProcessor
+
+        thread_names = set()
+
+        def retrieve(query, top_k):
+            thread_names.add(threading.current_thread().name)
+            return MockRetrievalResult(query=query, chunks=[], total_count=0)
+
+        mock_retriever = MagicMock()
+        mock_retriever.retrieve.side_effect = retrieve
+
+        processor = ParallelQueryProcessor(retriever=mock_retriever, max_workers=2)
+        for _ in range(3):
+            assert len(processor.process_queries(["q1", "q2"])) == 2
+        processor.close()
+
+        assert len(thread_names) <= 2
+        assert all(name.startswith("rag-parallel") for name in thread_names)
+
+    def test_process_queries_async_runs_retrieve_in_executor(self):
+        import asyncio
+        import threading
+        from core.rag.agentic.parallel_processor import ParallelQueryProcessor
+
+        thread_names = []
+        mock_retriever = MagicMock()
+
+        def retrieve(query, top_k):
+            thread_names.append(threading.current_thread().name)
+            return MockRetrievalResult(query=query, chunks=[], total_count=0)
+
+        mock_retriever.retrieve.side_effect = retrieve
+
+        processor = ParallelQueryProcessor(retriever=mock_retriever, max_workers=2)
+        results = asyncio.run(
+            processor.process_queries_async(["q1", "q2", "q3", "q4"])
+        )
+        processor.close()
+
+        assert [r.query for r in results] == ["q1", "q2", "q3", "q4"]
+        assert all(name.startswith("rag-parallel") for name in thread_names)
+
     def test_aggregate_deduplicates_results(self):
         from core.rag.agentic.parallel_processor import ParallelQueryProcessor
 
@@ -304,6 +635,21 @@ class TestParallelQueryProcessor:
         assert aggregated.chunks[1].score == 0.6
         assert aggregated.chunks[2].score == 0.3
 
+    def test_aggregate_top_k_keeps_total_count(self):
+        from core.rag.agentic.parallel_processor import ParallelQueryProcessor
+
+        processor = ParallelQueryProcessor(retriever=MagicMock())
+
+        chunks = [
+            MockRetrievedChunk(id=str(i), text=str(i), metadata={}, score=i / 10)
+            for i in range(10)
+        ]
+        results = [MockRetrievalResult(query="q", chunks=chunks, total_count=10)]
+        aggregated = processor.aggregate_results(results, top_k=3)
+
+        assert [c.id for c in aggregated.chunks] == ["9", "8", "7"]
+        assert aggregated.total_count == 10
+
     def test_process_and_aggregate_combined(self):
         from core.rag.agentic.parallel_processor import ParallelQueryProcessor
 
@@ -445,6 +791,22 @@ Conclusion wrapping up the document with additional content to meet minimum requ
         assert found_parent is not None
         assert found_parent.id == "parent_1"
 
+    def test_get_parent_for_child_with_index(self):
+        from core.rag.agentic.hierarchical_chunker import HierarchicalChunker
+
+        chunker = HierarchicalChunker(
+            parent_chunk_size=500,
+            child_chunk_size=100,
+            min_chunk_size=20,
+        )
+
+        text = "# Title\n\n" + "Sentence with enough words to split. " * 30
+        parents, children = chunker.chunk(text, source="test.md")
+        index = chunker.build_parent_index(parents)
+
+        for child in children:
+            assert chunker.get_parent_for_child(child, index) is chunker.get_parent_for_child(child, parents)
+
     def test_chunk_flat_returns_all_chunks(self):
         from core.rag.agentic.hierarchical_chunker import HierarchicalChunker
 
@@ -468,6 +830,36 @@ Content for section two also with sufficient text content to be a valid chunk fo
         assert len(all_chunks) > 0
         assert any(c.is_parent for c in all_chunks)
 
+    def test_iter_chunks_streams_parent_then_children(self):
+        from core.rag.agentic.hierarchical_chunker import HierarchicalChunker
+
+        chunker = HierarchicalChunker(
+            parent_chunk_size=500,
+            child_chunk_size=100,
+            min_chunk_size=20,
+        )
+
+        text = "# Title\n\n" + "Sentence with enough words to split. " * 30
+
+        stream = chunker.iter_chunks(text, source="test.md")
+        parent = next(stream)
+        children = list(stream)
+
+        assert parent.is_parent
+        assert len(children) > 0
+        assert parent.children_ids == [c.id for c in children]
+        assert all(c.parent_id == parent.id for c in children)
+
+    def test_header_must_be_on_one_line(self):
+        from core.rag.agentic.hierarchical_chunker import HierarchicalChunker
+
+        chunker = HierarchicalChunker(min_chunk_size=10)
+
+        text = "# Real Title\n\nBody text under the real title.\n\n#\nNot a header line"
+        matches = list(chunker.HEADER_RE.finditer(text))
+
+        assert [m.group(2).strip() for m in matches] == ["Real Title"]
+
     def test_handles_text_without_headers(self):
         from core.rag.agentic.hierarchical_chunker import HierarchicalChunker
 
@@ -498,6 +890,19 @@ This is a longer section with enough content to pass the minimum chunk size thre
         for parent in parents:
             assert len(parent.text) >= 50 or len(parent.text) == 0
 
+    def test_chunk_ids_use_sanitized_source(self):
+        from core.rag.agentic.hierarchical_chunker import HierarchicalChunker
+
+        chunker = HierarchicalChunker(parent_chunk_size=100, min_chunk_size=20)
+
+        text = "Plain paragraph text that is long enough to become a chunk.\n\n" * 4
+
+        parents, _ = chunker.chunk(text, source="notes/my file-v2.md")
+
+        assert len(parents) > 1
+        for parent in parents:
+            assert parent.id.startswith("notes_my_file_v2_md::parent_")
+
 
 class TestIntegration:
     def test_query_rewriter_with_self_correcting_chain(self):
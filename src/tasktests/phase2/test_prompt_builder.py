@@ -133,5 +133,28 @@ class TestPromptTemplate:
         assert template.context_intro == "Custom intro:"
 
 
+    def test_render_matches_format(self):
+        """render가 str.format과 같은 결과를 내는지 확인 (이스케이프/변환 포함)"""
+        templates = [
+            DEFAULT_RAG_TEMPLATE.user_template,
+            "{{literal}} Q: {question}\nC: {context_section}",
+            "Q: {question!r}",
+        ]
+        for user_template in templates:
+            template = PromptTemplate(
+                name="t", system_prompt="S", user_template=user_template
+            )
+            expected = user_template.format(question="q{x}", context_section="ctx")
+            assert template.render("q{x}", "ctx") == expected
+            assert template.render("q{x}", "ctx") == expected  # 캐시된 파트 재사용
+
+    def test_render_follows_template_change(self):
+        """user_template 변경 후에도 새 템플릿으로 렌더링"""
+        template = PromptTemplate(name="t", system_prompt="S", user_template="A {question}")
+        assert template.render("q", "") == "A q"
+
+        template.user_template = "B {question}"
+        assert template.render("q", "") == "B q"
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -70,6 +70,46 @@ class TestRAGChain:
         # MockStore는 항상 2개 반환하지만 파라미터가 전달되는지만 확인
         assert response.retrieval_result is not None
 
+    def test_query_retrieves_once(self):
+        """검색은 질의당 한 번만 수행 (컨텍스트는 같은 결과로 포맷팅)"""
+        from core.rag import Retriever
+
+        class CountingStore(MockChromaStore):
+            calls = 0
+
+            def query(self, query_text, n_results=5, **kwargs):
+                CountingStore.calls += 1
+                return super().query(query_text, n_results, **kwargs)
+
+        chain = RAGChain(retriever=Retriever(CountingStore()), llm=FakeLLM())
+        chain.query("What is RAG?")
+        chain.stream_query("What is RAG?")
+
+        assert CountingStore.calls == 2
+
+    def test_stream_query_returns_response_on_completion(self, chain):
+        """스트림 청크를 전달하고 종료 시 RAGResponse를 반환하는지 확인"""
+        retrieval_result, stream = chain.stream_query("What is RAG?")
+
+        def consume():
+            response = yield from stream
+            return response
+
+        chunks = []
+        gen = consume()
+        while True:
+            try:
+                chunks.append(next(gen))
+            except StopIteration as stop:
+                response = stop.value
+                break
+
+        assert "".join(chunks).strip() == "This is the answer about RAG."
+        assert isinstance(response, RAGResponse)
+        assert response.answer == "".join(chunks)
+        assert response.retrieval_result is retrieval_result
+        assert response.model == "fake-llm"
+
     def test_custom_template(self):
         """커스텀 템플릿 적용 확인"""
         from core.rag import Retriever
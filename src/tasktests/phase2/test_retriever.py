@@ -107,6 +107,21 @@ class TestRetrieverUnit:
         # distance=None → score=0.0
         assert Retriever._distance_to_score(None) == 0.0
 
+    def test_format_context_numbered_layout(self):
+        """numbered 포맷의 정확한 출력 형태 확인"""
+        result = RetrievalResult(
+            query="q",
+            chunks=[
+                RetrievedChunk(id="1", text="first", metadata={"source": "a.md"}, distance=0.1, score=0.9),
+                RetrievedChunk(id="2", text="second\n", metadata={}, distance=0.2, score=0.8),
+            ],
+            total_count=2,
+        )
+
+        assert Retriever.format_context(result) == (
+            "[1] Source: a.md\nfirst\n\n[2] Source: unknown\nsecond"
+        )
+
     def test_retrieve_with_context_numbered(self, store_with_data):
         """numbered 포맷 컨텍스트 생성 확인"""
         retriever = Retriever(store_with_data)
@@ -161,5 +176,117 @@ class TestRetrieverWithMetadataFilter:
             assert chunk.metadata.get("folder_path") == "ai"
 
 
+
+class TestRetrieverCache:
+    """QueryCache 연동 테스트"""
+
+    def test_repeated_query_uses_cache_until_store_changes(self, tmp_path):
+        """정규화된 동일 쿼리는 캐시를 사용하고, 저장소 변경 시 다시 검색하는지 확인"""
+        from unittest.mock import patch
+        from core.rag import QueryCache
+        from core.preprocessing.markdown_preprocessor import Chunk
+
+        store = ChromaStore(
+            persist_path=str(tmp_path / "chroma_cache"),
+            collection_name="cache_test",
+            embedder=FakeEmbedder(dimension=8),
+        )
+        store.add_chunks([Chunk(text="Python tutorial", metadata={"source": "py.md"})])
+        retriever = Retriever(store, cache=QueryCache())
+
+        with patch.object(store, "query", wraps=store.query) as spy:
+            first = retriever.retrieve("Python  Tutorial", top_k=2)
+            second = retriever.retrieve("python tutorial", top_k=2)
+            assert spy.call_count == 1
+            assert second.query == "python tutorial"
+            assert [c.id for c in second.chunks] == [c.id for c in first.chunks]
+
+            retriever.retrieve("python tutorial", top_k=3)
+            assert spy.call_count == 2  # top_k가 다르면 별도 키
+
+            store.add_chunks([Chunk(text="More Python", metadata={"source": "more.md"})])
+            refreshed = retriever.retrieve("python tutorial", top_k=2)
+            assert spy.call_count == 3
+            assert refreshed.total_count == 2
+
+        store.clear()
+
+    def test_write_through_other_instance_invalidates_cache(self, tmp_path):
+        """같은 컬렉션을 다른 ChromaStore 인스턴스로 갱신해도 캐시가 무효화되는지 확인"""
+        from unittest.mock import patch
+        from core.rag import QueryCache
+        from core.preprocessing.markdown_preprocessor import Chunk
+
+        def open_store():
+            return ChromaStore(
+                persist_path=str(tmp_path / "chroma_shared"),
+                collection_name="shared_test",
+                embedder=FakeEmbedder(dimension=8),
+            )
+
+        store = open_store()
+        store.add_chunks([Chunk(text="Python tutorial", metadata={"source": "py.md"})])
+        retriever = Retriever(store, cache=QueryCache())
+
+        with patch.object(store, "query", wraps=store.query) as spy:
+            retriever.retrieve("python tutorial", top_k=2)
+            # sync 라우터처럼 별도 인스턴스로 쓰기
+            open_store().add_chunks([Chunk(text="More Python", metadata={"source": "more.md"})])
+            refreshed = retriever.retrieve("python tutorial", top_k=2)
+
+            assert spy.call_count == 2
+            assert refreshed.total_count == 2
+
+    def test_cache_entries_expire_after_ttl(self):
+        """ttl이 지난 항목은 다시 검색하는지 확인"""
+        from unittest.mock import MagicMock
+        from core.rag import QueryCache
+
+        now = [0.0]
+        store = MagicMock()
+        store.version = 0
+        store.embed_query.return_value = [1.0, 0.0]
+        store.query.return_value = [
+            {"id": "1", "text": "RAG", "metadata": {}, "distance": 0.1},
+        ]
+        retriever = Retriever(store, cache=QueryCache(ttl=10, clock=lambda: now[0]))
+
+        retriever.retrieve("what is rag")
+        now[0] = 9.0
+        retriever.retrieve("what is rag")
+        assert store.query.call_count == 1
+
+        now[0] = 10.0
+        retriever.retrieve("what is rag")
+        assert store.query.call_count == 2
+
+    def test_near_duplicate_query_reuses_result(self):
+        """임베딩 유사도가 임계값 이상인 쿼리는 이전 결과를 재사용하는지 확인"""
+        from unittest.mock import MagicMock
+        from core.rag import QueryCache
+
+        vectors = {
+            "what is rag": [1.0, 0.0, 0.0],
+            "what is rag?": [0.999, 0.01, 0.0],
+            "python": [0.0, 1.0, 0.0],
+        }
+        store = MagicMock()
+        store.version = 0
+        store.embed_query.side_effect = lambda q: vectors[q.lower()]
+        store.query.return_value = [
+            {"id": "1", "text": "RAG", "metadata": {}, "distance": 0.1},
+        ]
+
+        retriever = Retriever(store, cache=QueryCache(similarity_threshold=0.98))
+        retriever.retrieve("What is RAG")
+        hit = retriever.retrieve("what is RAG?")
+        retriever.retrieve("python")
+
+        assert store.query.call_count == 2
+        assert hit.query == "what is RAG?"
+        assert hit.total_count == 1
+        # 근사 일치 조회에 쓴 임베딩을 검색에도 재사용
+        assert store.query.call_args.kwargs["query_embedding"] == vectors["python"]
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
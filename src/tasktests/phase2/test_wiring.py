@@ -7,6 +7,8 @@ from contextlib import asynccontextmanager
 from api.main import app, lifespan
 from api.deps import get_app_state, get_chroma_store, get_rag_chain, get_syncer
 from config.models import OpenAILLMConfig, OpenAIEmbeddingConfig
+from core.llm import RetryingLLM
+from core.rag import QueryCache
 
 @pytest.fixture
 def mock_deps():
@@ -92,11 +94,15 @@ def test_lifespan_initializes_app_state(mock_deps):
         assert config_call.model_name == "gpt-4o-mini"
         
         # Verify Retriever & RAGChain wiring
-        mock_deps["retriever"].assert_called_once_with(mock_deps["instances"]["store"])
-        mock_deps["rag"].assert_called_once_with(
-            retriever=mock_deps["retriever"].return_value, 
-            llm=mock_deps["llm"].create.return_value
-        )
+        mock_deps["retriever"].assert_called_once()
+        retriever_call = mock_deps["retriever"].call_args
+        assert retriever_call.args == (mock_deps["instances"]["store"],)
+        assert isinstance(retriever_call.kwargs["cache"], QueryCache)
+        mock_deps["rag"].assert_called_once()
+        rag_kwargs = mock_deps["rag"].call_args.kwargs
+        assert rag_kwargs["retriever"] is mock_deps["retriever"].return_value
+        assert isinstance(rag_kwargs["llm"], RetryingLLM)
+        assert rag_kwargs["llm"].wrapped is mock_deps["llm"].create.return_value
         
         # Verify Syncer wiring
         mock_deps["syncer"].assert_called_once_with(
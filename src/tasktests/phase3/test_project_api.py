@@ -127,6 +127,16 @@ def test_project_staleness_logic():
     is_stale, days = ProjectStatus.calculate_staleness(p_new)
     assert is_stale is True # Based on created_at if last_modified is None
 
+def test_project_staleness_with_shared_now():
+    """Naive datetimes are treated as UTC and now_ts can be shared across projects."""
+    now = datetime.now(timezone.utc)
+    past = (now - timedelta(days=31, hours=1)).replace(tzinfo=None)
+    p_naive = Project(name="Naive", path="E", last_modified_at=past)
+
+    is_stale, days = ProjectStatus.calculate_staleness(p_naive, now.timestamp())
+    assert is_stale is True
+    assert days == 31
+
 # ----------------------------------------------------------------------------
 # Test: API Integration
 # ----------------------------------------------------------------------------
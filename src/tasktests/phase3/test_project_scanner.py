@@ -150,3 +150,26 @@ def test_scan_all_projects(session: Session, temp_vault: Path):
     assert p_a.last_modified_at > old_time
     assert p_b.last_modified_at == p_b_initial_time
     assert p_c.last_modified_at == old_time
+
+def test_scan_skips_hidden_and_ignored_folders(session: Session, temp_vault: Path):
+    """숨김/제외 폴더의 파일과 .md가 아닌 파일은 세지 않는지 테스트"""
+    proj_dir = temp_vault / "Proj"
+    (proj_dir / "sub").mkdir(parents=True)
+    (proj_dir / ".obsidian").mkdir()
+    (proj_dir / "node_modules").mkdir()
+
+    (proj_dir / "a.md").write_text("A")
+    (proj_dir / "sub" / "b.md").write_text("B")
+    (proj_dir / "sub" / "image.png").write_text("png")
+    (proj_dir / ".obsidian" / "workspace.md").write_text("hidden")
+    (proj_dir / "node_modules" / "readme.md").write_text("ignored")
+
+    project = Project(name="Proj", path="Proj")
+    session.add(project)
+    session.commit()
+    session.refresh(project)
+
+    scanner = ProjectScanner(session, temp_vault)
+
+    assert scanner.scan_project(project) is True
+    assert project.file_count == 2
@@ -0,0 +1,197 @@
+import os
+import pytest
+import time
+from pathlib import Path
+from datetime import datetime, timezone
+from sqlmodel import Session, SQLModel, create_engine, select
+from sqlalchemy.pool import StaticPool
+
+from core.domain.project import Project
+from core.project.scanner import ProjectScanner
+from core.project.watcher import ProjectWatcher
+
+# ----------------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------------
+
+@pytest.fixture(name="session")
+def session_fixture():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+@pytest.fixture
+def temp_vault(tmp_path):
+    """임시 Vault 디렉토리 생성"""
+    vault = tmp_path / "Vault"
+    vault.mkdir()
+    return vault
+
+
+class _RunningWatcher(ProjectWatcher):
+    """감시 스레드 없이 실행 중인 것처럼 동작하는 테스트용 Watcher"""
+
+    @property
+    def is_running(self) -> bool:
+        return True
+
+# ----------------------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------------------
+
+def test_changes_map_to_project(temp_vault: Path):
+    """변경 경로가 해당 프로젝트 id로 매핑되는지 테스트"""
+    (temp_vault / "A" / "sub").mkdir(parents=True)
+    (temp_vault / "AB").mkdir()
+
+    watcher = ProjectWatcher(temp_vault)
+    watcher.sync_projects({1: "A", 2: "AB"})
+    assert watcher.drain_dirty() == {1, 2}  # 신규 등록 프로젝트는 dirty
+
+    seen = []
+    watcher.add_listener(seen.append)
+    changed = str((temp_vault / "A" / "sub" / "note.md").resolve())
+    watcher._on_changes([changed])
+
+    assert watcher.drain_dirty() == {1}  # "AB"는 prefix만 같으므로 제외
+    assert seen == [changed]
+    assert watcher.drain_dirty() == set()
+
+def test_scan_all_only_scans_dirty_projects(session: Session, temp_vault: Path):
+    """watcher 실행 중에는 dirty 프로젝트만 스캔하는지 테스트"""
+    old_time = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    for name in ("A", "B"):
+        (temp_vault / name).mkdir()
+        (temp_vault / name / "note.md").write_text(name)
+    p_a = Project(name="A", path="A", last_modified_at=old_time)
+    p_b = Project(name="B", path="B", last_modified_at=old_time)
+    session.add_all([p_a, p_b])
+    session.commit()
+
+    watcher = _RunningWatcher(temp_vault)
+    scanner = ProjectScanner(session, temp_vault, watcher=watcher)
+
+    # 첫 스캔: 모든 프로젝트가 신규이므로 전체 스캔
+    assert scanner.scan_all() == 2
+
+    # 변경 없음 -> 스캔 대상 없음
+    assert scanner.scan_all() == 0
+
+    # B만 변경 이벤트 발생
+    time.sleep(0.05)
+    (temp_vault / "B" / "new.md").write_text("new")
+    watcher._on_changes([str((temp_vault / "B" / "new.md").resolve())])
+
+    assert scanner.scan_all() == 1
+    session.refresh(p_b)
+    assert p_b.file_count == 2
+
+def test_watcher_detects_real_changes(temp_vault: Path):
+    """실제 파일 시스템 이벤트로 dirty 표시되는지 테스트"""
+    pytest.importorskip("watchfiles")
+    (temp_vault / "A").mkdir()
+
+    watcher = ProjectWatcher(temp_vault)
+    watcher.sync_projects({1: "A"})
+    watcher.drain_dirty()
+    watcher.start()
+    try:
+        assert watcher.is_running
+        time.sleep(0.3)
+        (temp_vault / "A" / "note.md").write_text("hello")
+
+        deadline = time.time() + 10
+        dirty = set()
+        while time.time() < deadline and not dirty:
+            time.sleep(0.1)
+            dirty = watcher.drain_dirty()
+        assert dirty == {1}
+    finally:
+        watcher.stop()
+    assert not watcher.is_running
+
+def test_scan_all_detects_content_edit_with_subtree_cache(session: Session, temp_vault: Path):
+    """하위 트리 캐시 사용 중에도 이벤트가 온 파일 수정은 반영되는지 테스트"""
+    (temp_vault / "A" / "sub").mkdir(parents=True)
+    note = temp_vault / "A" / "sub" / "note.md"
+    note.write_text("v1")
+    base = time.time() + 1000  # 생성 시각 기본값보다 이후
+    os.utime(note, (base, base))
+    project = Project(name="A", path="A")
+    session.add(project)
+    session.commit()
+
+    watcher = _RunningWatcher(temp_vault)
+    scanner = ProjectScanner(session, temp_vault, watcher=watcher)
+    assert scanner.scan_all() == 1
+    assert len(scanner.subtree_cache) > 0
+
+    # 내용 수정은 디렉터리 mtime을 바꾸지 않음 -> 이벤트로 무효화
+    note.write_text("v2")
+    os.utime(note, (base + 1000, base + 1000))
+    watcher._on_changes([str(note.resolve())])
+
+    assert scanner.scan_all() == 1
+    session.refresh(project)
+    assert project.last_modified_at.replace(tzinfo=timezone.utc).timestamp() == pytest.approx(base + 1000)
+
+def test_refresher_rescans_only_changed_projects(temp_vault: Path):
+    """ProjectRefresher가 스캔마다 새 세션을 열고 변경된 프로젝트만 다시 스캔하는지 테스트"""
+    from core.project.refresher import ProjectRefresher
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    (temp_vault / "A").mkdir()
+    note = temp_vault / "A" / "note.md"
+    note.write_text("v1")
+    with Session(engine) as session:
+        session.add(Project(name="A", path="A"))
+        session.commit()
+
+    refresher = ProjectRefresher(engine, temp_vault, watcher=_RunningWatcher(temp_vault))
+    assert refresher.refresh() == 1  # 신규 프로젝트는 dirty
+    assert refresher.refresh() == 0  # 이벤트가 없으면 스캔하지 않음
+
+    changed = time.time() + 1000
+    os.utime(note, (changed, changed))
+    refresher.watcher._on_changes([str(note.resolve())])
+    assert refresher.refresh() == 1
+    with Session(engine) as session:
+        project = session.exec(select(Project)).one()
+    assert project.last_modified_at.replace(tzinfo=timezone.utc).timestamp() == pytest.approx(changed)
+
+def test_refresher_start_stop(temp_vault: Path):
+    """ProjectRefresher 시작/중지 시 감시 스레드도 함께 시작/중지되는지 테스트"""
+    pytest.importorskip("watchfiles")
+    from core.project.refresher import ProjectRefresher
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    (temp_vault / "A").mkdir()
+    with Session(engine) as session:
+        session.add(Project(name="A", path="A"))
+        session.commit()
+
+    refresher = ProjectRefresher(engine, temp_vault, interval=60)
+    refresher.start()
+    try:
+        deadline = time.time() + 5
+        while time.time() < deadline and not refresher.watcher.is_running:
+            time.sleep(0.05)
+        assert refresher.watcher.is_running
+    finally:
+        refresher.stop()
+    assert not refresher.watcher.is_running
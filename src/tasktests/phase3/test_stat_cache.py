@@ -0,0 +1,103 @@
+import os
+from pathlib import Path
+
+from core.project.stat_cache import StatCache, SubtreeCache
+from core.project.scanner import ProjectScanner, _scan_mtimes
+from core.project.watcher import ProjectWatcher
+
+# ----------------------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------------------
+
+def test_cached_mtime_until_invalidated(tmp_path: Path):
+    """TTL 내에는 캐시된 mtime을 반환하고, 무효화 후 다시 stat 하는지 테스트"""
+    note = tmp_path / "note.md"
+    note.write_text("v1")
+    os.utime(note, (1000, 1000))
+
+    cache = StatCache(ttl=60)
+    assert cache.get_mtime(str(note)) == 1000
+
+    os.utime(note, (2000, 2000))
+    assert cache.get_mtime(str(note)) == 1000  # TTL 내 캐시 사용
+
+    cache.invalidate(str(note))
+    assert cache.get_mtime(str(note)) == 2000
+
+def test_expired_and_evicted_entries(tmp_path: Path):
+    """TTL 만료 및 maxsize 초과 시 LRU 제거 테스트"""
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"{i}.md"
+        path.write_text(str(i))
+        paths.append(str(path))
+
+    cache = StatCache(maxsize=2, ttl=0)
+    for path in paths:
+        cache.get_mtime(path)
+    assert len(cache) == 2
+
+    os.utime(paths[2], (3000, 3000))
+    assert cache.get_mtime(paths[2]) == 3000  # ttl=0 이므로 매번 stat
+
+def test_watcher_events_invalidate_scanner_cache(tmp_path: Path):
+    """watcher 변경 이벤트가 scanner의 stat 캐시를 무효화하는지 테스트"""
+    note = tmp_path / "note.md"
+    note.write_text("v1")
+
+    cache = StatCache(ttl=60)
+    watcher = ProjectWatcher(tmp_path)
+    ProjectScanner(session=None, vault_root=tmp_path, watcher=watcher, stat_cache=cache)
+
+    cache.get_mtime(str(note))
+    assert len(cache) == 1
+
+    watcher._on_changes([str(note)])
+    assert len(cache) == 0
+
+def test_scanner_without_running_watcher_skips_stat_cache(tmp_path: Path):
+    """변경 이벤트로 무효화할 수 없으면(watcher 없음/중지) stat 캐시를 쓰지 않는지 테스트"""
+    (tmp_path / "P").mkdir()
+    note = tmp_path / "P" / "note.md"
+    note.write_text("v1")
+    os.utime(note, (1000, 1000))
+
+    cache = StatCache(ttl=60)
+    for watcher in (None, ProjectWatcher(tmp_path)):
+        scanner = ProjectScanner(session=None, vault_root=tmp_path, watcher=watcher, stat_cache=cache)
+        assert scanner._compute_state(tmp_path / "P", None, scanner._active_stat_cache()) == (1000, 1)
+        assert len(cache) == 0
+
+def test_subtree_cache_invalidates_ancestors(tmp_path: Path):
+    """변경 경로의 모든 상위 디렉터리 항목이 무효화되는지 테스트"""
+    cache = SubtreeCache()
+    root = str(tmp_path)
+    sub = str(tmp_path / "a")
+    other = str(tmp_path / "b")
+    for path in (root, sub, other):
+        cache.put(path, 1, 100.0, 1)
+
+    cache.invalidate(str(tmp_path / "a" / "note.md"))
+
+    assert cache.get(root, 1) is None
+    assert cache.get(sub, 1) is None
+    assert cache.get(other, 1) == (100.0, 1)
+    assert cache.get(other, 2) is None  # 디렉터리 mtime 변경 시 미사용
+
+def test_subtree_cache_rescans_only_changed_branch(tmp_path: Path):
+    """watcher 실행 중 이벤트가 온 하위 트리만 재탐색하는지 테스트"""
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "note.md").write_text(name)
+        os.utime(tmp_path / name / "note.md", (1000, 1000))
+
+    cache = SubtreeCache()
+    assert _scan_mtimes(tmp_path, subtree_cache=cache) == (1000, 2)
+
+    # 이벤트 없이 내용만 바뀐 b는 캐시 결과 사용, 이벤트가 온 a는 재탐색
+    os.utime(tmp_path / "a" / "note.md", (2000, 2000))
+    os.utime(tmp_path / "b" / "note.md", (3000, 3000))
+    cache.invalidate(str(tmp_path / "a" / "note.md"))
+
+    assert _scan_mtimes(tmp_path, subtree_cache=cache) == (2000, 2)
+    assert _scan_mtimes(tmp_path) == (3000, 2)
@@ -5,15 +5,52 @@ OpenAI API 연동 테스트입니다.
 실제 API 호출이 필요하며, OPENAI_API_KEY 환경변수가 설정되어 있어야 합니다.
 """
 
+import asyncio
+import json
 import os
+import httpx
 import pytest
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 # src 디렉토리를 path에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from core.llm import OpenAILLM, LLMResponse
+from core.llm import AsyncOpenAILLM, OpenAILLM, LLMResponse, ResponseCache
+from core.llm import http_client
+from core.llm.openai_llm import _dedupe_messages, _normalize_for_caching
+
+
+def _fake_completion(content: str = "cached answer", cached_tokens: int = 0):
+    """chat.completions.create 반환값 모사 (파싱된 SDK 모델)"""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        model="gpt-4o-mini",
+        usage=SimpleNamespace(
+            prompt_tokens=7,
+            completion_tokens=3,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=cached_tokens),
+        ),
+    )
+
+
+def _mock_raw_create(llm, content: str = "cached answer", cached_tokens: int = 0):
+    """llm의 클라이언트를 with_raw_response.create 모의 객체로 교체"""
+    body = {
+        "model": "gpt-4o-mini",
+        "choices": [{"message": {"role": "assistant", "content": content}}],
+        "usage": {
+            "prompt_tokens": 7,
+            "completion_tokens": 3,
+            "prompt_tokens_details": {"cached_tokens": cached_tokens},
+        },
+    }
+    llm._client = MagicMock()
+    create = llm._client.chat.completions.with_raw_response.create
+    create.return_value = SimpleNamespace(content=json.dumps(body).encode())
+    return create
 
 
 @pytest.mark.integration
@@ -75,6 +112,204 @@ class TestOpenAILLMUnit:
         
         assert llm.model_name == "gpt-4o-mini"
 
+    def test_instances_share_http_client(self):
+        """여러 인스턴스가 동일한 httpx 커넥션 풀을 공유하는지 테스트"""
+        llm_a = OpenAILLM(api_key="sk-test-fake-key-a")
+        llm_b = OpenAILLM(api_key="sk-test-fake-key-b")
+
+        assert llm_a._client._client is llm_b._client._client
+
+    def test_same_api_key_reuses_client(self):
+        """같은 API 키는 OpenAI 클라이언트 인스턴스를 재사용하는지 테스트"""
+        llm_a = OpenAILLM(api_key="sk-test-fake-key")
+        llm_b = OpenAILLM(model_name="gpt-4o", api_key="sk-test-fake-key")
+        llm_c = OpenAILLM(api_key="sk-test-other-key")
+
+        assert llm_a._client is llm_b._client
+        assert llm_a._client is not llm_c._client
+
+    def test_client_retries_with_backoff(self):
+        """429/5xx 재시도 설정 테스트"""
+        llm = OpenAILLM(api_key="sk-test-fake-key")
+
+        assert llm._client.max_retries == 3
+
+    def test_deterministic_response_cache(self):
+        """temperature=0 동일 요청은 API를 한 번만 호출하는지 테스트"""
+        llm = OpenAILLM(api_key="sk-test-fake-key", response_cache=ResponseCache())
+        create = _mock_raw_create(llm)
+        messages = [{"role": "user", "content": "hi"}]
+
+        first = llm.generate(messages, temperature=0)
+        second = llm.generate(messages, temperature=0)
+
+        assert create.call_count == 1
+        assert first.content == "cached answer"
+        assert second == first
+        assert llm.response_cache.cache_hits == 1
+        assert llm.response_cache.cache_misses == 1
+
+    def test_usage_reports_cached_input_tokens(self):
+        """usage에 프롬프트 캐시 토큰 수가 포함되는지 테스트"""
+        llm = OpenAILLM(api_key="sk-test-fake-key", response_cache=ResponseCache())
+        _mock_raw_create(llm, cached_tokens=5)
+
+        response = llm.generate([{"role": "user", "content": "hi"}])
+
+        assert response.usage["cached_input_tokens"] == 5
+
+    def test_temperature_omitted_for_fixed_models(self):
+        """temperature 고정 모델은 temperature 인자를 보내지 않는지 테스트"""
+        llm = OpenAILLM(model_name="gpt-5-mini", api_key="sk-test-fake-key")
+        create = _mock_raw_create(llm)
+
+        llm.generate([{"role": "user", "content": "hi"}], temperature=0.3)
+
+        kwargs = create.call_args.kwargs
+        assert "temperature" not in kwargs
+        assert kwargs["model"] == "gpt-5-mini"
+
+    def test_non_zero_temperature_bypasses_cache(self):
+        """temperature>0 요청은 캐시하지 않는지 테스트"""
+        llm = OpenAILLM(api_key="sk-test-fake-key", response_cache=ResponseCache())
+        create = _mock_raw_create(llm)
+        messages = [{"role": "user", "content": "hi"}]
+
+        llm.generate(messages, temperature=0.7)
+        llm.generate(messages, temperature=0.7)
+
+        assert create.call_count == 2
+        assert len(llm.response_cache) == 0
+
+    def test_stream_generate_batches_small_deltas(self):
+        """작은 delta가 묶여서 반환되고 usage가 기록되는지 테스트"""
+        llm = OpenAILLM(api_key="sk-test-fake-key", flush_interval=60.0)
+        llm._client = MagicMock()
+        deltas = ["a"] * 100
+        chunks = [
+            SimpleNamespace(
+                usage=None,
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=d))],
+            )
+            for d in deltas
+        ]
+        chunks.append(
+            SimpleNamespace(
+                usage=SimpleNamespace(
+                    prompt_tokens=4, completion_tokens=100, prompt_tokens_details=None
+                ),
+                choices=[],
+            )
+        )
+        llm._client.chat.completions.create.return_value = iter(chunks)
+
+        output = list(llm.stream_generate([{"role": "user", "content": "hi"}]))
+
+        assert "".join(output) == "a" * 100
+        assert output[0] == "a"  # 첫 청크는 즉시 반환
+        assert len(output) == 3  # 1 + 64 + 35
+        assert llm._last_stream_usage["output_tokens"] == 100
+
+
+class TestAsyncOpenAILLMUnit:
+    """비동기 OpenAI LLM 단위 테스트 (API 호출 없음)"""
+
+    def test_requires_api_key(self):
+        """API 키 없이 생성 시 ValueError"""
+        with pytest.raises(ValueError):
+            AsyncOpenAILLM(api_key=None)
+
+    def test_agenerate_concurrently(self):
+        """asyncio.gather로 여러 요청을 동시에 처리하는지 테스트"""
+        llm = AsyncOpenAILLM(api_key="sk-test-fake-key")
+        llm._client = MagicMock()
+        llm._client.chat.completions.create = AsyncMock(
+            return_value=_fake_completion("async answer")
+        )
+
+        async def run():
+            batches = [[{"role": "user", "content": f"q{i}"}] for i in range(3)]
+            return await asyncio.gather(*[llm.agenerate(m) for m in batches])
+
+        responses = asyncio.run(run())
+
+        assert [r.content for r in responses] == ["async answer"] * 3
+        assert llm._client.chat.completions.create.await_count == 3
+
+
+class TestPrewarmConnection:
+    """연결 사전 워밍 테스트"""
+
+    def test_prewarm_once_per_origin(self, monkeypatch):
+        """origin당 한 번만 인증 없는 HEAD 요청을 보내는지 테스트"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(401)
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(http_client, "get_shared_http_client", lambda: client)
+        monkeypatch.setattr(http_client, "_prewarmed_origins", set())
+
+        thread = http_client.prewarm_connection("https://api.example.com/v1/")
+        thread.join(timeout=5)
+
+        assert http_client.prewarm_connection("https://api.example.com/v1/chat") is None
+        assert len(requests) == 1
+        assert requests[0].method == "HEAD"
+        assert str(requests[0].url) == "https://api.example.com/"
+        assert "authorization" not in requests[0].headers
+
+
+class TestNormalizeForCaching:
+    """프롬프트 캐시용 메시지 정규화 테스트"""
+
+    def test_merges_leading_system_messages(self):
+        """앞쪽 system 메시지 병합 및 끝 공백 제거"""
+        messages = [
+            {"role": "system", "content": "You are helpful.  \n"},
+            {"role": "system", "content": "Use the context."},
+            {"role": "user", "content": "hi"},
+        ]
+
+        result = _normalize_for_caching(messages)
+
+        assert result == [
+            {"role": "system", "content": "You are helpful.\n\nUse the context."},
+            {"role": "user", "content": "hi"},
+        ]
+
+    def test_returns_same_list_when_already_normalized(self):
+        """정규화가 필요 없으면 원본 리스트 반환"""
+        messages = [
+            {"role": "system", "content": "You are helpful."},
+            {"role": "user", "content": "hi"},
+        ]
+
+        assert _normalize_for_caching(messages) is messages
+
+
+class TestDedupeMessages:
+    """연속 중복 메시지 제거 테스트"""
+
+    def test_drops_consecutive_duplicates(self):
+        """연속된 동일 메시지만 제거"""
+        system = {"role": "system", "content": "You are helpful."}
+        user = {"role": "user", "content": "hi"}
+        messages = [system, dict(system), user, system]
+
+        assert _dedupe_messages(messages) == [system, user, system]
+
+    def test_returns_same_list_without_duplicates(self):
+        """중복이 없으면 원본 리스트 반환"""
+        messages = [
+            {"role": "user", "content": "hi"},
+            {"role": "assistant", "content": "hi"},
+        ]
+
+        assert _dedupe_messages(messages) is messages
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,96 @@
+"""
+Response Cache Unit Tests
+
+temperature=0 응답 캐시를 테스트합니다.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# src 디렉토리를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.llm import LLMResponse, ResponseCache
+
+
+def _response(content: str = "answer") -> LLMResponse:
+    return LLMResponse(
+        content=content,
+        model="gpt-4o-mini",
+        usage={"input_tokens": 10, "output_tokens": 5},
+    )
+
+
+class TestMakeKey:
+    """캐시 키 생성 테스트"""
+
+    def test_same_request_same_key(self):
+        """동일 요청은 동일 키"""
+        messages = [{"role": "user", "content": "hi"}]
+
+        assert ResponseCache.make_key("m", messages, 10) == ResponseCache.make_key(
+            "m", [dict(m) for m in messages], 10
+        )
+
+    def test_message_boundaries_are_distinct(self):
+        """메시지 경계만 다른 요청은 다른 키"""
+        a = [{"role": "user", "content": "ab"}, {"role": "user", "content": "c"}]
+        b = [{"role": "user", "content": "a"}, {"role": "user", "content": "bc"}]
+
+        assert ResponseCache.make_key("m", a, None) != ResponseCache.make_key(
+            "m", b, None
+        )
+
+    def test_parameters_affect_key(self):
+        """model, max_tokens, 추가 필드가 키에 반영"""
+        messages = [{"role": "user", "content": "hi"}]
+        base = ResponseCache.make_key("m", messages, None)
+
+        assert ResponseCache.make_key("other", messages, None) != base
+        assert ResponseCache.make_key("m", messages, 10) != base
+        assert (
+            ResponseCache.make_key(
+                "m", [{"role": "user", "content": "hi", "name": "kim"}], None
+            )
+            != base
+        )
+
+
+class TestResponseCache:
+    """캐시 저장/조회 테스트"""
+
+    def test_hit_and_miss_stats(self):
+        """hit/miss 통계"""
+        cache = ResponseCache()
+
+        assert cache.get("k") is None
+        cache.put("k", _response())
+
+        assert cache.get("k").content == "answer"
+        assert cache.stats == {"hits": 1, "misses": 1}
+
+    def test_lru_eviction(self):
+        """maxsize 초과 시 가장 오래 사용되지 않은 항목 제거"""
+        cache = ResponseCache(maxsize=2)
+        cache.put("a", _response("a"))
+        cache.put("b", _response("b"))
+        cache.get("a")
+        cache.put("c", _response("c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a").content == "a"
+        assert len(cache) == 2
+
+    def test_returned_response_is_isolated(self):
+        """반환된 응답을 수정해도 캐시 항목은 변하지 않음"""
+        cache = ResponseCache()
+        cache.put("k", _response())
+
+        cache.get("k").content = "changed"
+
+        assert cache.get("k").content == "answer"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,199 @@
+"""
+LLM Retry Unit Tests
+
+RetryingLLM의 재시도/Retry-After 처리와 CircuitBreaker 동작을 테스트합니다.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# src 디렉토리를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.llm import FakeLLM, LLMResponse, Usage
+from core.llm.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryingLLM,
+    with_llm_retry,
+)
+
+
+class _StatusError(Exception):
+    """status_code/response를 가진 SDK 예외 흉내"""
+
+    def __init__(self, status_code: int, headers: dict | None = None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+class _FlakyLLM(FakeLLM):
+    """지정한 예외들을 순서대로 던진 뒤 정상 응답"""
+
+    def __init__(self, errors):
+        super().__init__(response="ok")
+        self._errors = list(errors)
+        self.calls = 0
+
+    def generate(self, messages, *, temperature=0.7, max_tokens=None):
+        self.calls += 1
+        if self._errors:
+            raise self._errors.pop(0)
+        return LLMResponse(content="ok", model="fake", usage=Usage())
+
+    def stream_generate(self, messages, *, temperature=0.7, max_tokens=None):
+        self.calls += 1
+        if self._errors:
+            raise self._errors.pop(0)
+        yield "ok"
+
+
+class TestRetryingLLM:
+    """RetryingLLM 테스트"""
+
+    def test_retries_transient_errors_with_retry_after(self):
+        """429/5xx는 재시도하고 Retry-After 헤더만큼 대기"""
+        llm = _FlakyLLM([_StatusError(429, {"retry-after": "2"}), _StatusError(503)])
+        sleeps = []
+        wrapped = RetryingLLM(llm, breaker=CircuitBreaker(), sleep=sleeps.append)
+
+        response = wrapped.generate([{"role": "user", "content": "hi"}])
+
+        assert response.content == "ok"
+        assert llm.calls == 3
+        assert sleeps[0] == 2.0
+        assert 0 <= sleeps[1] <= 1.0  # base_delay * 2^1 이하 (full jitter)
+
+    def test_non_transient_error_is_not_retried(self):
+        """400 등 영구 오류는 즉시 전파"""
+        llm = _FlakyLLM([_StatusError(400)])
+        wrapped = RetryingLLM(llm, breaker=CircuitBreaker(), sleep=lambda _: None)
+
+        with pytest.raises(_StatusError):
+            wrapped.generate([])
+        assert llm.calls == 1
+
+    def test_gives_up_after_max_retries(self):
+        """max_retries 초과 시 마지막 예외 전파"""
+        llm = _FlakyLLM([TimeoutError()] * 3)
+        wrapped = RetryingLLM(
+            llm, max_retries=2, breaker=CircuitBreaker(), sleep=lambda _: None
+        )
+
+        with pytest.raises(TimeoutError):
+            wrapped.generate([])
+        assert llm.calls == 3
+
+    def test_stream_retries_before_first_chunk(self):
+        """첫 청크 이전 실패는 스트리밍도 재시도"""
+        llm = _FlakyLLM([ConnectionError()])
+        wrapped = RetryingLLM(llm, breaker=CircuitBreaker(), sleep=lambda _: None)
+
+        assert list(wrapped.stream_generate([])) == ["ok"]
+        assert llm.calls == 2
+
+    def test_delegates_attributes(self):
+        """model_name 및 구현체 고유 속성 위임"""
+        llm = FakeLLM()
+        wrapped = with_llm_retry(llm)
+
+        assert wrapped.model_name == "fake-llm"
+        assert wrapped._last_stream_usage is None
+        assert with_llm_retry(wrapped) is wrapped
+
+    def test_sdk_retrying_llm_is_not_retried_again(self):
+        """SDK가 재시도하는 구현체는 래퍼에서 재시도하지 않음"""
+        llm = _FlakyLLM([_StatusError(503)])
+        llm.handles_retries = True
+        wrapped = with_llm_retry(llm, breaker=CircuitBreaker(), sleep=lambda _: None)
+
+        with pytest.raises(_StatusError):
+            wrapped.generate([])
+        assert llm.calls == 1
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker 테스트"""
+
+    def test_opens_after_threshold_and_recovers(self):
+        """연속 실패 시 열리고 reset_timeout 후 시험 호출 성공 시 닫힘"""
+        now = [0.0]
+        breaker = CircuitBreaker(
+            failure_threshold=2, window=10, reset_timeout=30, clock=lambda: now[0]
+        )
+        llm = _FlakyLLM([_StatusError(500), _StatusError(500)])
+        wrapped = RetryingLLM(llm, max_retries=0, breaker=breaker)
+
+        for _ in range(2):
+            with pytest.raises(_StatusError):
+                wrapped.generate([])
+
+        with pytest.raises(CircuitOpenError):
+            wrapped.generate([])
+        assert llm.calls == 2  # 열린 동안은 호출하지 않음
+
+        now[0] = 31.0
+        assert wrapped.generate([]).content == "ok"
+        assert not breaker.is_open
+
+    def test_failures_outside_window_do_not_open(self):
+        """window 밖의 실패는 누적되지 않음"""
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=2, window=10, clock=lambda: now[0])
+
+        breaker.record_failure()
+        now[0] = 20.0
+        breaker.record_failure()
+
+        assert breaker.allow()
+
+    def test_half_open_allows_single_trial(self):
+        """reset_timeout 후에는 시험 호출 하나만 허용하고 결과가 나오면 해제"""
+        import threading
+
+        now = [0.0]
+        breaker = CircuitBreaker(
+            failure_threshold=1, window=10, reset_timeout=30, clock=lambda: now[0]
+        )
+        breaker.record_failure()
+        now[0] = 31.0
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(breaker.allow()))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results.count(True) == 1
+
+        # 시험 호출 실패 → 다시 열리고, 다음 시험 호출도 하나만
+        breaker.record_failure()
+        assert not breaker.allow()
+        now[0] = 62.0
+        assert breaker.allow()
+        assert not breaker.allow()
+
+        # 시험 호출 성공 → 닫힘
+        breaker.record_success()
+        assert breaker.allow()
+        assert breaker.allow()
+
+    def test_unreported_trial_is_released_after_reset_timeout(self):
+        """결과가 보고되지 않은 시험 호출은 reset_timeout 후 다른 호출에 양보"""
+        now = [0.0]
+        breaker = CircuitBreaker(
+            failure_threshold=1, window=10, reset_timeout=30, clock=lambda: now[0]
+        )
+        breaker.record_failure()
+        now[0] = 31.0
+        assert breaker.allow()
+        assert not breaker.allow()
+
+        now[0] = 61.0
+        assert breaker.allow()
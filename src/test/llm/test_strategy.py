@@ -11,7 +11,7 @@ from pathlib import Path
 # src 디렉토리를 path에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from core.llm import LLMStrategy, LLMResponse, FakeLLM, Message
+from core.llm import LLMStrategy, LLMResponse, FakeLLM, Message, Usage
 from config.models import OpenAILLMConfig, GeminiLLMConfig, OllamaLLMConfig
 
 
@@ -31,6 +31,58 @@ class TestLLMResponse:
         assert response.usage["input_tokens"] == 10
         assert response.usage["output_tokens"] == 5
 
+    def test_dict_usage_converted(self):
+        """dict로 전달한 usage가 Usage로 변환되는지 테스트"""
+        response = LLMResponse(
+            content="Hello",
+            model="gpt-4o-mini",
+            usage={"input_tokens": 10, "output_tokens": 5},
+        )
+
+        assert isinstance(response.usage, Usage)
+        assert response.usage.input_tokens == 10
+        assert response.usage.cached_input_tokens == 0
+
+
+class TestUsage:
+    """Usage 데이터 구조 테스트"""
+
+    def test_mapping_compatibility(self):
+        """기존 dict 방식 접근 호환성 테스트"""
+        usage = Usage(input_tokens=10, output_tokens=5, cached_input_tokens=2)
+
+        assert usage["input_tokens"] == 10
+        assert "output_tokens" in usage
+        assert dict(usage) == {
+            "input_tokens": 10,
+            "output_tokens": 5,
+            "cached_input_tokens": 2,
+        }
+        assert usage == dict(usage)
+
+    def test_unknown_key_raises(self):
+        """없는 키 접근 시 KeyError"""
+        with pytest.raises(KeyError):
+            Usage()["total_tokens"]
+
+    def test_immutable(self):
+        """Usage는 수정할 수 없음"""
+        usage = Usage(input_tokens=1)
+
+        with pytest.raises(Exception):
+            usage.input_tokens = 2
+
+
+class TestMessage:
+    """Message 타입 테스트"""
+
+    def test_message_is_plain_dict(self):
+        """Message는 런타임에 일반 dict로 생성되는지 테스트"""
+        message = Message(role="user", content="Hello")
+
+        assert message == {"role": "user", "content": "Hello"}
+        assert type(message) is dict
+
 
 class TestFakeLLM:
     """FakeLLM 테스트"""